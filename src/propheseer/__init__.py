@@ -22,87 +22,179 @@ Example::
 
 from __future__ import annotations
 
-# Client classes
-from propheseer._client import Propheseer, AsyncPropheseer
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
 # Constants
 from propheseer._constants import VERSION
 
-# Pagination
-from propheseer._pagination import SyncPage, AsyncPage, PaginationMeta
-
-# Response
-from propheseer._response import APIResponse, RateLimitInfo
-
-# Errors
-from propheseer._exceptions import (
-    PropheseerError,
-    AuthenticationError,
-    InsufficientCreditsError,
-    PermissionDeniedError,
-    NotFoundError,
-    RateLimitError,
-    InternalServerError,
-    APIConnectionError,
-)
-
-# WebSocket
-from propheseer._websocket import PropheseerWebSocket, AsyncPropheseerWebSocket
-
-# Types - Markets
-from propheseer.types.markets import (
-    Market,
-    Outcome,
-    MarketSource,
-    MarketStatus,
-    MarketCategory,
-    MarketListParams,
-)
-
-# Types - Categories
-from propheseer.types.categories import Category
-
-# Types - Arbitrage
-from propheseer.types.arbitrage import (
-    ArbitrageOpportunity,
-    ArbitrageMarket,
-    ArbitrageFindParams,
-)
-
-# Types - Unusual Trades
-from propheseer.types.unusual_trades import (
-    UnusualTrade,
-    UnusualTradeMarket,
-    TradeDetails,
-    DetectionInfo,
-    DetectionContext,
-    DetectionReason,
-    TradeSide,
-    UnusualTradeListParams,
-)
-
-# Types - History
-from propheseer.types.history import (
-    MarketHistoryEntry,
-    HistoryListParams,
-    SnapshotDate,
-)
-
-# Types - Keys
-from propheseer.types.keys import (
-    KeyInfo,
-    KeyUsage,
-    UsageHistoryEntry,
-    PlanLimits,
-)
-
-# Types - Ticker
-from propheseer.types.ticker import TickerItem, TickerListParams
+if TYPE_CHECKING:
+    # Client classes
+    from propheseer._client import Propheseer, AsyncPropheseer
+
+    # Transports
+    from propheseer._base_client import (
+        make_shared_transport,
+        make_shared_async_transport,
+    )
+
+    # Pagination
+    from propheseer._pagination import SyncPage, AsyncPage, PaginationMeta
+
+    # Response
+    from propheseer._response import APIResponse, RateLimitInfo
+
+    # Errors
+    from propheseer._exceptions import (
+        PropheseerError,
+        AuthenticationError,
+        InsufficientCreditsError,
+        PermissionDeniedError,
+        NotFoundError,
+        RateLimitError,
+        InternalServerError,
+        APIConnectionError,
+    )
+
+    # WebSocket
+    from propheseer._websocket import PropheseerWebSocket, AsyncPropheseerWebSocket
+
+    # Types - Markets
+    from propheseer.types.markets import (
+        Market,
+        Outcome,
+        MarketSource,
+        MarketStatus,
+        MarketCategory,
+        MarketListParams,
+    )
+
+    # Types - Categories
+    from propheseer.types.categories import Category
+
+    # Types - Arbitrage
+    from propheseer.types.arbitrage import (
+        ArbitrageOpportunity,
+        ArbitrageMarket,
+        ArbitrageFindParams,
+    )
+
+    # Types - Unusual Trades
+    from propheseer.types.unusual_trades import (
+        UnusualTrade,
+        UnusualTradeMarket,
+        TradeDetails,
+        DetectionInfo,
+        DetectionContext,
+        DetectionReason,
+        TradeSide,
+        UnusualTradeListParams,
+    )
+
+    # Types - History
+    from propheseer.types.history import (
+        MarketHistoryEntry,
+        HistoryListParams,
+        SnapshotDate,
+    )
+
+    # Types - Keys
+    from propheseer.types.keys import (
+        KeyInfo,
+        KeyUsage,
+        UsageHistoryEntry,
+        PlanLimits,
+    )
+
+    # Types - Ticker
+    from propheseer.types.ticker import TickerItem, TickerListParams
+
+
+# Public name -> defining module. Submodules (and their dependencies, such as
+# httpx and websockets) are only imported when one of their names is first used.
+_LAZY: Dict[str, str] = {
+    # Client classes
+    "Propheseer": "propheseer._client",
+    "AsyncPropheseer": "propheseer._client",
+    # Transports
+    "make_shared_transport": "propheseer._base_client",
+    "make_shared_async_transport": "propheseer._base_client",
+    # Pagination
+    "SyncPage": "propheseer._pagination",
+    "AsyncPage": "propheseer._pagination",
+    "PaginationMeta": "propheseer._pagination",
+    # Response
+    "APIResponse": "propheseer._response",
+    "RateLimitInfo": "propheseer._response",
+    # Errors
+    "PropheseerError": "propheseer._exceptions",
+    "AuthenticationError": "propheseer._exceptions",
+    "InsufficientCreditsError": "propheseer._exceptions",
+    "PermissionDeniedError": "propheseer._exceptions",
+    "NotFoundError": "propheseer._exceptions",
+    "RateLimitError": "propheseer._exceptions",
+    "InternalServerError": "propheseer._exceptions",
+    "APIConnectionError": "propheseer._exceptions",
+    # WebSocket
+    "PropheseerWebSocket": "propheseer._websocket",
+    "AsyncPropheseerWebSocket": "propheseer._websocket",
+    # Types - Markets
+    "Market": "propheseer.types.markets",
+    "Outcome": "propheseer.types.markets",
+    "MarketSource": "propheseer.types.markets",
+    "MarketStatus": "propheseer.types.markets",
+    "MarketCategory": "propheseer.types.markets",
+    "MarketListParams": "propheseer.types.markets",
+    # Types - Categories
+    "Category": "propheseer.types.categories",
+    # Types - Arbitrage
+    "ArbitrageOpportunity": "propheseer.types.arbitrage",
+    "ArbitrageMarket": "propheseer.types.arbitrage",
+    "ArbitrageFindParams": "propheseer.types.arbitrage",
+    # Types - Unusual Trades
+    "UnusualTrade": "propheseer.types.unusual_trades",
+    "UnusualTradeMarket": "propheseer.types.unusual_trades",
+    "TradeDetails": "propheseer.types.unusual_trades",
+    "DetectionInfo": "propheseer.types.unusual_trades",
+    "DetectionContext": "propheseer.types.unusual_trades",
+    "DetectionReason": "propheseer.types.unusual_trades",
+    "TradeSide": "propheseer.types.unusual_trades",
+    "UnusualTradeListParams": "propheseer.types.unusual_trades",
+    # Types - History
+    "MarketHistoryEntry": "propheseer.types.history",
+    "HistoryListParams": "propheseer.types.history",
+    "SnapshotDate": "propheseer.types.history",
+    # Types - Keys
+    "KeyInfo": "propheseer.types.keys",
+    "KeyUsage": "propheseer.types.keys",
+    "UsageHistoryEntry": "propheseer.types.keys",
+    "PlanLimits": "propheseer.types.keys",
+    # Types - Ticker
+    "TickerItem": "propheseer.types.ticker",
+    "TickerListParams": "propheseer.types.ticker",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Clients
     "Propheseer",
     "AsyncPropheseer",
+    # Transports
+    "make_shared_transport",
+    "make_shared_async_transport",
     # Constants
     "VERSION",
     # Pagination
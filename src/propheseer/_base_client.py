@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib.util
 import os
 import random
 import re
-import time
-from typing import Any, Dict, Optional, Tuple, Type, Union
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from urllib.parse import urlencode
 
 import httpx
 
+from propheseer import _json
+from propheseer._cache import _CACHE_TTLS, TTLCache
 from propheseer._constants import (
     DEFAULT_BASE_URL,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE,
     DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BASE_DELAY,
+    DEFAULT_RETRY_MAX_DELAY,
+    DEFAULT_THREAD_CONCURRENCY,
     DEFAULT_TIMEOUT,
-    VERSION,
+    USER_AGENT,
 )
 from propheseer._exceptions import (
     APIConnectionError,
@@ -27,42 +41,179 @@ from propheseer._exceptions import (
     RateLimitError,
 )
 from propheseer._response import RateLimitInfo, parse_rate_limit_headers
+from propheseer._throttle import TokenBucket
 
 
 # ---------- camelCase -> snake_case conversion ----------
 
-_CAMEL_RE_1 = re.compile(r"([A-Z]+)([A-Z][a-z])")
-_CAMEL_RE_2 = re.compile(r"([a-z0-9])([A-Z])")
-_DIGIT_BOUNDARY_RE = re.compile(r"([a-z])(\d)")
+# Zero-width word boundaries, matched in a single pass:
+#   - acronym followed by a word (``HTTPResponse`` -> ``HTTP_Response``)
+#   - lower/digit followed by upper (``sourceId`` -> ``source_Id``)
+#   - lower followed by digit (``volume24h`` -> ``volume_24h``)
+_CAMEL_RE = re.compile(
+    r"(?<=[A-Z])(?=[A-Z][a-z])|(?<=[a-z0-9])(?=[A-Z])|(?<=[a-z])(?=\d)"
+)
 
 
+@functools.lru_cache(maxsize=4096)
 def _camel_to_snake(name: str) -> str:
     """Convert a camelCase or PascalCase string to snake_case.
 
     Handles special cases like ``volume24h`` -> ``volume_24h``
-    and ``sourceId`` -> ``source_id``.
+    and ``sourceId`` -> ``source_id``. Results are cached and interned
+    since API responses reuse a small, fixed vocabulary of keys.
     """
-    s = _CAMEL_RE_1.sub(r"\1_\2", name)
-    s = _CAMEL_RE_2.sub(r"\1_\2", s)
-    s = _DIGIT_BOUNDARY_RE.sub(r"\1_\2", s)
-    return s.lower()
+    if name.islower() and name.replace("_", "").isalpha():
+        # Already snake_case with no digits: nothing for the regex to split.
+        return sys.intern(name)
+    return sys.intern(_CAMEL_RE.sub("_", name).lower())
 
 
 def _transform_keys(obj: Any) -> Any:
-    """Recursively transform all dictionary keys from camelCase to snake_case."""
+    """Transform all dictionary keys from camelCase to snake_case.
+
+    Walks nested dicts and lists with an explicit stack rather than
+    recursion, so large or deeply nested payloads don't pay per-node frame
+    overhead. The input is never mutated. When every key is already
+    snake_case the input is returned as-is; otherwise new containers are
+    returned.
+    """
     if isinstance(obj, dict):
-        return {_camel_to_snake(k): _transform_keys(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_transform_keys(item) for item in obj]
-    return obj
+        root: Any = {}
+    elif isinstance(obj, list):
+        root = []
+    else:
+        return obj
+
+    if not _needs_transform(obj):
+        return obj
+
+    stack: List[Tuple[Any, Any]] = [(obj, root)]
+    while stack:
+        src, dst = stack.pop()
+        if isinstance(src, dict):
+            for key, value in src.items():
+                dst[_camel_to_snake(key)] = _push_container(value, stack)
+        else:
+            for value in src:
+                dst.append(_push_container(value, stack))
+    return root
+
+
+def _needs_transform(obj: Any) -> bool:
+    """Whether any dict key in ``obj`` (at any depth) is not snake_case.
+
+    A read-only scan that stops at the first key needing conversion, so
+    already-normalized payloads skip the rebuild entirely.
+    """
+    stack: List[Any] = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if _camel_to_snake(key) != key:
+                    return True
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+        else:
+            for value in node:
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+    return False
+
+
+def _push_container(value: Any, stack: List[Tuple[Any, Any]]) -> Any:
+    """Return an empty copy of a dict/list and queue it for filling.
+
+    Scalars are returned unchanged.
+    """
+    if isinstance(value, dict):
+        child: Any = {}
+    elif isinstance(value, list):
+        child = []
+    else:
+        return value
+    stack.append((value, child))
+    return child
+
+
+_MISSING: Any = object()
+
+
+def _pick(data: Dict[str, Any], camel: str, snake: str, default: Any = None) -> Any:
+    """Read a field under its camelCase key, falling back to snake_case.
+
+    Lets ``from_dict`` read API payloads (camelCase) and already-normalized
+    dicts without building a key-transformed copy first.
+    """
+    value = data.get(camel, _MISSING)
+    if value is _MISSING:
+        return data.get(snake, default)
+    return value
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string drawn from a small, closed set of API values.
+
+    Used for enum-like fields (``source``, ``status``, ``side``...) so large
+    listings share one object per distinct value. Non-strings pass through.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+def _decode_body(content: bytes, transform_keys: bool) -> Any:
+    """Decode a successful response body, optionally snake_casing its keys."""
+    data = _json.loads(content)
+    if transform_keys:
+        data = _transform_keys(data)
+    return data
 
 
 # ---------- Error mapping ----------
 
 
-def _is_retryable(status_code: int) -> bool:
-    """Whether this HTTP status should trigger a retry."""
-    return status_code == 429 or status_code >= 500
+def _parse_error_body(response: httpx.Response) -> Dict[str, Any]:
+    """Decode a JSON error body, or return ``{}`` if there isn't one.
+
+    Non-JSON bodies (e.g. HTML error pages from a proxy or CDN) are skipped
+    without attempting a decode.
+    """
+    content = response.content
+    if not content or "json" not in response.headers.get("content-type", ""):
+        return {}
+    try:
+        body = _json.loads(content)
+    except ValueError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+_ErrorFactory = Callable[[str, Dict[str, Any], httpx.Headers], PropheseerError]
+
+# Status-specific error constructors, keyed by HTTP status code.
+_ERROR_FACTORIES: Dict[int, _ErrorFactory] = {
+    401: lambda message, body, headers: AuthenticationError(message, headers=headers),
+    402: lambda message, body, headers: InsufficientCreditsError(
+        message,
+        balance_cents=body.get("balanceCents"),
+        required_cents=body.get("requiredCents"),
+        headers=headers,
+    ),
+    403: lambda message, body, headers: PermissionDeniedError(
+        message,
+        code=body.get("code"),
+        required_plan=body.get("requiredPlan"),
+        headers=headers,
+    ),
+    404: lambda message, body, headers: NotFoundError(message, headers=headers),
+    429: lambda message, body, headers: RateLimitError(
+        message,
+        retry_after=body.get("retryAfter"),
+        headers=headers,
+    ),
+}
 
 
 def _map_status_to_error(
@@ -72,48 +223,52 @@ def _map_status_to_error(
 ) -> PropheseerError:
     """Map an HTTP status code to the appropriate error class."""
     message = body.get("error") or body.get("message") or f"API error: {status_code}"
-    header_dict = dict(headers.items())
 
-    if status_code == 401:
-        return AuthenticationError(message, headers=header_dict)
-    if status_code == 402:
-        return InsufficientCreditsError(
-            message,
-            balance_cents=body.get("balanceCents"),
-            required_cents=body.get("requiredCents"),
-            headers=header_dict,
-        )
-    if status_code == 403:
-        return PermissionDeniedError(
-            message,
-            code=body.get("code"),
-            required_plan=body.get("requiredPlan"),
-            headers=header_dict,
-        )
-    if status_code == 404:
-        return NotFoundError(message, headers=header_dict)
-    if status_code == 429:
-        return RateLimitError(
-            message,
-            retry_after=body.get("retryAfter"),
-            headers=header_dict,
-        )
+    factory = _ERROR_FACTORIES.get(status_code)
+    if factory is not None:
+        return factory(message, body, headers)
     if status_code >= 500:
         return InternalServerError(
             message,
             status=status_code,
-            headers=header_dict,
+            headers=headers,
         )
     return PropheseerError(
         message,
         status=status_code,
         code=body.get("code"),
-        headers=header_dict,
+        headers=headers,
     )
 
 
+def _classify_response(
+    response: httpx.Response,
+) -> Tuple[Optional[PropheseerError], bool]:
+    """Classify a response by its status code, examined once.
+
+    Returns:
+        A tuple of (error, retryable). ``error`` is ``None`` for a 2xx
+        response; otherwise it is the mapped error, and ``retryable`` tells
+        whether the status (429 or 5xx) warrants another attempt.
+    """
+    status_code = response.status_code
+    if 200 <= status_code < 300:
+        return None, False
+    error = _map_status_to_error(
+        status_code, _parse_error_body(response), response.headers
+    )
+    return error, status_code == 429 or status_code >= 500
+
+
 # ---------- Retry delay ----------
 
+# Base backoff per retry attempt: 0.25s, 0.5s, 1s, ... capped at 30s. The
+# last entry is reused for any later attempt.
+_RETRY_DELAYS: Tuple[float, ...] = tuple(
+    min(DEFAULT_RETRY_MAX_DELAY, DEFAULT_RETRY_BASE_DELAY * (1 << i))
+    for i in range(16)
+)
+
 
 def _get_retry_delay(attempt: int, last_error: Optional[Exception] = None) -> float:
     """Calculate the retry delay with exponential backoff and jitter.
@@ -128,10 +283,111 @@ def _get_retry_delay(attempt: int, last_error: Optional[Exception] = None) -> fl
     if isinstance(last_error, RateLimitError) and last_error.retry_after:
         return float(last_error.retry_after)
 
-    # Exponential backoff: 0.5s, 1s, 2s, ...
-    base_delay: float = 0.5 * (2 ** (attempt - 1))
-    jitter: float = random.random() * base_delay * 0.5
-    return base_delay + jitter
+    delay = _RETRY_DELAYS[min(attempt, len(_RETRY_DELAYS)) - 1]
+    # Jitter in [delay / 2, delay] to spread out concurrent retries
+    return delay * (0.5 + random.random() * 0.5)
+
+
+# ---------- Connection pool ----------
+
+
+def _build_limits(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+) -> httpx.Limits:
+    """Build the connection pool limits, falling back to the SDK defaults."""
+    return httpx.Limits(
+        max_connections=(
+            max_connections if max_connections is not None else DEFAULT_MAX_CONNECTIONS
+        ),
+        max_keepalive_connections=(
+            max_keepalive_connections
+            if max_keepalive_connections is not None
+            else DEFAULT_MAX_KEEPALIVE
+        ),
+        keepalive_expiry=(
+            keepalive_expiry
+            if keepalive_expiry is not None
+            else DEFAULT_KEEPALIVE_EXPIRY
+        ),
+    )
+
+
+def _resolve_http2(http2: Optional[bool] = None) -> bool:
+    """Whether to enable HTTP/2.
+
+    When not set explicitly, HTTP/2 is enabled if the ``h2`` package is
+    installed (``pip install propheseer[http2]``).
+    """
+    if http2 is not None:
+        return http2
+    return importlib.util.find_spec("h2") is not None
+
+
+# ---------- Shared transports ----------
+
+
+def make_shared_transport(
+    *,
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    http2: Optional[bool] = None,
+) -> httpx.HTTPTransport:
+    """Create a connection pool that several sync clients can share.
+
+    Pass the result as ``transport=`` to each :class:`~propheseer.Propheseer`
+    so they reuse the same keep-alive connections. Clients never close a
+    transport they were given; call ``transport.close()`` when done.
+    """
+    return httpx.HTTPTransport(
+        limits=_build_limits(
+            max_connections, max_keepalive_connections, keepalive_expiry
+        ),
+        http2=_resolve_http2(http2),
+    )
+
+
+def make_shared_async_transport(
+    *,
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    http2: Optional[bool] = None,
+) -> httpx.AsyncHTTPTransport:
+    """Create a connection pool that several async clients can share.
+
+    Pass the result as ``transport=`` to each
+    :class:`~propheseer.AsyncPropheseer`. Clients never close a transport
+    they were given; call ``await transport.aclose()`` when done.
+    """
+    return httpx.AsyncHTTPTransport(
+        limits=_build_limits(
+            max_connections, max_keepalive_connections, keepalive_expiry
+        ),
+        http2=_resolve_http2(http2),
+    )
+
+
+class _BorrowedTransport(httpx.BaseTransport):
+    """Delegates to a caller-owned transport without closing it."""
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+
+class _AsyncBorrowedTransport(httpx.AsyncBaseTransport):
+    """Delegates to a caller-owned async transport without closing it."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
 
 
 # ---------- Base clients ----------
@@ -140,7 +396,7 @@ def _get_retry_delay(attempt: int, last_error: Optional[Exception] = None) -> fl
 class _RequestConfig:
     """Internal request configuration."""
 
-    __slots__ = ("method", "path", "query", "body", "auth")
+    __slots__ = ("method", "path", "query", "body", "auth", "transform_keys")
 
     def __init__(
         self,
@@ -149,12 +405,14 @@ class _RequestConfig:
         query: Optional[Dict[str, Any]] = None,
         body: Optional[Any] = None,
         auth: bool = True,
+        transform_keys: bool = True,
     ) -> None:
         self.method = method
         self.path = path
         self.query = query
         self.body = body
         self.auth = auth
+        self.transform_keys = transform_keys
 
 
 class BaseSyncClient:
@@ -167,6 +425,20 @@ class BaseSyncClient:
         base_url: Base URL for the API.
         timeout: Request timeout in seconds.
         max_retries: Maximum number of retries on retryable errors.
+        max_connections: Maximum number of concurrent connections in the pool.
+        max_keepalive_connections: Maximum number of idle keep-alive connections.
+        keepalive_expiry: Seconds an idle keep-alive connection is kept open.
+        http2: Whether to use HTTP/2. Defaults to enabled when the ``h2``
+            package is installed.
+        transport: A caller-owned transport to send requests through, e.g.
+            one from :func:`make_shared_transport`. It is not closed by
+            :meth:`close`. The pool options above are ignored when set.
+        cache: Cache successful responses from slowly changing endpoints
+            (categories, history dates, key info, ticker) for a short,
+            per-endpoint TTL.
+        throttle: Pace requests to the plan's per-minute limit, as reported
+            by the rate limit headers, instead of running into ``429``
+            responses.
     """
 
     api_key: Optional[str]
@@ -181,17 +453,55 @@ class BaseSyncClient:
         base_url: Optional[str] = None,
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache: bool = False,
+        throttle: bool = False,
     ) -> None:
         self.api_key = api_key or os.environ.get("PROPHESEER_API_KEY")
         self.base_url = (base_url or DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
         self.max_retries = max_retries if max_retries is not None else DEFAULT_MAX_RETRIES
-        self._client = httpx.Client(timeout=self.timeout)
+        self._limits = _build_limits(
+            max_connections, max_keepalive_connections, keepalive_expiry
+        )
+        self._base_headers: Dict[str, str] = {"Content-Type": "application/json"}
+        self._auth_headers = (
+            {**self._base_headers, "Authorization": f"Bearer {self.api_key}"}
+            if self.api_key
+            else self._base_headers
+        )
+        self._cache: Optional[
+            TTLCache[Tuple[bytes, Optional[RateLimitInfo], httpx.Response]]
+        ] = TTLCache() if cache else None
+        self._throttle = TokenBucket() if throttle else None
+        # Set by close() so a pending retry backoff wakes up immediately.
+        self._stop = threading.Event()
+        self._client = httpx.Client(
+            timeout=self.timeout,
+            headers={"User-Agent": USER_AGENT},
+            limits=self._limits,
+            http2=_resolve_http2(http2),
+            transport=_BorrowedTransport(transport) if transport is not None else None,
+        )
 
     def close(self) -> None:
-        """Close the underlying HTTP client."""
+        """Close the underlying HTTP client.
+
+        Any request waiting to retry in another thread gives up with an
+        :class:`APIConnectionError` instead of sleeping out its backoff.
+        """
+        self._stop.set()
         self._client.close()
 
+    def clear_cache(self) -> None:
+        """Drop all cached responses. A no-op when caching is disabled."""
+        if self._cache is not None:
+            self._cache.clear()
+
     def __enter__(self) -> "BaseSyncClient":
         return self
 
@@ -206,9 +516,15 @@ class BaseSyncClient:
         query: Optional[Dict[str, Any]] = None,
         body: Optional[Any] = None,
         auth: bool = True,
+        transform_keys: bool = True,
     ) -> Tuple[Any, Optional[RateLimitInfo], httpx.Response]:
         """Make an authenticated API request with retry and error handling.
 
+        Args:
+            transform_keys: Convert the decoded payload's keys to snake_case.
+                Endpoints whose models normalize keys themselves, or whose
+                payload is already snake_case, pass ``False`` to skip the walk.
+
         Returns:
             A tuple of (parsed JSON data, rate limit info, raw response).
         """
@@ -219,45 +535,51 @@ class BaseSyncClient:
             )
 
         url = self._build_url(path, query)
-        headers: Dict[str, str] = {
-            "Content-Type": "application/json",
-            "User-Agent": f"propheseer-python/{VERSION}",
-        }
-        if auth and self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+        cache = self._cache if method == "GET" and path in _CACHE_TTLS else None
+        if cache is not None:
+            cached = cache.get(url)
+            if cached is not None:
+                # Decode again on every hit so callers never share (and can't
+                # mutate) the lists and dicts held by another result.
+                raw, rate_limit, response = cached
+                return _decode_body(raw, transform_keys), rate_limit, response
+        if self._throttle is not None:
+            wait = self._throttle.reserve()
+            if wait and self._stop.wait(wait):
+                raise APIConnectionError("Client was closed")
+        headers = self._auth_headers if auth else self._base_headers
+        # Content-Type is already in the base headers, so a body only needs
+        # encoding once here rather than by httpx on every attempt.
+        content = _json.dumps(body) if body is not None else None
 
         last_error: Optional[Exception] = None
 
         for attempt in range(self.max_retries + 1):
             if attempt > 0:
                 delay = _get_retry_delay(attempt, last_error)
-                time.sleep(delay)
+                if self._stop.wait(delay):
+                    raise APIConnectionError("Client was closed", cause=last_error)
 
             try:
                 response = self._client.request(
-                    method,
-                    url,
-                    headers=headers,
-                    json=body if body is not None else None,
+                    method, url, headers=headers, content=content
                 )
 
-                if response.is_success:
-                    data = response.json()
+                error, retryable = _classify_response(response)
+                if error is None:
+                    data = _decode_body(response.content, transform_keys)
                     rate_limit = parse_rate_limit_headers(response.headers)
+                    if self._throttle is not None:
+                        self._throttle.update(rate_limit)
+                    if cache is not None:
+                        cache.set(
+                            url,
+                            (response.content, rate_limit, response),
+                            _CACHE_TTLS[path],
+                        )
                     return data, rate_limit, response
 
-                # Parse error body
-                error_body: Dict[str, Any] = {}
-                try:
-                    error_body = response.json()
-                except Exception:
-                    pass
-
-                error = _map_status_to_error(
-                    response.status_code, error_body, response.headers
-                )
-
-                if _is_retryable(response.status_code) and attempt < self.max_retries:
+                if retryable and attempt < self.max_retries:
                     last_error = error
                     continue
 
@@ -286,6 +608,45 @@ class BaseSyncClient:
 
         raise last_error or PropheseerError("Request failed after retries")
 
+    def _request_many(
+        self,
+        configs: List[_RequestConfig],
+        *,
+        concurrency: Optional[int] = None,
+    ) -> List[Union[Tuple[Any, Optional[RateLimitInfo], httpx.Response], BaseException]]:
+        """Run several independent requests concurrently on worker threads.
+
+        At most ``concurrency`` requests are in flight at once, defaulting
+        to :data:`DEFAULT_THREAD_CONCURRENCY`.
+
+        Returns:
+            One entry per config, in order: the ``_request`` result tuple,
+            or the exception it raised.
+        """
+        if not configs:
+            return []
+
+        def run(
+            config: _RequestConfig,
+        ) -> Union[Tuple[Any, Optional[RateLimitInfo], httpx.Response], BaseException]:
+            try:
+                return self._request(
+                    config.method,
+                    config.path,
+                    query=config.query,
+                    body=config.body,
+                    auth=config.auth,
+                    transform_keys=config.transform_keys,
+                )
+            except Exception as exc:
+                return exc
+
+        workers = min(len(configs), concurrency or DEFAULT_THREAD_CONCURRENCY)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="propheseer-request"
+        ) as executor:
+            return list(executor.map(run, configs))
+
     def _build_url(
         self,
         path: str,
@@ -294,14 +655,9 @@ class BaseSyncClient:
         """Build a full URL from a path and optional query parameters."""
         url = f"{self.base_url}{path}"
         if query:
-            params = {
-                k: str(v)
-                for k, v in query.items()
-                if v is not None
-            }
-            if params:
-                qs = "&".join(f"{k}={v}" for k, v in params.items())
-                url = f"{url}?{qs}"
+            items = [(k, v) for k, v in query.items() if v is not None]
+            if items:
+                url = f"{url}?{urlencode(items, doseq=True)}"
         return url
 
 
@@ -315,6 +671,20 @@ class BaseAsyncClient:
         base_url: Base URL for the API.
         timeout: Request timeout in seconds.
         max_retries: Maximum number of retries on retryable errors.
+        max_connections: Maximum number of concurrent connections in the pool.
+        max_keepalive_connections: Maximum number of idle keep-alive connections.
+        keepalive_expiry: Seconds an idle keep-alive connection is kept open.
+        http2: Whether to use HTTP/2. Defaults to enabled when the ``h2``
+            package is installed.
+        transport: A caller-owned transport to send requests through, e.g.
+            one from :func:`make_shared_async_transport`. It is not closed by
+            :meth:`close`. The pool options above are ignored when set.
+        cache: Cache successful responses from slowly changing endpoints
+            (categories, history dates, key info, ticker) for a short,
+            per-endpoint TTL.
+        throttle: Pace requests to the plan's per-minute limit, as reported
+            by the rate limit headers, instead of running into ``429``
+            responses.
     """
 
     api_key: Optional[str]
@@ -329,17 +699,50 @@ class BaseAsyncClient:
         base_url: Optional[str] = None,
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: bool = False,
+        throttle: bool = False,
     ) -> None:
         self.api_key = api_key or os.environ.get("PROPHESEER_API_KEY")
         self.base_url = (base_url or DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
         self.max_retries = max_retries if max_retries is not None else DEFAULT_MAX_RETRIES
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._limits = _build_limits(
+            max_connections, max_keepalive_connections, keepalive_expiry
+        )
+        self._base_headers: Dict[str, str] = {"Content-Type": "application/json"}
+        self._auth_headers = (
+            {**self._base_headers, "Authorization": f"Bearer {self.api_key}"}
+            if self.api_key
+            else self._base_headers
+        )
+        self._cache: Optional[
+            TTLCache[Tuple[bytes, Optional[RateLimitInfo], httpx.Response]]
+        ] = TTLCache() if cache else None
+        self._throttle = TokenBucket() if throttle else None
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            headers={"User-Agent": USER_AGENT},
+            limits=self._limits,
+            http2=_resolve_http2(http2),
+            transport=(
+                _AsyncBorrowedTransport(transport) if transport is not None else None
+            ),
+        )
 
     async def close(self) -> None:
         """Close the underlying HTTP client."""
         await self._client.aclose()
 
+    def clear_cache(self) -> None:
+        """Drop all cached responses. A no-op when caching is disabled."""
+        if self._cache is not None:
+            self._cache.clear()
+
     async def __aenter__(self) -> "BaseAsyncClient":
         return self
 
@@ -354,14 +757,18 @@ class BaseAsyncClient:
         query: Optional[Dict[str, Any]] = None,
         body: Optional[Any] = None,
         auth: bool = True,
+        transform_keys: bool = True,
     ) -> Tuple[Any, Optional[RateLimitInfo], httpx.Response]:
         """Make an authenticated async API request with retry and error handling.
 
+        Args:
+            transform_keys: Convert the decoded payload's keys to snake_case.
+                Endpoints whose models normalize keys themselves, or whose
+                payload is already snake_case, pass ``False`` to skip the walk.
+
         Returns:
             A tuple of (parsed JSON data, rate limit info, raw response).
         """
-        import asyncio
-
         if auth and not self.api_key:
             raise AuthenticationError(
                 "API key is required. Pass it to the constructor "
@@ -369,12 +776,22 @@ class BaseAsyncClient:
             )
 
         url = self._build_url(path, query)
-        headers: Dict[str, str] = {
-            "Content-Type": "application/json",
-            "User-Agent": f"propheseer-python/{VERSION}",
-        }
-        if auth and self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+        cache = self._cache if method == "GET" and path in _CACHE_TTLS else None
+        if cache is not None:
+            cached = cache.get(url)
+            if cached is not None:
+                # Decode again on every hit so callers never share (and can't
+                # mutate) the lists and dicts held by another result.
+                raw, rate_limit, response = cached
+                return _decode_body(raw, transform_keys), rate_limit, response
+        if self._throttle is not None:
+            wait = self._throttle.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+        headers = self._auth_headers if auth else self._base_headers
+        # Content-Type is already in the base headers, so a body only needs
+        # encoding once here rather than by httpx on every attempt.
+        content = _json.dumps(body) if body is not None else None
 
         last_error: Optional[Exception] = None
 
@@ -385,29 +802,24 @@ class BaseAsyncClient:
 
             try:
                 response = await self._client.request(
-                    method,
-                    url,
-                    headers=headers,
-                    json=body if body is not None else None,
+                    method, url, headers=headers, content=content
                 )
 
-                if response.is_success:
-                    data = response.json()
+                error, retryable = _classify_response(response)
+                if error is None:
+                    data = _decode_body(response.content, transform_keys)
                     rate_limit = parse_rate_limit_headers(response.headers)
+                    if self._throttle is not None:
+                        self._throttle.update(rate_limit)
+                    if cache is not None:
+                        cache.set(
+                            url,
+                            (response.content, rate_limit, response),
+                            _CACHE_TTLS[path],
+                        )
                     return data, rate_limit, response
 
-                # Parse error body
-                error_body: Dict[str, Any] = {}
-                try:
-                    error_body = response.json()
-                except Exception:
-                    pass
-
-                error = _map_status_to_error(
-                    response.status_code, error_body, response.headers
-                )
-
-                if _is_retryable(response.status_code) and attempt < self.max_retries:
+                if retryable and attempt < self.max_retries:
                     last_error = error
                     continue
 
@@ -436,6 +848,41 @@ class BaseAsyncClient:
 
         raise last_error or PropheseerError("Request failed after retries")
 
+    async def _request_many(
+        self,
+        configs: List[_RequestConfig],
+        *,
+        concurrency: Optional[int] = None,
+    ) -> List[Union[Tuple[Any, Optional[RateLimitInfo], httpx.Response], BaseException]]:
+        """Run several independent requests concurrently.
+
+        At most ``concurrency`` requests are in flight at once, defaulting
+        to the keep-alive pool size so fan-out reuses pooled connections.
+
+        Returns:
+            One entry per config, in order: the ``_request`` result tuple,
+            or the exception it raised.
+        """
+        limit = concurrency or self._limits.max_keepalive_connections or 1
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(
+            config: _RequestConfig,
+        ) -> Tuple[Any, Optional[RateLimitInfo], httpx.Response]:
+            async with semaphore:
+                return await self._request(
+                    config.method,
+                    config.path,
+                    query=config.query,
+                    body=config.body,
+                    auth=config.auth,
+                    transform_keys=config.transform_keys,
+                )
+
+        return await asyncio.gather(
+            *(run(config) for config in configs), return_exceptions=True
+        )
+
     def _build_url(
         self,
         path: str,
@@ -444,12 +891,7 @@ class BaseAsyncClient:
         """Build a full URL from a path and optional query parameters."""
         url = f"{self.base_url}{path}"
         if query:
-            params = {
-                k: str(v)
-                for k, v in query.items()
-                if v is not None
-            }
-            if params:
-                qs = "&".join(f"{k}={v}" for k, v in params.items())
-                url = f"{url}?{qs}"
+            items = [(k, v) for k, v in query.items() if v is not None]
+            if items:
+                url = f"{url}?{urlencode(items, doseq=True)}"
         return url
@@ -0,0 +1,62 @@
+"""In-process TTL cache for slowly changing GET endpoints."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+# Path -> seconds a successful GET response stays fresh. Only these
+# endpoints are cached; everything else always goes to the network.
+_CACHE_TTLS: Dict[str, float] = {
+    "/v1/categories": 300.0,
+    "/v1/markets/history/dates": 600.0,
+    "/v1/keys/me": 30.0,
+    "/v1/public/ticker": 5.0,
+}
+
+
+class TTLCache(Generic[V]):
+    """A small thread-safe mapping whose entries expire after a per-entry TTL.
+
+    When full, the least recently stored entry is evicted.
+
+    Args:
+        maxsize: Maximum number of entries kept.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Any, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[V]:
+        """Return the live value for ``key``, or ``None`` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Any, value: V, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + ttl, value)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
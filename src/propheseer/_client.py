@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Optional
 
+import httpx
+
 from propheseer._base_client import BaseAsyncClient, BaseSyncClient
 from propheseer.resources.markets import SyncMarkets, AsyncMarkets
 from propheseer.resources.categories import SyncCategories, AsyncCategories
@@ -23,6 +25,20 @@ class Propheseer(BaseSyncClient):
         base_url: Base URL for the API (default: ``https://api.propheseer.com``).
         timeout: Request timeout in seconds (default: 30).
         max_retries: Maximum number of retries on retryable errors (default: 2).
+        max_connections: Maximum number of concurrent connections (default: 1000).
+        max_keepalive_connections: Maximum number of idle keep-alive
+            connections (default: 100).
+        keepalive_expiry: Seconds an idle keep-alive connection is kept
+            open for reuse (default: 30).
+        http2: Whether to use HTTP/2 (default: enabled when ``h2`` is installed).
+        transport: A caller-owned connection pool to share between clients,
+            e.g. from :func:`~propheseer.make_shared_transport`. Not closed
+            by :meth:`close`.
+        cache: Cache responses from slowly changing endpoints (categories,
+            history dates, key info, ticker) for a few seconds to minutes
+            (default: disabled). See :meth:`clear_cache`.
+        throttle: Wait when the per-minute request limit is used up instead
+            of getting ``429`` errors (default: disabled).
 
     Example::
 
@@ -73,12 +89,26 @@ class Propheseer(BaseSyncClient):
         base_url: Optional[str] = None,
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache: bool = False,
+        throttle: bool = False,
     ) -> None:
         super().__init__(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            transport=transport,
+            cache=cache,
+            throttle=throttle,
         )
         self.markets = SyncMarkets(self)
         self.categories = SyncCategories(self)
@@ -98,6 +128,20 @@ class AsyncPropheseer(BaseAsyncClient):
         base_url: Base URL for the API (default: ``https://api.propheseer.com``).
         timeout: Request timeout in seconds (default: 30).
         max_retries: Maximum number of retries on retryable errors (default: 2).
+        max_connections: Maximum number of concurrent connections (default: 1000).
+        max_keepalive_connections: Maximum number of idle keep-alive
+            connections (default: 100).
+        keepalive_expiry: Seconds an idle keep-alive connection is kept
+            open for reuse (default: 30).
+        http2: Whether to use HTTP/2 (default: enabled when ``h2`` is installed).
+        transport: A caller-owned connection pool to share between clients,
+            e.g. from :func:`~propheseer.make_shared_async_transport`. Not
+            closed by :meth:`close`.
+        cache: Cache responses from slowly changing endpoints (categories,
+            history dates, key info, ticker) for a few seconds to minutes
+            (default: disabled). See :meth:`clear_cache`.
+        throttle: Wait when the per-minute request limit is used up instead
+            of getting ``429`` errors (default: disabled).
 
     Example::
 
@@ -141,12 +185,26 @@ class AsyncPropheseer(BaseAsyncClient):
         base_url: Optional[str] = None,
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: bool = False,
+        throttle: bool = False,
     ) -> None:
         super().__init__(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            transport=transport,
+            cache=cache,
+            throttle=throttle,
         )
         self.markets = AsyncMarkets(self)
         self.categories = AsyncCategories(self)
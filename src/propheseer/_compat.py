@@ -0,0 +1,11 @@
+"""Compatibility helpers for the supported Python versions."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict
+
+# ``@dataclass(slots=True)`` is only available on Python 3.10+. Spread this
+# into ``@dataclass(...)`` so instances skip the per-instance ``__dict__``
+# where the interpreter supports it.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -1,10 +1,22 @@
 """SDK version and default configuration constants."""
 
 VERSION = "1.0.0"
+USER_AGENT = f"propheseer-python/{VERSION}"
 
 DEFAULT_BASE_URL = "https://api.propheseer.com"
 DEFAULT_TIMEOUT = 30.0  # seconds
 DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_BASE_DELAY = 0.25  # seconds
+DEFAULT_RETRY_MAX_DELAY = 30.0  # seconds
+
+# Connection pool defaults
+DEFAULT_MAX_CONNECTIONS = 1000
+DEFAULT_MAX_KEEPALIVE = 100
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # seconds
+
+# Concurrency for auto-pagination and sync fan-out
+DEFAULT_PAGES_IN_FLIGHT = 4
+DEFAULT_THREAD_CONCURRENCY = 8
 
 # WebSocket defaults
 DEFAULT_WS_BASE_URL = "wss://api.propheseer.com"
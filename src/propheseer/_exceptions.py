@@ -5,7 +5,17 @@ All API errors are raised as subclasses of :class:`PropheseerError`.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Machine-readable codes attached by the status-specific errors. String
+# literals are already interned by CPython, so these are plain constants
+# shared by every instance rather than ``sys.intern`` calls.
+_CODE_UNAUTHORIZED = "UNAUTHORIZED"
+_CODE_INSUFFICIENT_CREDITS = "INSUFFICIENT_CREDITS"
+_CODE_FORBIDDEN = "FORBIDDEN"
+_CODE_NOT_FOUND = "NOT_FOUND"
+_CODE_RATE_LIMITED = "RATE_LIMITED"
+_CODE_INTERNAL_ERROR = "INTERNAL_ERROR"
 
 
 class PropheseerError(Exception):
@@ -15,13 +25,16 @@ class PropheseerError(Exception):
         message: Human-readable error description.
         status: HTTP status code (if applicable).
         code: Machine-readable error code from the API.
-        headers: Response headers (if available).
+        headers: Response headers (if available). For API errors this is the
+            response's case-insensitive ``httpx.Headers`` mapping.
     """
 
+    __slots__ = ("message", "status", "code", "headers")
+
     message: str
     status: Optional[int]
     code: Optional[str]
-    headers: Optional[Dict[str, str]]
+    headers: Optional[Mapping[str, str]]
 
     def __init__(
         self,
@@ -29,7 +42,7 @@ class PropheseerError(Exception):
         *,
         status: Optional[int] = None,
         code: Optional[str] = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
     ) -> None:
         super().__init__(message)
         self.message = message
@@ -45,19 +58,36 @@ class PropheseerError(Exception):
             attrs.append(f"code={self.code!r}")
         return f"{self.__class__.__name__}({', '.join(attrs)})"
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # BaseException only pickles args and __dict__; carry slot values too,
+        # alongside anything in __dict__ such as ``__notes__``.
+        state = dict(self.__dict__)
+        state.update(
+            (name, getattr(self, name))
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+        )
+        return (self.__class__, self.args, state)
+
+    def __setstate__(self, state: Optional[Dict[str, Any]]) -> None:
+        for name, value in (state or {}).items():
+            setattr(self, name, value)
+
 
 class AuthenticationError(PropheseerError):
     """Thrown when the API key is missing or invalid (HTTP 401)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
     ) -> None:
         super().__init__(
             message,
             status=401,
-            code="UNAUTHORIZED",
+            code=_CODE_UNAUTHORIZED,
             headers=headers,
         )
 
@@ -70,6 +100,8 @@ class InsufficientCreditsError(PropheseerError):
         required_cents: Required amount in cents.
     """
 
+    __slots__ = ("balance_cents", "required_cents")
+
     balance_cents: Optional[int]
     required_cents: Optional[int]
 
@@ -79,12 +111,12 @@ class InsufficientCreditsError(PropheseerError):
         *,
         balance_cents: Optional[int] = None,
         required_cents: Optional[int] = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
     ) -> None:
         super().__init__(
             message,
             status=402,
-            code="INSUFFICIENT_CREDITS",
+            code=_CODE_INSUFFICIENT_CREDITS,
             headers=headers,
         )
         self.balance_cents = balance_cents
@@ -98,6 +130,8 @@ class PermissionDeniedError(PropheseerError):
         required_plan: Plan required to access the resource.
     """
 
+    __slots__ = ("required_plan",)
+
     required_plan: Optional[str]
 
     def __init__(
@@ -106,12 +140,12 @@ class PermissionDeniedError(PropheseerError):
         *,
         code: Optional[str] = None,
         required_plan: Optional[str] = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
     ) -> None:
         super().__init__(
             message,
             status=403,
-            code=code or "FORBIDDEN",
+            code=code or _CODE_FORBIDDEN,
             headers=headers,
         )
         self.required_plan = required_plan
@@ -120,15 +154,17 @@ class PermissionDeniedError(PropheseerError):
 class NotFoundError(PropheseerError):
     """Thrown when the requested resource is not found (HTTP 404)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
     ) -> None:
         super().__init__(
             message,
             status=404,
-            code="NOT_FOUND",
+            code=_CODE_NOT_FOUND,
             headers=headers,
         )
 
@@ -140,6 +176,8 @@ class RateLimitError(PropheseerError):
         retry_after: Seconds to wait before retrying.
     """
 
+    __slots__ = ("retry_after",)
+
     retry_after: Optional[int]
 
     def __init__(
@@ -147,12 +185,12 @@ class RateLimitError(PropheseerError):
         message: str,
         *,
         retry_after: Optional[int] = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
     ) -> None:
         super().__init__(
             message,
             status=429,
-            code="RATE_LIMITED",
+            code=_CODE_RATE_LIMITED,
             headers=headers,
         )
         self.retry_after = retry_after
@@ -161,17 +199,19 @@ class RateLimitError(PropheseerError):
 class InternalServerError(PropheseerError):
     """Thrown when the API returns a server error (HTTP 5xx)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
         *,
         status: Optional[int] = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
     ) -> None:
         super().__init__(
             message,
             status=status or 500,
-            code="INTERNAL_ERROR",
+            code=_CODE_INTERNAL_ERROR,
             headers=headers,
         )
 
@@ -183,6 +223,8 @@ class APIConnectionError(PropheseerError):
         cause: The underlying exception that caused the connection error.
     """
 
+    __slots__ = ("cause",)
+
     cause: Optional[Exception]
 
     def __init__(
@@ -0,0 +1,29 @@
+"""JSON encoding and decoding helpers.
+
+Uses ``orjson`` when it is installed (``pip install propheseer[orjson]``)
+and falls back to the standard library otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object as a compact UTF-8 JSON document."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import (
     Any,
+    AsyncGenerator,
     AsyncIterator,
     Awaitable,
     Callable,
+    Deque,
     Dict,
+    Generator,
     Generic,
     Iterator,
     List,
@@ -16,12 +23,14 @@ from typing import (
     TypeVar,
 )
 
+from propheseer._compat import DATACLASS_SLOTS
+from propheseer._constants import DEFAULT_PAGES_IN_FLIGHT
 from propheseer._response import RateLimitInfo
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PaginationMeta:
     """Pagination metadata returned by paginated endpoints.
 
@@ -39,23 +48,29 @@ class PaginationMeta:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PaginationMeta":
-        """Create a PaginationMeta from a dictionary."""
+        """Create a PaginationMeta from a dictionary.
+
+        Missing or ``null`` counts are treated as ``0``.
+        """
+        get = data.get
         return cls(
-            total=data.get("total", 0),
-            limit=data.get("limit", 0),
-            offset=data.get("offset", 0),
-            sources=data.get("sources"),
+            get("total") or 0,
+            get("limit") or 0,
+            get("offset") or 0,
+            get("sources"),
         )
 
 
-class SyncPage(Generic[T]):
-    """A page of results from a paginated API endpoint.
+def _compute_next_offset(meta: PaginationMeta) -> Optional[int]:
+    """The offset of the page after ``meta``, or ``None`` on the last page."""
+    next_offset = meta.offset + meta.limit
+    return next_offset if next_offset < meta.total else None
 
-    Attributes:
-        data: Items on this page.
-        meta: Pagination metadata.
-        rate_limit: Rate limit information.
-    """
+
+class _PageBase(Generic[T]):
+    """Shared implementation of :class:`SyncPage` and :class:`AsyncPage`."""
+
+    __slots__ = ("data", "meta", "rate_limit", "_next_offset")
 
     data: List[T]
     meta: PaginationMeta
@@ -70,16 +85,15 @@ class SyncPage(Generic[T]):
         self.data = data
         self.meta = meta
         self.rate_limit = rate_limit
+        self._next_offset = _compute_next_offset(meta)
 
     def has_more(self) -> bool:
         """Whether there are more pages available."""
-        return self.meta.offset + self.meta.limit < self.meta.total
+        return self._next_offset is not None
 
     def next_offset(self) -> Optional[int]:
         """The offset for the next page, or ``None`` if no more pages."""
-        if not self.has_more():
-            return None
-        return self.meta.offset + self.meta.limit
+        return self._next_offset
 
     def __iter__(self) -> Iterator[T]:
         """Iterate over items on this page."""
@@ -91,14 +105,14 @@ class SyncPage(Generic[T]):
 
     def __repr__(self) -> str:
         return (
-            f"SyncPage(data=[...{len(self.data)} items], "
+            f"{type(self).__name__}(data=[...{len(self.data)} items], "
             f"total={self.meta.total}, "
             f"offset={self.meta.offset})"
         )
 
 
-class AsyncPage(Generic[T]):
-    """An async page of results from a paginated API endpoint.
+class SyncPage(_PageBase[T]):
+    """A page of results from a paginated API endpoint.
 
     Attributes:
         data: Items on this page.
@@ -106,46 +120,212 @@ class AsyncPage(Generic[T]):
         rate_limit: Rate limit information.
     """
 
-    data: List[T]
-    meta: PaginationMeta
-    rate_limit: Optional[RateLimitInfo]
+    __slots__ = ()
 
-    def __init__(
-        self,
-        data: List[T],
-        meta: PaginationMeta,
-        rate_limit: Optional[RateLimitInfo],
-    ) -> None:
-        self.data = data
-        self.meta = meta
-        self.rate_limit = rate_limit
 
-    def has_more(self) -> bool:
-        """Whether there are more pages available."""
-        return self.meta.offset + self.meta.limit < self.meta.total
+class AsyncPage(_PageBase[T]):
+    """An async page of results from a paginated API endpoint.
 
-    def next_offset(self) -> Optional[int]:
-        """The offset for the next page, or ``None`` if no more pages."""
-        if not self.has_more():
-            return None
-        return self.meta.offset + self.meta.limit
+    Supports both ``for`` and ``async for`` over the items on the page.
 
-    def __iter__(self) -> Iterator[T]:
-        """Iterate over items on this page (synchronously)."""
-        return iter(self.data)
+    Attributes:
+        data: Items on this page.
+        meta: Pagination metadata.
+        rate_limit: Rate limit information.
+    """
+
+    __slots__ = ()
 
     async def __aiter__(self) -> AsyncIterator[T]:
         """Iterate over items on this page asynchronously."""
         for item in self.data:
             yield item
 
-    def __len__(self) -> int:
-        """Number of items on this page."""
-        return len(self.data)
 
-    def __repr__(self) -> str:
-        return (
-            f"AsyncPage(data=[...{len(self.data)} items], "
-            f"total={self.meta.total}, "
-            f"offset={self.meta.offset})"
+def _remaining_offsets(
+    first: _PageBase[Any], max_items: Optional[int]
+) -> Iterator[int]:
+    """Offsets of the pages after ``first``, as implied by its metadata.
+
+    Stops at ``meta.total``, and at the page that will reach ``max_items``,
+    so nothing is fetched that won't be yielded.
+    """
+    meta = first.meta
+    if not first.data or meta.limit <= 0:
+        return iter(())
+    stop = meta.total
+    if max_items:
+        stop = min(stop, meta.offset + max_items)
+    return iter(range(meta.offset + meta.limit, stop, meta.limit))
+
+
+def _check_pages_in_flight(pages_in_flight: int) -> None:
+    if pages_in_flight < 1:
+        raise ValueError(
+            f"pages_in_flight must be at least 1, got {pages_in_flight}"
         )
+
+
+def _iter_pages(
+    fetch: Callable[[int], _PageBase[T]],
+    max_items: Optional[int] = None,
+    pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
+) -> Generator[_PageBase[T], None, None]:
+    """Yield pages in order, fetching later pages concurrently.
+
+    Once the first page reports the total, up to ``pages_in_flight - 1``
+    following pages are requested from a thread pool while the current one
+    is consumed. With ``pages_in_flight=1`` each page is fetched only once
+    the previous one has been consumed.
+
+    Args:
+        fetch: Returns the page at the given offset.
+        max_items: Maximum total items the caller will consume.
+        pages_in_flight: Pages held at once, counting the current one.
+    """
+    _check_pages_in_flight(pages_in_flight)
+    ahead = pages_in_flight - 1
+    executor: Optional[ThreadPoolExecutor] = None
+    pending: Deque[Future[_PageBase[T]]] = deque()
+    try:
+        page = fetch(0)
+        offsets = _remaining_offsets(page, max_items)
+        while True:
+            for offset in islice(offsets, ahead - len(pending)):
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=ahead,
+                        thread_name_prefix="propheseer-prefetch",
+                    )
+                pending.append(executor.submit(fetch, offset))
+
+            yield page
+
+            if not page.has_more() or not page.data:
+                return
+            if pending:
+                page = pending.popleft().result()
+            else:
+                following = next(offsets, None)
+                if following is None:
+                    return
+                page = fetch(following)
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def _iter_pages_async(
+    fetch: Callable[[int], Awaitable[_PageBase[T]]],
+    max_items: Optional[int] = None,
+    pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
+) -> AsyncGenerator[_PageBase[T], None]:
+    """Async counterpart of :func:`_iter_pages`, fetching in tasks."""
+    _check_pages_in_flight(pages_in_flight)
+    ahead = pages_in_flight - 1
+    pending: Deque[asyncio.Future[_PageBase[T]]] = deque()
+    try:
+        page = await fetch(0)
+        offsets = _remaining_offsets(page, max_items)
+        while True:
+            for offset in islice(offsets, ahead - len(pending)):
+                pending.append(asyncio.ensure_future(fetch(offset)))
+
+            yield page
+
+            if not page.has_more() or not page.data:
+                return
+            if pending:
+                page = await pending.popleft()
+            else:
+                following = next(offsets, None)
+                if following is None:
+                    return
+                page = await fetch(following)
+    finally:
+        for task in pending:
+            _discard(task)
+
+
+def _auto_paginate(
+    fetch: Callable[[int], _PageBase[T]],
+    max_items: Optional[int] = None,
+    pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
+) -> Generator[T, None, None]:
+    """Yield items across pages, in order. See :func:`_iter_pages`."""
+    pages = _iter_pages(fetch, max_items, pages_in_flight)
+    yielded = 0
+    try:
+        for page in pages:
+            for item in page.data:
+                yield item
+                yielded += 1
+                if max_items and yielded >= max_items:
+                    return
+    finally:
+        pages.close()
+
+
+async def _auto_paginate_async(
+    fetch: Callable[[int], Awaitable[_PageBase[T]]],
+    max_items: Optional[int] = None,
+    pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
+) -> AsyncGenerator[T, None]:
+    """Async counterpart of :func:`_auto_paginate`."""
+    pages = _iter_pages_async(fetch, max_items, pages_in_flight)
+    yielded = 0
+    try:
+        async for page in pages:
+            for item in page.data:
+                yield item
+                yielded += 1
+                if max_items and yielded >= max_items:
+                    return
+    finally:
+        await pages.aclose()
+
+
+def _collect_all(
+    fetch: Callable[[int], _PageBase[T]],
+    max_items: Optional[int] = None,
+    pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
+) -> List[T]:
+    """Gather every item across pages into one list, a page at a time."""
+    items: List[T] = []
+    pages = _iter_pages(fetch, max_items, pages_in_flight)
+    try:
+        for page in pages:
+            items += page.data
+            if max_items and len(items) >= max_items:
+                del items[max_items:]
+                break
+    finally:
+        pages.close()
+    return items
+
+
+async def _collect_all_async(
+    fetch: Callable[[int], Awaitable[_PageBase[T]]],
+    max_items: Optional[int] = None,
+    pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
+) -> List[T]:
+    """Async counterpart of :func:`_collect_all`."""
+    items: List[T] = []
+    pages = _iter_pages_async(fetch, max_items, pages_in_flight)
+    try:
+        async for page in pages:
+            items += page.data
+            if max_items and len(items) >= max_items:
+                del items[max_items:]
+                break
+    finally:
+        await pages.aclose()
+    return items
+
+
+def _discard(task: "asyncio.Future[Any]") -> None:
+    """Cancel an abandoned prefetch, consuming any error it already raised."""
+    if not task.cancel() and not task.cancelled():
+        task.exception()
@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generic, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
 
 import httpx
 
+from propheseer._compat import DATACLASS_SLOTS
+
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RateLimitInfo:
     """Rate limit information extracted from API response headers.
 
@@ -39,7 +41,7 @@ class RateLimitInfo:
     request_cost: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class APIResponse(Generic[T]):
     """Wrapper for API responses that includes rate limit info.
 
@@ -54,9 +56,50 @@ class APIResponse(Generic[T]):
     http_response: Optional[httpx.Response] = None
 
 
+def _parse_list_response(
+    raw: Dict[str, Any],
+    rate_limit: Optional[RateLimitInfo],
+    response: httpx.Response,
+    parser: Callable[[Dict[str, Any]], T],
+) -> APIResponse[List[T]]:
+    """Wrap a ``{"data": [...]}`` payload, parsing each item with ``parser``."""
+    data = list(map(parser, raw.get("data") or ()))
+    return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+
+
+def _parse_obj_response(
+    raw: Dict[str, Any],
+    rate_limit: Optional[RateLimitInfo],
+    response: httpx.Response,
+    parser: Callable[[Dict[str, Any]], T],
+) -> APIResponse[T]:
+    """Wrap a ``{"data": {...}}`` payload, parsing the object with ``parser``."""
+    data = parser(raw.get("data") or {})
+    return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+
+
+# Lower-cased header name -> (field name, converter, billing type). Fields
+# tagged with a billing type are only kept for responses of that type.
+_RATE_LIMIT_HEADERS: Dict[bytes, Tuple[str, Callable[[str], Any], Optional[str]]] = {
+    b"x-ratelimit-plan": ("plan", str, None),
+    b"x-billing-type": ("billing_type", str, None),
+    b"x-ratelimit-limit-day": ("limit_day", int, "subscription"),
+    b"x-ratelimit-remaining-day": ("remaining_day", int, "subscription"),
+    b"x-ratelimit-limit-minute": ("limit_minute", int, "subscription"),
+    b"x-ratelimit-remaining-minute": ("remaining_minute", int, "subscription"),
+    b"x-credit-balance-cents": ("credit_balance_cents", int, "credits"),
+    b"x-credit-balance": ("credit_balance", str, "credits"),
+    b"x-request-cost-cents": ("request_cost_cents", int, "credits"),
+    b"x-request-cost": ("request_cost", str, "credits"),
+}
+
+
 def parse_rate_limit_headers(headers: httpx.Headers) -> Optional[RateLimitInfo]:
     """Parse rate limit information from API response headers.
 
+    The raw header list is scanned once, with a single table lookup per
+    header, instead of one case-insensitive search per field.
+
     Args:
         headers: The HTTP response headers.
 
@@ -64,39 +107,31 @@ def parse_rate_limit_headers(headers: httpx.Headers) -> Optional[RateLimitInfo]:
         A :class:`RateLimitInfo` object, or ``None`` if no rate limit headers
         are present.
     """
-    plan = headers.get("x-ratelimit-plan")
+    found: Dict[bytes, bytes] = {}
+    for key, value in headers.raw:
+        key = key.lower()
+        if key in _RATE_LIMIT_HEADERS:
+            found[key] = value
+
+    plan = found.pop(b"x-ratelimit-plan", None)
     if not plan:
         return None
 
-    billing_type = headers.get("x-billing-type", "subscription")
-
-    info = RateLimitInfo(plan=plan, billing_type=billing_type)
-
-    if billing_type == "credits":
-        balance_cents = headers.get("x-credit-balance-cents")
-        if balance_cents is not None:
-            info.credit_balance_cents = int(balance_cents)
-        credit_balance = headers.get("x-credit-balance")
-        if credit_balance is not None:
-            info.credit_balance = credit_balance
-        cost_cents = headers.get("x-request-cost-cents")
-        if cost_cents is not None:
-            info.request_cost_cents = int(cost_cents)
-        request_cost = headers.get("x-request-cost")
-        if request_cost is not None:
-            info.request_cost = request_cost
-    else:
-        limit_day = headers.get("x-ratelimit-limit-day")
-        if limit_day is not None:
-            info.limit_day = int(limit_day)
-        remaining_day = headers.get("x-ratelimit-remaining-day")
-        if remaining_day is not None:
-            info.remaining_day = int(remaining_day)
-        limit_minute = headers.get("x-ratelimit-limit-minute")
-        if limit_minute is not None:
-            info.limit_minute = int(limit_minute)
-        remaining_minute = headers.get("x-ratelimit-remaining-minute")
-        if remaining_minute is not None:
-            info.remaining_minute = int(remaining_minute)
-
-    return info
+    encoding = headers.encoding
+    raw_billing_type = found.pop(b"x-billing-type", None)
+    billing_type = (
+        raw_billing_type.decode(encoding)
+        if raw_billing_type is not None
+        else "subscription"
+    )
+    group = "credits" if billing_type == "credits" else "subscription"
+
+    fields: Dict[str, Any] = {}
+    for key, value in found.items():
+        name, convert, field_group = _RATE_LIMIT_HEADERS[key]
+        if field_group == group:
+            fields[name] = convert(value.decode(encoding))
+
+    return RateLimitInfo(
+        plan=plan.decode(encoding), billing_type=billing_type, **fields
+    )
@@ -0,0 +1,71 @@
+"""Client-side request pacing driven by the API's rate limit headers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+from propheseer._response import RateLimitInfo
+
+
+class TokenBucket:
+    """A token bucket refilled at the plan's per-minute request rate.
+
+    The bucket starts out disabled. Every response's rate limit headers
+    cap it at the server's ``remaining_minute`` count, so the client paces
+    itself instead of running into ``429`` responses. Responses
+    without a per-minute limit (credit billing) leave it disabled.
+    """
+
+    __slots__ = ("_rate", "_capacity", "_tokens", "_updated", "_lock")
+
+    def __init__(self) -> None:
+        self._rate: Optional[float] = None  # tokens per second
+        self._capacity = 0.0
+        self._tokens = 0.0
+        self._updated = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, rate_limit: Optional[RateLimitInfo]) -> None:
+        """Resync the bucket from a response's rate limit info."""
+        if rate_limit is None:
+            return
+        limit = rate_limit.limit_minute
+        remaining = rate_limit.remaining_minute
+        if not limit or remaining is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if self._rate is None:
+                self._tokens = float(remaining)
+            else:
+                # Refill first, then only ever lower the balance: responses
+                # arrive while other reservations are still waiting, and
+                # adopting the server count as-is would hand their slots out
+                # a second time.
+                self._refill(now, self._rate)
+                self._tokens = min(self._tokens, float(remaining))
+            self._rate = limit / 60.0
+            self._capacity = float(limit)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before sending.
+
+        Reservations may drive the bucket negative, so concurrent callers
+        queue up behind each other rather than all waking at once.
+        """
+        with self._lock:
+            if self._rate is None:
+                return 0.0
+            self._refill(time.monotonic(), self._rate)
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def _refill(self, now: float, rate: float) -> None:
+        """Add the tokens earned since the last update. Caller holds the lock."""
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * rate)
+        self._updated = now
@@ -0,0 +1,13 @@
+"""Small helpers shared by the resource modules."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+
+def build_query(**params: Any) -> Dict[str, Any]:
+    """Build a query dict from keyword filters, dropping those left ``None``.
+
+    An empty result adds no ``?`` to the URL.
+    """
+    return {key: value for key, value in params.items() if value is not None}
@@ -7,24 +7,135 @@ Requires the ``websockets`` package::
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
+import random
 import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Union
 from urllib.parse import quote
 
+from propheseer import _json
 from propheseer._constants import (
     DEFAULT_WS_BASE_URL,
     DEFAULT_WS_MAX_RECONNECT_ATTEMPTS,
     DEFAULT_WS_PING_INTERVAL,
-    VERSION,
+    USER_AGENT,
 )
 
 logger = logging.getLogger("propheseer.websocket")
 
 
+# Server message types that are forwarded to listeners as events.
+_HANDLED_TYPES = frozenset(
+    {
+        "connected",
+        "market_update",
+        "market_snapshot",
+        "subscribed",
+        "unsubscribed",
+        "error",
+    }
+)
+
+
+# How long subscribe/unsubscribe calls are buffered so that consecutive calls
+# of the same kind go out as one message.
+_COALESCE_DELAY = 0.005
+
+
+# An outgoing message: a dict to encode, or an already-encoded frame.
+_Outgoing = Union[Dict[str, Any], str]
+
+# Messages that never change, encoded once.
+_PING_FRAME = '{"type":"ping"}'
+_LIST_SUBS_FRAME = '{"type":"list_subscriptions"}'
+
+
+def _coalesce(pending: List[_Outgoing], data: _Outgoing) -> None:
+    """Queue an outgoing message, merging it into the previous one if both
+    are subscribe (or both unsubscribe) requests."""
+    last = pending[-1] if pending else None
+    if (
+        isinstance(data, dict)
+        and isinstance(last, dict)
+        and data["type"] in ("subscribe", "unsubscribe")
+        and last["type"] == data["type"]
+    ):
+        last["markets"].extend(data["markets"])
+    else:
+        pending.append(data)
+
+
+def _is_json_object(raw: Any) -> bool:
+    """Whether a received frame looks like a JSON object.
+
+    Every dispatchable server message is a JSON object, so other frames
+    (empty frames, plain-text keepalives) are skipped without parsing.
+    """
+    return raw[:1] in ("{", b"{")
+
+
+# Event fired with each raw fragment of a ``market_snapshot`` message as it
+# arrives. Fragmented reads are only used while a listener is registered.
+_FRAGMENT_EVENT = "market_snapshot_fragment"
+
+
+def _is_snapshot_fragment(fragment: Any) -> bool:
+    """Whether the first fragment of a message starts a market snapshot."""
+    head = fragment[:64]
+    if isinstance(head, bytes):
+        head = head.decode("utf-8", "ignore")
+    return '"type":"market_snapshot"' in head.replace(" ", "")
+
+
+def _join_fragments(fragments: List[Any]) -> Any:
+    """Reassemble a message from its str or bytes fragments."""
+    if len(fragments) == 1:
+        return fragments[0]
+    return fragments[0][:0].join(fragments)
+
+
+def _encode(data: _Outgoing) -> str:
+    """Serialize an outgoing message for a text frame.
+
+    The server expects text frames, so the encoded bytes are decoded back
+    to ``str`` rather than sent as a binary frame. Pre-encoded frames are
+    returned as-is.
+    """
+    if isinstance(data, str):
+        return data
+    return _json.dumps(data).decode()
+
+
+def _normalize_ws_url(base: str) -> str:
+    """Strip trailing slashes and map an ``http(s)://`` base to ``ws(s)://``."""
+    base = base.rstrip("/")
+    if base.startswith("http://"):
+        return "ws://" + base[7:]
+    if base.startswith("https://"):
+        return "wss://" + base[8:]
+    return base
+
+
+def _build_ws_url(base: str, api_key: str) -> str:
+    """Build the connection URL for a normalized base URL and API key."""
+    return f"{base}/ws?api_key={quote(api_key, safe='')}"
+
+
+# Reconnect backoff per attempt: 1s, 2s, 4s, ... capped at 30s. The last
+# entry is reused for any later attempt.
+_RECONNECT_DELAYS = tuple(min(2.0**i, 30.0) for i in range(8))
+
+
+def _reconnect_delay(attempt: int) -> float:
+    """Backoff before reconnect ``attempt`` (1-based), with up to 25% jitter
+    so many clients dropped at once don't reconnect in lockstep."""
+    delay = _RECONNECT_DELAYS[min(attempt, len(_RECONNECT_DELAYS)) - 1]
+    return delay + random.uniform(0, 0.25 * delay)
+
+
 # ---------- Event emitter mixin ----------
 
 
@@ -32,16 +143,20 @@ class _EventEmitter:
     """Simple event emitter supporting typed callbacks."""
 
     def __init__(self) -> None:
-        self._listeners: Dict[str, List[Callable[..., Any]]] = {}
+        # Per event, an insertion-ordered set of callbacks (dict values are
+        # unused) so that off() is a single O(1) removal.
+        self._listeners: Dict[str, Dict[Callable[..., Any], None]] = {}
 
     def on(self, event: str, callback: Callable[..., Any]) -> None:
         """Register an event listener.
 
+        Registering the same callback again for an event has no effect.
+
         Args:
             event: Event name (e.g. ``"connected"``, ``"market_update"``).
             callback: Function to call when the event fires.
         """
-        self._listeners.setdefault(event, []).append(callback)
+        self._listeners.setdefault(event, {})[callback] = None
 
     def off(self, event: str, callback: Callable[..., Any]) -> None:
         """Remove an event listener.
@@ -50,12 +165,17 @@ class _EventEmitter:
             event: Event name.
             callback: The callback to remove.
         """
-        listeners = self._listeners.get(event, [])
-        self._listeners[event] = [cb for cb in listeners if cb is not callback]
+        listeners = self._listeners.get(event)
+        if listeners is not None:
+            listeners.pop(callback, None)
 
     def _emit(self, event: str, *args: Any) -> None:
         """Emit an event to all registered listeners."""
-        for callback in self._listeners.get(event, []):
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return
+        # Snapshot so a callback may call off() while the event is dispatched.
+        for callback in tuple(listeners):
             try:
                 callback(*args)
             except Exception:
@@ -82,6 +202,10 @@ class PropheseerWebSocket(_EventEmitter):
         - ``connected(message)``: Fired when connected.
         - ``market_update(message)``: Fired on market price update.
         - ``market_snapshot(message)``: Fired on market snapshot.
+        - ``market_snapshot_fragment(fragment)``: Fired with each raw
+          ``str``/``bytes`` fragment of a large ``market_snapshot`` as it
+          arrives, before the complete message is dispatched. Requires a
+          ``websockets`` version with ``recv_streaming()``.
         - ``subscribed(message)``: Fired when subscription confirmed.
         - ``unsubscribed(message)``: Fired when unsubscription confirmed.
         - ``error(error)``: Fired on error (dict or Exception).
@@ -126,13 +250,9 @@ class PropheseerWebSocket(_EventEmitter):
             )
 
         self._api_key = resolved_key
-        base = (base_url or DEFAULT_WS_BASE_URL).rstrip("/")
-        # Ensure ws:// or wss:// scheme
-        if base.startswith("http://"):
-            base = "ws://" + base[7:]
-        elif base.startswith("https://"):
-            base = "wss://" + base[8:]
-        self._base_url = base
+        self._base_url = _normalize_ws_url(base_url or DEFAULT_WS_BASE_URL)
+        self._url = _build_ws_url(self._base_url, resolved_key)
+        self._headers = {"User-Agent": USER_AGENT}
         self._reconnect_enabled = reconnect
         self._max_reconnect_attempts = max_reconnect_attempts
         self._ping_interval = ping_interval
@@ -144,6 +264,9 @@ class PropheseerWebSocket(_EventEmitter):
         self._reconnect_attempts = 0
         self._subscribed_markets: Set[str] = set()
         self._connected_event = threading.Event()
+        self._pending: List[_Outgoing] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
 
     def on(self, event: str, callback: Optional[Callable[..., Any]] = None) -> Any:
         """Register an event listener. Can be used as a decorator.
@@ -188,28 +311,24 @@ class PropheseerWebSocket(_EventEmitter):
         self._closed = False
         self._connected_event.clear()
 
-        url = f"{self._base_url}/ws?api_key={quote(self._api_key, safe='')}"
-
         def run() -> None:
             try:
-                additional_headers = {
-                    "User-Agent": f"propheseer-python/{VERSION}",
-                }
                 self._ws = ws_sync.connect(
-                    url,
-                    additional_headers=additional_headers,
+                    self._url,
+                    additional_headers=self._headers,
                 )
                 self._reconnect_attempts = 0
                 self._connected_event.set()
                 self._start_ping()
 
+                # Block in recv(); close() closes the socket, which raises
+                # ConnectionClosed here and ends the loop.
+                ws = self._ws
                 while not self._closed:
                     try:
-                        raw = self._ws.recv(timeout=1.0)
-                        message = json.loads(raw)
-                        self._handle_message(message)
-                    except TimeoutError:
-                        continue
+                        raw = self._recv_message(ws)
+                        if _is_json_object(raw):
+                            self._handle_message(_json.loads(raw))
                     except Exception as exc:
                         if self._closed:
                             break
@@ -237,12 +356,15 @@ class PropheseerWebSocket(_EventEmitter):
     def subscribe(self, market_ids: List[str]) -> None:
         """Subscribe to real-time updates for specific market IDs.
 
+        Calls made within a few milliseconds of each other are sent as a
+        single message; use :meth:`flush` to send immediately.
+
         Args:
             market_ids: List of market IDs to subscribe to.
         """
         for mid in market_ids:
             self._subscribed_markets.add(mid)
-        self._send({"type": "subscribe", "markets": market_ids})
+        self._queue({"type": "subscribe", "markets": list(market_ids)})
 
     def unsubscribe(self, market_ids: List[str]) -> None:
         """Unsubscribe from market updates.
@@ -252,15 +374,30 @@ class PropheseerWebSocket(_EventEmitter):
         """
         for mid in market_ids:
             self._subscribed_markets.discard(mid)
-        self._send({"type": "unsubscribe", "markets": market_ids})
+        self._queue({"type": "unsubscribe", "markets": list(market_ids)})
 
     def list_subscriptions(self) -> None:
         """Request the current list of subscribed markets."""
-        self._send({"type": "list_subscriptions"})
+        self._queue(_LIST_SUBS_FRAME)
+
+    def flush(self) -> None:
+        """Send any buffered subscription messages now."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        for data in pending:
+            self._send(data)
 
     def close(self) -> None:
         """Close the WebSocket connection."""
         self._closed = True
+        with self._pending_lock:
+            self._pending = []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
         self._stop_ping()
         if self._ws:
             try:
@@ -271,20 +408,37 @@ class PropheseerWebSocket(_EventEmitter):
 
     def _handle_message(self, message: Dict[str, Any]) -> None:
         msg_type = message.get("type", "")
-        if msg_type in (
-            "connected",
-            "market_update",
-            "market_snapshot",
-            "subscribed",
-            "unsubscribed",
-            "error",
-        ):
+        if msg_type in _HANDLED_TYPES:
             self._emit(msg_type, message)
 
-    def _send(self, data: Dict[str, Any]) -> None:
+    def _queue(self, data: _Outgoing) -> None:
+        with self._pending_lock:
+            _coalesce(self._pending, data)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(_COALESCE_DELAY, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _recv_message(self, ws: Any) -> Any:
+        if not self._listeners.get(_FRAGMENT_EVENT) or not hasattr(
+            ws, "recv_streaming"
+        ):
+            return ws.recv()
+
+        fragments: List[Any] = []
+        forward = False
+        for fragment in ws.recv_streaming():
+            if not fragments:
+                forward = _is_snapshot_fragment(fragment)
+            if forward and fragment:
+                self._emit(_FRAGMENT_EVENT, fragment)
+            fragments.append(fragment)
+        return _join_fragments(fragments)
+
+    def _send(self, data: _Outgoing) -> None:
         if self._ws:
             try:
-                self._ws.send(json.dumps(data))
+                self._ws.send(_encode(data))
             except Exception:
                 pass
 
@@ -295,7 +449,7 @@ class PropheseerWebSocket(_EventEmitter):
             while not self._closed and self._ws:
                 time.sleep(self._ping_interval)
                 if not self._closed and self._ws:
-                    self._send({"type": "ping"})
+                    self._send(_PING_FRAME)
 
         self._ping_thread = threading.Thread(target=ping_loop, daemon=True)
         self._ping_thread.start()
@@ -314,7 +468,7 @@ class PropheseerWebSocket(_EventEmitter):
             return
 
         self._reconnect_attempts += 1
-        delay = min(1.0 * (2 ** (self._reconnect_attempts - 1)), 30.0)
+        delay = _reconnect_delay(self._reconnect_attempts)
         self._emit("reconnect", self._reconnect_attempts)
 
         time.sleep(delay)
@@ -346,7 +500,6 @@ class AsyncPropheseerWebSocket(_EventEmitter):
 
     Example::
 
-        import asyncio
         from propheseer import AsyncPropheseerWebSocket
 
         async def main():
@@ -380,12 +533,9 @@ class AsyncPropheseerWebSocket(_EventEmitter):
             )
 
         self._api_key = resolved_key
-        base = (base_url or DEFAULT_WS_BASE_URL).rstrip("/")
-        if base.startswith("http://"):
-            base = "ws://" + base[7:]
-        elif base.startswith("https://"):
-            base = "wss://" + base[8:]
-        self._base_url = base
+        self._base_url = _normalize_ws_url(base_url or DEFAULT_WS_BASE_URL)
+        self._url = _build_ws_url(self._base_url, resolved_key)
+        self._headers = {"User-Agent": USER_AGENT}
         self._reconnect_enabled = reconnect
         self._max_reconnect_attempts = max_reconnect_attempts
         self._ping_interval = ping_interval
@@ -396,11 +546,14 @@ class AsyncPropheseerWebSocket(_EventEmitter):
         self._closed = False
         self._reconnect_attempts = 0
         self._subscribed_markets: Set[str] = set()
+        self._pending: List[_Outgoing] = []
+        self._flush_handle: Any = None
+        # Outgoing messages are sent, in order, by a single writer task.
+        self._send_queue: Any = None
+        self._writer_task: Any = None
 
     async def connect(self) -> None:
         """Connect to the WebSocket server."""
-        import asyncio
-
         try:
             import websockets
         except ImportError:
@@ -410,29 +563,27 @@ class AsyncPropheseerWebSocket(_EventEmitter):
             )
 
         self._closed = False
-        url = f"{self._base_url}/ws?api_key={quote(self._api_key, safe='')}"
-
-        additional_headers = {
-            "User-Agent": f"propheseer-python/{VERSION}",
-        }
-
         self._ws = await websockets.connect(
-            url,
-            additional_headers=additional_headers,
+            self._url,
+            additional_headers=self._headers,
         )
         self._reconnect_attempts = 0
+        self._start_writer()
         self._start_ping()
         self._start_receive()
 
     def subscribe(self, market_ids: List[str]) -> None:
         """Subscribe to real-time updates for specific market IDs.
 
+        Calls made within a few milliseconds of each other are sent as a
+        single message; use :meth:`flush` to send immediately.
+
         Args:
             market_ids: List of market IDs to subscribe to.
         """
         for mid in market_ids:
             self._subscribed_markets.add(mid)
-        self._send_nowait({"type": "subscribe", "markets": market_ids})
+        self._queue({"type": "subscribe", "markets": list(market_ids)})
 
     def unsubscribe(self, market_ids: List[str]) -> None:
         """Unsubscribe from market updates.
@@ -442,51 +593,93 @@ class AsyncPropheseerWebSocket(_EventEmitter):
         """
         for mid in market_ids:
             self._subscribed_markets.discard(mid)
-        self._send_nowait({"type": "unsubscribe", "markets": market_ids})
+        self._queue({"type": "unsubscribe", "markets": list(market_ids)})
 
     def list_subscriptions(self) -> None:
         """Request the current list of subscribed markets."""
-        self._send_nowait({"type": "list_subscriptions"})
+        self._queue(_LIST_SUBS_FRAME)
+
+    async def flush(self) -> None:
+        """Send any buffered messages and wait until they have been written."""
+        self._flush_nowait()
+        if self._send_queue is not None:
+            await self._send_queue.join()
 
     async def close(self) -> None:
         """Close the WebSocket connection."""
-        import asyncio
-
         self._closed = True
+        self._take_pending()
         if self._ping_task:
             self._ping_task.cancel()
             self._ping_task = None
         if self._receive_task:
             self._receive_task.cancel()
             self._receive_task = None
+        self._stop_writer()
         if self._ws:
             await self._ws.close()
             self._ws = None
 
     def _handle_message(self, message: Dict[str, Any]) -> None:
         msg_type = message.get("type", "")
-        if msg_type in (
-            "connected",
-            "market_update",
-            "market_snapshot",
-            "subscribed",
-            "unsubscribed",
-            "error",
-        ):
+        if msg_type in _HANDLED_TYPES:
             self._emit(msg_type, message)
 
-    def _send_nowait(self, data: Dict[str, Any]) -> None:
-        import asyncio
-
-        if self._ws:
+    def _queue(self, data: _Outgoing) -> None:
+        _coalesce(self._pending, data)
+        if self._flush_handle is None:
             try:
-                asyncio.ensure_future(self._ws.send(json.dumps(data)))
-            except Exception:
-                pass
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Not inside the event loop; there is nothing to batch with.
+                self._flush_nowait()
+                return
+            self._flush_handle = loop.call_later(_COALESCE_DELAY, self._flush_nowait)
+
+    def _take_pending(self) -> List[_Outgoing]:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        return pending
+
+    def _flush_nowait(self) -> None:
+        for data in self._take_pending():
+            self._send_nowait(data)
+
+    def _send_nowait(self, data: _Outgoing) -> None:
+        if self._ws and self._send_queue is not None:
+            self._send_queue.put_nowait(data)
+
+    def _start_writer(self) -> None:
+        self._stop_writer()
+        queue: "asyncio.Queue[_Outgoing]" = asyncio.Queue()
+        self._send_queue = queue
+
+        async def writer_loop() -> None:
+            while True:
+                data = await queue.get()
+                try:
+                    if self._ws:
+                        await self._ws.send(_encode(data))
+                except Exception:
+                    pass
+                finally:
+                    queue.task_done()
+
+        self._writer_task = asyncio.ensure_future(writer_loop())
+
+    def _stop_writer(self) -> None:
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
+        queue, self._send_queue = self._send_queue, None
+        # Discard unsent messages so a pending flush() doesn't wait forever.
+        while queue is not None and not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
 
     def _start_ping(self) -> None:
-        import asyncio
-
         if self._ping_task:
             self._ping_task.cancel()
 
@@ -494,28 +687,24 @@ class AsyncPropheseerWebSocket(_EventEmitter):
             while not self._closed and self._ws:
                 await asyncio.sleep(self._ping_interval)
                 if not self._closed and self._ws:
-                    try:
-                        await self._ws.send(json.dumps({"type": "ping"}))
-                    except Exception:
-                        break
+                    self._send_nowait(_PING_FRAME)
 
         self._ping_task = asyncio.ensure_future(ping_loop())
 
     def _start_receive(self) -> None:
-        import asyncio
-
         if self._receive_task:
             self._receive_task.cancel()
 
         async def receive_loop() -> None:
             try:
-                async for raw in self._ws:
+                async for raw in self._iter_messages(self._ws):
                     if self._closed:
                         break
+                    if not _is_json_object(raw):
+                        continue
                     try:
-                        message = json.loads(raw)
-                        self._handle_message(message)
-                    except json.JSONDecodeError:
+                        self._handle_message(_json.loads(raw))
+                    except ValueError:
                         pass
             except Exception as exc:
                 if not self._closed:
@@ -527,9 +716,36 @@ class AsyncPropheseerWebSocket(_EventEmitter):
 
         self._receive_task = asyncio.ensure_future(receive_loop())
 
-    async def _attempt_reconnect(self) -> None:
-        import asyncio
+    async def _iter_messages(self, ws: Any) -> AsyncIterator[Any]:
+        if not hasattr(ws, "recv_streaming"):
+            async for raw in ws:
+                yield raw
+            return
+
+        from websockets.exceptions import ConnectionClosedOK
 
+        while True:
+            try:
+                if self._listeners.get(_FRAGMENT_EVENT):
+                    raw = await self._recv_fragmented(ws)
+                else:
+                    raw = await ws.recv()
+            except ConnectionClosedOK:
+                return
+            yield raw
+
+    async def _recv_fragmented(self, ws: Any) -> Any:
+        fragments: List[Any] = []
+        forward = False
+        async for fragment in ws.recv_streaming():
+            if not fragments:
+                forward = _is_snapshot_fragment(fragment)
+            if forward and fragment:
+                self._emit(_FRAGMENT_EVENT, fragment)
+            fragments.append(fragment)
+        return _join_fragments(fragments)
+
+    async def _attempt_reconnect(self) -> None:
         if self._reconnect_attempts >= self._max_reconnect_attempts:
             self._emit(
                 "error",
@@ -540,7 +756,7 @@ class AsyncPropheseerWebSocket(_EventEmitter):
             return
 
         self._reconnect_attempts += 1
-        delay = min(1.0 * (2 ** (self._reconnect_attempts - 1)), 30.0)
+        delay = _reconnect_delay(self._reconnect_attempts)
         self._emit("reconnect", self._reconnect_attempts)
 
         await asyncio.sleep(delay)
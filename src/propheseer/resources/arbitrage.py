@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
-from propheseer._response import APIResponse
+from propheseer._response import APIResponse, _parse_list_response
+from propheseer._utils import build_query
 from propheseer.types.arbitrage import ArbitrageOpportunity, ArbitrageFindParams
 
 if TYPE_CHECKING:
@@ -44,17 +45,13 @@ class SyncArbitrage:
             for opp in result.data:
                 print(f"{opp.question}: {opp.potential_return}")
         """
-        query: Dict[str, Any] = {
-            "min_spread": min_spread,
-            "category": category,
-        }
+        query = build_query(min_spread=min_spread, category=category)
 
         raw, rate_limit, response = self._client._request(
-            "GET", "/v1/arbitrage", query=query
+            "GET", "/v1/arbitrage", query=query, transform_keys=False
         )
 
-        data = [ArbitrageOpportunity.from_dict(o) for o in raw.get("data", [])]
-        return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+        return _parse_list_response(raw, rate_limit, response, ArbitrageOpportunity.from_dict)
 
 
 class AsyncArbitrage:
@@ -84,14 +81,10 @@ class AsyncArbitrage:
             An :class:`APIResponse` containing a list of
             :class:`ArbitrageOpportunity` objects.
         """
-        query: Dict[str, Any] = {
-            "min_spread": min_spread,
-            "category": category,
-        }
+        query = build_query(min_spread=min_spread, category=category)
 
         raw, rate_limit, response = await self._client._request(
-            "GET", "/v1/arbitrage", query=query
+            "GET", "/v1/arbitrage", query=query, transform_keys=False
         )
 
-        data = [ArbitrageOpportunity.from_dict(o) for o in raw.get("data", [])]
-        return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+        return _parse_list_response(raw, rate_limit, response, ArbitrageOpportunity.from_dict)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, TYPE_CHECKING
 
-from propheseer._response import APIResponse
+from propheseer._response import APIResponse, _parse_list_response
 from propheseer.types.categories import Category
 
 if TYPE_CHECKING:
@@ -29,10 +29,11 @@ class SyncCategories:
             for cat in result.data:
                 print(f"{cat.name}: {cat.subcategories}")
         """
-        raw, rate_limit, response = self._client._request("GET", "/v1/categories")
+        raw, rate_limit, response = self._client._request(
+            "GET", "/v1/categories", transform_keys=False
+        )
 
-        data = [Category.from_dict(c) for c in raw.get("data", [])]
-        return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+        return _parse_list_response(raw, rate_limit, response, Category.from_dict)
 
 
 class AsyncCategories:
@@ -48,8 +49,7 @@ class AsyncCategories:
             An :class:`APIResponse` containing a list of :class:`Category` objects.
         """
         raw, rate_limit, response = await self._client._request(
-            "GET", "/v1/categories"
+            "GET", "/v1/categories", transform_keys=False
         )
 
-        data = [Category.from_dict(c) for c in raw.get("data", [])]
-        return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+        return _parse_list_response(raw, rate_limit, response, Category.from_dict)
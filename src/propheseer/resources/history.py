@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
-from propheseer._response import APIResponse
+from propheseer._response import APIResponse, _parse_list_response
+from propheseer._utils import build_query
 from propheseer.types.history import MarketHistoryEntry, SnapshotDate
 
 if TYPE_CHECKING:
@@ -50,20 +51,19 @@ class SyncHistory:
             for entry in result.data:
                 print(f"{entry.snapshot_date}: {entry.data}")
         """
-        query: Dict[str, Any] = {
-            "market_id": market_id,
-            "source": source,
-            "category": category,
-            "days": days,
-            "limit": limit,
-        }
+        query = build_query(
+            market_id=market_id,
+            source=source,
+            category=category,
+            days=days,
+            limit=limit,
+        )
 
         raw, rate_limit, response = self._client._request(
-            "GET", "/v1/markets/history", query=query
+            "GET", "/v1/markets/history", query=query, transform_keys=False
         )
 
-        data = [MarketHistoryEntry.from_dict(e) for e in raw.get("data", [])]
-        return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+        return _parse_list_response(raw, rate_limit, response, MarketHistoryEntry.from_dict)
 
     def dates(self) -> APIResponse[List[SnapshotDate]]:
         """List available snapshot dates.
@@ -81,11 +81,10 @@ class SyncHistory:
                 print(f"{d.date}: {d.count} markets")
         """
         raw, rate_limit, response = self._client._request(
-            "GET", "/v1/markets/history/dates"
+            "GET", "/v1/markets/history/dates", transform_keys=False
         )
 
-        data = [SnapshotDate.from_dict(d) for d in raw.get("data", [])]
-        return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+        return _parse_list_response(raw, rate_limit, response, SnapshotDate.from_dict)
 
 
 class AsyncHistory:
@@ -121,20 +120,19 @@ class AsyncHistory:
             An :class:`APIResponse` containing a list of
             :class:`MarketHistoryEntry` objects.
         """
-        query: Dict[str, Any] = {
-            "market_id": market_id,
-            "source": source,
-            "category": category,
-            "days": days,
-            "limit": limit,
-        }
+        query = build_query(
+            market_id=market_id,
+            source=source,
+            category=category,
+            days=days,
+            limit=limit,
+        )
 
         raw, rate_limit, response = await self._client._request(
-            "GET", "/v1/markets/history", query=query
+            "GET", "/v1/markets/history", query=query, transform_keys=False
         )
 
-        data = [MarketHistoryEntry.from_dict(e) for e in raw.get("data", [])]
-        return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+        return _parse_list_response(raw, rate_limit, response, MarketHistoryEntry.from_dict)
 
     async def dates(self) -> APIResponse[List[SnapshotDate]]:
         """List available snapshot dates.
@@ -146,8 +144,7 @@ class AsyncHistory:
             objects.
         """
         raw, rate_limit, response = await self._client._request(
-            "GET", "/v1/markets/history/dates"
+            "GET", "/v1/markets/history/dates", transform_keys=False
         )
 
-        data = [SnapshotDate.from_dict(d) for d in raw.get("data", [])]
-        return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+        return _parse_list_response(raw, rate_limit, response, SnapshotDate.from_dict)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from propheseer._response import APIResponse
+from propheseer._response import APIResponse, _parse_obj_response
 from propheseer.types.keys import KeyInfo
 
 if TYPE_CHECKING:
@@ -32,10 +32,11 @@ class SyncKeys:
             print(f"Plan: {result.data.plan}")
             print(f"Daily: {result.data.usage.daily}/{result.data.limits.requests_per_day}")
         """
-        raw, rate_limit, response = self._client._request("GET", "/v1/keys/me")
+        raw, rate_limit, response = self._client._request(
+            "GET", "/v1/keys/me", transform_keys=False
+        )
 
-        key_info = KeyInfo.from_dict(raw.get("data", {}))
-        return APIResponse(data=key_info, rate_limit=rate_limit, http_response=response)
+        return _parse_obj_response(raw, rate_limit, response, KeyInfo.from_dict)
 
 
 class AsyncKeys:
@@ -54,8 +55,7 @@ class AsyncKeys:
             An :class:`APIResponse` containing the :class:`KeyInfo`.
         """
         raw, rate_limit, response = await self._client._request(
-            "GET", "/v1/keys/me"
+            "GET", "/v1/keys/me", transform_keys=False
         )
 
-        key_info = KeyInfo.from_dict(raw.get("data", {}))
-        return APIResponse(data=key_info, rate_limit=rate_limit, http_response=response)
+        return _parse_obj_response(raw, rate_limit, response, KeyInfo.from_dict)
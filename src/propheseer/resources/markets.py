@@ -2,17 +2,64 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Generator, AsyncGenerator, Optional, TYPE_CHECKING
+import re
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 from urllib.parse import quote
 
-from propheseer._pagination import PaginationMeta, SyncPage, AsyncPage
-from propheseer._response import APIResponse
+from propheseer._base_client import _RequestConfig
+from propheseer._constants import DEFAULT_PAGES_IN_FLIGHT
+from propheseer._pagination import (
+    AsyncPage,
+    PaginationMeta,
+    SyncPage,
+    _auto_paginate,
+    _auto_paginate_async,
+    _collect_all,
+    _collect_all_async,
+)
+from propheseer._response import APIResponse, _parse_obj_response
+from propheseer._utils import build_query
 from propheseer.types.markets import Market, MarketListParams
 
 if TYPE_CHECKING:
     from propheseer._base_client import BaseAsyncClient, BaseSyncClient
 
 
+# IDs made only of characters quote() never escapes can skip encoding.
+_SAFE_ID = re.compile(r"[A-Za-z0-9_.~-]+").fullmatch
+
+
+def _market_path(market_id: str) -> str:
+    """The path of a single market, with the ID URL-encoded."""
+    if _SAFE_ID(market_id) is None:
+        market_id = quote(market_id, safe="")
+    return f"/v1/markets/{market_id}"
+
+
+def _collect_markets(
+    market_ids: List[str],
+    results: List[Union[Tuple[Any, Any, Any], BaseException]],
+) -> Dict[str, Market]:
+    """Map each ID to its parsed market, raising the first failed request."""
+    markets: Dict[str, Market] = {}
+    for market_id, result in zip(market_ids, results):
+        if isinstance(result, BaseException):
+            raise result
+        markets[market_id] = Market.from_dict(result[0].get("data") or {})
+    return markets
+
+
 class SyncMarkets:
     """Synchronous markets resource.
 
@@ -52,20 +99,20 @@ class SyncMarkets:
             for market in page.data:
                 print(market.question)
         """
-        query: Dict[str, Any] = {
-            "source": source,
-            "category": category,
-            "status": status,
-            "q": q,
-            "limit": limit,
-            "offset": offset,
-        }
+        query = build_query(
+            source=source,
+            category=category,
+            status=status,
+            q=q,
+            limit=limit,
+            offset=offset,
+        )
 
         raw, rate_limit, response = self._client._request(
-            "GET", "/v1/markets", query=query
+            "GET", "/v1/markets", query=query, transform_keys=False
         )
 
-        data = [Market.from_dict(m) for m in raw.get("data", [])]
+        data = list(map(Market.from_dict, raw.get("data") or ()))
         meta = PaginationMeta.from_dict(raw.get("meta", {}))
         return SyncPage(data, meta, rate_limit)
 
@@ -83,13 +130,35 @@ class SyncMarkets:
             result = client.markets.get("pm_12345")
             print(result.data.question)
         """
-        encoded_id = quote(market_id, safe="")
         raw, rate_limit, response = self._client._request(
-            "GET", f"/v1/markets/{encoded_id}"
+            "GET", _market_path(market_id), transform_keys=False
         )
 
-        market = Market.from_dict(raw.get("data", {}))
-        return APIResponse(data=market, rate_limit=rate_limit, http_response=response)
+        return _parse_obj_response(raw, rate_limit, response, Market.from_dict)
+
+    def get_many(self, market_ids: Iterable[str]) -> Dict[str, Market]:
+        """Get several markets by ID, fetching them concurrently.
+
+        Args:
+            market_ids: The market IDs. Duplicates are fetched once.
+
+        Returns:
+            A dict mapping each ID to its :class:`Market`, in input order.
+
+        Raises:
+            PropheseerError: The first failed request, e.g.
+                :class:`NotFoundError` for an unknown ID.
+
+        Example::
+
+            markets = client.markets.get_many(["pm_12345", "ks_678"])
+            print(markets["ks_678"].question)
+        """
+        ids = list(dict.fromkeys(market_ids))
+        results = self._client._request_many(
+            [_RequestConfig("GET", _market_path(i), transform_keys=False) for i in ids]
+        )
+        return _collect_markets(ids, results)
 
     def list_auto_paginate(
         self,
@@ -100,6 +169,7 @@ class SyncMarkets:
         q: Optional[str] = None,
         limit: Optional[int] = None,
         max_items: Optional[int] = None,
+        pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
     ) -> Generator[Market, None, None]:
         """Auto-paginate through all markets matching the query.
 
@@ -110,6 +180,9 @@ class SyncMarkets:
             q: Search query string.
             limit: Page size (default: 50).
             max_items: Maximum total items to yield.
+            pages_in_flight: Pages fetched or held at once, counting the one
+                being iterated (default: 4). Pass ``1`` to fetch each page
+                only after the previous one is consumed.
 
         Yields:
             Individual :class:`Market` objects.
@@ -120,29 +193,63 @@ class SyncMarkets:
                 print(market.question)
         """
         page_limit = limit or 50
-        offset = 0
-        yielded = 0
-
-        while True:
-            page = self.list(
+        yield from _auto_paginate(
+            lambda offset: self.list(
                 source=source,
                 category=category,
                 status=status,
                 q=q,
                 limit=page_limit,
                 offset=offset,
-            )
+            ),
+            max_items,
+            pages_in_flight,
+        )
 
-            for item in page.data:
-                yield item
-                yielded += 1
-                if max_items and yielded >= max_items:
-                    return
+    def list_all(
+        self,
+        *,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        q: Optional[str] = None,
+        limit: Optional[int] = None,
+        max_items: Optional[int] = None,
+        pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
+    ) -> List[Market]:
+        """Fetch all markets matching the query into one list.
 
-            if not page.has_more() or len(page.data) == 0:
-                return
+        Args:
+            source: Filter by source platform.
+            category: Filter by category.
+            status: Filter by status.
+            q: Search query string.
+            limit: Page size (default: 50).
+            max_items: Maximum total items to return.
+            pages_in_flight: Pages fetched or held at once, counting the one
+                being iterated (default: 4). Pass ``1`` to fetch each page
+                only after the previous one is consumed.
 
-            offset = page.next_offset()  # type: ignore[assignment]
+        Returns:
+            A list of :class:`Market` objects, in page order.
+
+        Example::
+
+            markets = client.markets.list_all(source="kalshi", max_items=500)
+        """
+        page_limit = limit or 50
+        return _collect_all(
+            lambda offset: self.list(
+                source=source,
+                category=category,
+                status=status,
+                q=q,
+                limit=page_limit,
+                offset=offset,
+            ),
+            max_items,
+            pages_in_flight,
+        )
 
 
 class AsyncMarkets:
@@ -177,20 +284,20 @@ class AsyncMarkets:
         Returns:
             An :class:`AsyncPage` of :class:`Market` objects.
         """
-        query: Dict[str, Any] = {
-            "source": source,
-            "category": category,
-            "status": status,
-            "q": q,
-            "limit": limit,
-            "offset": offset,
-        }
+        query = build_query(
+            source=source,
+            category=category,
+            status=status,
+            q=q,
+            limit=limit,
+            offset=offset,
+        )
 
         raw, rate_limit, response = await self._client._request(
-            "GET", "/v1/markets", query=query
+            "GET", "/v1/markets", query=query, transform_keys=False
         )
 
-        data = [Market.from_dict(m) for m in raw.get("data", [])]
+        data = list(map(Market.from_dict, raw.get("data") or ()))
         meta = PaginationMeta.from_dict(raw.get("meta", {}))
         return AsyncPage(data, meta, rate_limit)
 
@@ -203,13 +310,30 @@ class AsyncMarkets:
         Returns:
             An :class:`APIResponse` containing the :class:`Market`.
         """
-        encoded_id = quote(market_id, safe="")
         raw, rate_limit, response = await self._client._request(
-            "GET", f"/v1/markets/{encoded_id}"
+            "GET", _market_path(market_id), transform_keys=False
         )
 
-        market = Market.from_dict(raw.get("data", {}))
-        return APIResponse(data=market, rate_limit=rate_limit, http_response=response)
+        return _parse_obj_response(raw, rate_limit, response, Market.from_dict)
+
+    async def get_many(self, market_ids: Iterable[str]) -> Dict[str, Market]:
+        """Get several markets by ID, fetching them concurrently.
+
+        Args:
+            market_ids: The market IDs. Duplicates are fetched once.
+
+        Returns:
+            A dict mapping each ID to its :class:`Market`, in input order.
+
+        Raises:
+            PropheseerError: The first failed request, e.g.
+                :class:`NotFoundError` for an unknown ID.
+        """
+        ids = list(dict.fromkeys(market_ids))
+        results = await self._client._request_many(
+            [_RequestConfig("GET", _market_path(i), transform_keys=False) for i in ids]
+        )
+        return _collect_markets(ids, results)
 
     async def list_auto_paginate(
         self,
@@ -220,6 +344,7 @@ class AsyncMarkets:
         q: Optional[str] = None,
         limit: Optional[int] = None,
         max_items: Optional[int] = None,
+        pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
     ) -> AsyncGenerator[Market, None]:
         """Auto-paginate through all markets matching the query.
 
@@ -230,31 +355,69 @@ class AsyncMarkets:
             q: Search query string.
             limit: Page size (default: 50).
             max_items: Maximum total items to yield.
+            pages_in_flight: Pages fetched or held at once, counting the one
+                being iterated (default: 4). Pass ``1`` to fetch each page
+                only after the previous one is consumed.
 
         Yields:
             Individual :class:`Market` objects.
         """
         page_limit = limit or 50
-        offset = 0
-        yielded = 0
-
-        while True:
-            page = await self.list(
+        pages = _auto_paginate_async(
+            lambda offset: self.list(
                 source=source,
                 category=category,
                 status=status,
                 q=q,
                 limit=page_limit,
                 offset=offset,
-            )
-
-            for item in page.data:
+            ),
+            max_items,
+            pages_in_flight,
+        )
+        try:
+            async for item in pages:
                 yield item
-                yielded += 1
-                if max_items and yielded >= max_items:
-                    return
+        finally:
+            await pages.aclose()
+
+    async def list_all(
+        self,
+        *,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        q: Optional[str] = None,
+        limit: Optional[int] = None,
+        max_items: Optional[int] = None,
+        pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
+    ) -> List[Market]:
+        """Fetch all markets matching the query into one list.
 
-            if not page.has_more() or len(page.data) == 0:
-                return
+        Args:
+            source: Filter by source platform.
+            category: Filter by category.
+            status: Filter by status.
+            q: Search query string.
+            limit: Page size (default: 50).
+            max_items: Maximum total items to return.
+            pages_in_flight: Pages fetched or held at once, counting the one
+                being iterated (default: 4). Pass ``1`` to fetch each page
+                only after the previous one is consumed.
 
-            offset = page.next_offset()  # type: ignore[assignment]
+        Returns:
+            A list of :class:`Market` objects, in page order.
+        """
+        page_limit = limit or 50
+        return await _collect_all_async(
+            lambda offset: self.list(
+                source=source,
+                category=category,
+                status=status,
+                q=q,
+                limit=page_limit,
+                offset=offset,
+            ),
+            max_items,
+            pages_in_flight,
+        )
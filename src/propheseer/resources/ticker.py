@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
-from propheseer._response import APIResponse
+from propheseer._response import APIResponse, _parse_list_response
+from propheseer._utils import build_query
 from propheseer.types.ticker import TickerItem
 
 if TYPE_CHECKING:
@@ -40,16 +41,13 @@ class SyncTicker:
             for item in result.data:
                 print(f"{item.question}: {item.probability:.0%}")
         """
-        query: Dict[str, Any] = {
-            "limit": limit,
-        }
+        query = build_query(limit=limit)
 
         raw, rate_limit, response = self._client._request(
-            "GET", "/v1/public/ticker", query=query, auth=False
+            "GET", "/v1/public/ticker", query=query, auth=False, transform_keys=False
         )
 
-        data = [TickerItem.from_dict(t) for t in raw.get("data", [])]
-        return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+        return _parse_list_response(raw, rate_limit, response, TickerItem.from_dict)
 
 
 class AsyncTicker:
@@ -75,13 +73,10 @@ class AsyncTicker:
             An :class:`APIResponse` containing a list of :class:`TickerItem`
             objects.
         """
-        query: Dict[str, Any] = {
-            "limit": limit,
-        }
+        query = build_query(limit=limit)
 
         raw, rate_limit, response = await self._client._request(
-            "GET", "/v1/public/ticker", query=query, auth=False
+            "GET", "/v1/public/ticker", query=query, auth=False, transform_keys=False
         )
 
-        data = [TickerItem.from_dict(t) for t in raw.get("data", [])]
-        return APIResponse(data=data, rate_limit=rate_limit, http_response=response)
+        return _parse_list_response(raw, rate_limit, response, TickerItem.from_dict)
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any, AsyncGenerator, Dict, Generator, Optional, TYPE_CHECKING
-
-from propheseer._pagination import PaginationMeta, SyncPage, AsyncPage
+from typing import AsyncGenerator, Generator, List, Optional, TYPE_CHECKING
+
+from propheseer._constants import DEFAULT_PAGES_IN_FLIGHT
+from propheseer._pagination import (
+    AsyncPage,
+    PaginationMeta,
+    SyncPage,
+    _auto_paginate,
+    _auto_paginate_async,
+    _collect_all,
+    _collect_all_async,
+)
+from propheseer._utils import build_query
 from propheseer.types.unusual_trades import UnusualTrade, UnusualTradeListParams
 
 if TYPE_CHECKING:
@@ -57,23 +67,23 @@ class SyncUnusualTrades:
             for trade in page.data:
                 print(f"${trade.trade.usdc_value} on {trade.market.question}")
         """
-        query: Dict[str, Any] = {
-            "limit": limit,
-            "offset": offset,
-            "market_id": market_id,
-            "reason": reason,
-            "min_score": min_score,
-            "since": since,
-            "side": side,
-            "source": source,
-            "exclude_categories": exclude_categories,
-        }
+        query = build_query(
+            limit=limit,
+            offset=offset,
+            market_id=market_id,
+            reason=reason,
+            min_score=min_score,
+            since=since,
+            side=side,
+            source=source,
+            exclude_categories=exclude_categories,
+        )
 
         raw, rate_limit, response = self._client._request(
-            "GET", "/v1/unusual-trades", query=query
+            "GET", "/v1/unusual-trades", query=query, transform_keys=False
         )
 
-        data = [UnusualTrade.from_dict(t) for t in raw.get("data", [])]
+        data = list(map(UnusualTrade.from_dict, raw.get("data") or ()))
         meta = PaginationMeta.from_dict(raw.get("meta", {}))
         return SyncPage(data, meta, rate_limit)
 
@@ -89,6 +99,7 @@ class SyncUnusualTrades:
         source: Optional[str] = None,
         exclude_categories: Optional[str] = None,
         max_items: Optional[int] = None,
+        pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
     ) -> Generator[UnusualTrade, None, None]:
         """Auto-paginate through all unusual trades matching the query.
 
@@ -102,16 +113,16 @@ class SyncUnusualTrades:
             source: Filter by source platform.
             exclude_categories: Categories to exclude.
             max_items: Maximum total items to yield.
+            pages_in_flight: Pages fetched or held at once, counting the one
+                being iterated (default: 4). Pass ``1`` to fetch each page
+                only after the previous one is consumed.
 
         Yields:
             Individual :class:`UnusualTrade` objects.
         """
         page_limit = limit or 50
-        offset = 0
-        yielded = 0
-
-        while True:
-            page = self.list(
+        yield from _auto_paginate(
+            lambda offset: self.list(
                 limit=page_limit,
                 offset=offset,
                 market_id=market_id,
@@ -121,18 +132,60 @@ class SyncUnusualTrades:
                 side=side,
                 source=source,
                 exclude_categories=exclude_categories,
-            )
+            ),
+            max_items,
+            pages_in_flight,
+        )
 
-            for item in page.data:
-                yield item
-                yielded += 1
-                if max_items and yielded >= max_items:
-                    return
+    def list_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        market_id: Optional[str] = None,
+        reason: Optional[str] = None,
+        min_score: Optional[float] = None,
+        since: Optional[str] = None,
+        side: Optional[str] = None,
+        source: Optional[str] = None,
+        exclude_categories: Optional[str] = None,
+        max_items: Optional[int] = None,
+        pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
+    ) -> List[UnusualTrade]:
+        """Fetch all unusual trades matching the query into one list.
 
-            if not page.has_more() or len(page.data) == 0:
-                return
+        Args:
+            limit: Page size (default: 50).
+            market_id: Filter by market ID.
+            reason: Filter by detection reason.
+            min_score: Minimum anomaly score.
+            since: Only trades since this date (ISO 8601).
+            side: Filter by trade side.
+            source: Filter by source platform.
+            exclude_categories: Categories to exclude.
+            max_items: Maximum total items to return.
+            pages_in_flight: Pages fetched or held at once, counting the one
+                being iterated (default: 4). Pass ``1`` to fetch each page
+                only after the previous one is consumed.
 
-            offset = page.next_offset()  # type: ignore[assignment]
+        Returns:
+            A list of :class:`UnusualTrade` objects, in page order.
+        """
+        page_limit = limit or 50
+        return _collect_all(
+            lambda offset: self.list(
+                limit=page_limit,
+                offset=offset,
+                market_id=market_id,
+                reason=reason,
+                min_score=min_score,
+                since=since,
+                side=side,
+                source=source,
+                exclude_categories=exclude_categories,
+            ),
+            max_items,
+            pages_in_flight,
+        )
 
 
 class AsyncUnusualTrades:
@@ -175,23 +228,23 @@ class AsyncUnusualTrades:
         Returns:
             An :class:`AsyncPage` of :class:`UnusualTrade` objects.
         """
-        query: Dict[str, Any] = {
-            "limit": limit,
-            "offset": offset,
-            "market_id": market_id,
-            "reason": reason,
-            "min_score": min_score,
-            "since": since,
-            "side": side,
-            "source": source,
-            "exclude_categories": exclude_categories,
-        }
+        query = build_query(
+            limit=limit,
+            offset=offset,
+            market_id=market_id,
+            reason=reason,
+            min_score=min_score,
+            since=since,
+            side=side,
+            source=source,
+            exclude_categories=exclude_categories,
+        )
 
         raw, rate_limit, response = await self._client._request(
-            "GET", "/v1/unusual-trades", query=query
+            "GET", "/v1/unusual-trades", query=query, transform_keys=False
         )
 
-        data = [UnusualTrade.from_dict(t) for t in raw.get("data", [])]
+        data = list(map(UnusualTrade.from_dict, raw.get("data") or ()))
         meta = PaginationMeta.from_dict(raw.get("meta", {}))
         return AsyncPage(data, meta, rate_limit)
 
@@ -207,6 +260,7 @@ class AsyncUnusualTrades:
         source: Optional[str] = None,
         exclude_categories: Optional[str] = None,
         max_items: Optional[int] = None,
+        pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
     ) -> AsyncGenerator[UnusualTrade, None]:
         """Auto-paginate through all unusual trades matching the query.
 
@@ -214,11 +268,8 @@ class AsyncUnusualTrades:
             Individual :class:`UnusualTrade` objects.
         """
         page_limit = limit or 50
-        offset = 0
-        yielded = 0
-
-        while True:
-            page = await self.list(
+        pages = _auto_paginate_async(
+            lambda offset: self.list(
                 limit=page_limit,
                 offset=offset,
                 market_id=market_id,
@@ -228,15 +279,48 @@ class AsyncUnusualTrades:
                 side=side,
                 source=source,
                 exclude_categories=exclude_categories,
-            )
-
-            for item in page.data:
+            ),
+            max_items,
+            pages_in_flight,
+        )
+        try:
+            async for item in pages:
                 yield item
-                yielded += 1
-                if max_items and yielded >= max_items:
-                    return
+        finally:
+            await pages.aclose()
 
-            if not page.has_more() or len(page.data) == 0:
-                return
+    async def list_all(
+        self,
+        *,
+        limit: Optional[int] = None,
+        market_id: Optional[str] = None,
+        reason: Optional[str] = None,
+        min_score: Optional[float] = None,
+        since: Optional[str] = None,
+        side: Optional[str] = None,
+        source: Optional[str] = None,
+        exclude_categories: Optional[str] = None,
+        max_items: Optional[int] = None,
+        pages_in_flight: int = DEFAULT_PAGES_IN_FLIGHT,
+    ) -> List[UnusualTrade]:
+        """Fetch all unusual trades matching the query into one list.
 
-            offset = page.next_offset()  # type: ignore[assignment]
+        Returns:
+            A list of :class:`UnusualTrade` objects, in page order.
+        """
+        page_limit = limit or 50
+        return await _collect_all_async(
+            lambda offset: self.list(
+                limit=page_limit,
+                offset=offset,
+                market_id=market_id,
+                reason=reason,
+                min_score=min_score,
+                since=since,
+                side=side,
+                source=source,
+                exclude_categories=exclude_categories,
+            ),
+            max_items,
+            pages_in_flight,
+        )
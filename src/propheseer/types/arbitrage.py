@@ -5,10 +5,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-from propheseer._base_client import _transform_keys
+from propheseer._base_client import _intern, _pick
+from propheseer._compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ArbitrageMarket:
     """A market involved in an arbitrage opportunity.
 
@@ -25,15 +26,15 @@ class ArbitrageMarket:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ArbitrageMarket":
         """Create an ArbitrageMarket from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
+        get = data.get
         return cls(
-            source=transformed.get("source", ""),
-            yes_price=transformed.get("yes_price", 0.0),
-            url=transformed.get("url", ""),
+            source=_intern(get("source", "")),
+            yes_price=_pick(data, "yesPrice", "yes_price", 0.0),
+            url=get("url", ""),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ArbitrageOpportunity:
     """An arbitrage opportunity across platforms.
 
@@ -52,18 +53,18 @@ class ArbitrageOpportunity:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ArbitrageOpportunity":
         """Create an ArbitrageOpportunity from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
-        markets_raw = transformed.get("markets", [])
-        markets = [ArbitrageMarket.from_dict(m) for m in markets_raw]
+        get = data.get
+        markets_raw = get("markets") or ()
+        markets = list(map(ArbitrageMarket.from_dict, markets_raw))
         return cls(
-            question=transformed.get("question", ""),
-            spread=transformed.get("spread", 0.0),
-            potential_return=transformed.get("potential_return", ""),
+            question=get("question", ""),
+            spread=get("spread", 0.0),
+            potential_return=_pick(data, "potentialReturn", "potential_return", ""),
             markets=markets,
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ArbitrageFindParams:
     """Parameters for finding arbitrage opportunities.
 
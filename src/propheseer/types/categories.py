@@ -5,10 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
-from propheseer._base_client import _transform_keys
+from propheseer._compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Category:
     """A market category with its subcategories.
 
@@ -25,9 +25,9 @@ class Category:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Category":
         """Create a Category from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
+        get = data.get
         return cls(
-            id=transformed.get("id", ""),
-            name=transformed.get("name", ""),
-            subcategories=transformed.get("subcategories", []),
+            id=get("id", ""),
+            name=get("name", ""),
+            subcategories=get("subcategories") or [],
         )
@@ -6,9 +6,10 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 from propheseer._base_client import _transform_keys
+from propheseer._compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MarketHistoryEntry:
     """A historical market snapshot.
 
@@ -26,14 +27,15 @@ class MarketHistoryEntry:
     def from_dict(cls, raw: Dict[str, Any]) -> "MarketHistoryEntry":
         """Create from a dictionary, handling camelCase keys."""
         transformed = _transform_keys(raw)
+        get = transformed.get
         return cls(
-            market_id=transformed.get("market_id", ""),
-            snapshot_date=transformed.get("snapshot_date", ""),
+            market_id=get("market_id", ""),
+            snapshot_date=get("snapshot_date", ""),
             data=transformed,
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HistoryListParams:
     """Parameters for listing market history.
 
@@ -52,7 +54,7 @@ class HistoryListParams:
     limit: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SnapshotDate:
     """A date with available snapshot data.
 
@@ -67,7 +69,8 @@ class SnapshotDate:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SnapshotDate":
         """Create from a dictionary."""
+        get = data.get
         return cls(
-            date=data.get("date", ""),
-            count=data.get("count", 0),
+            date=get("date", ""),
+            count=get("count", 0),
         )
@@ -5,10 +5,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-from propheseer._base_client import _transform_keys
+from propheseer._base_client import _pick
+from propheseer._compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class KeyUsage:
     """API key usage statistics.
 
@@ -25,14 +26,15 @@ class KeyUsage:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "KeyUsage":
         """Create from a dictionary."""
+        get = data.get
         return cls(
-            daily=data.get("daily", 0),
-            minute=data.get("minute", 0),
-            total=data.get("total", 0),
+            daily=get("daily", 0),
+            minute=get("minute", 0),
+            total=get("total", 0),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UsageHistoryEntry:
     """Daily usage history entry.
 
@@ -47,13 +49,14 @@ class UsageHistoryEntry:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "UsageHistoryEntry":
         """Create from a dictionary."""
+        get = data.get
         return cls(
-            date=data.get("date", ""),
-            count=data.get("count", 0),
+            date=get("date", ""),
+            count=get("count", 0),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PlanLimits:
     """Plan rate limits.
 
@@ -68,14 +71,15 @@ class PlanLimits:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PlanLimits":
         """Create from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
         return cls(
-            requests_per_day=transformed.get("requests_per_day", 0),
-            requests_per_minute=transformed.get("requests_per_minute", 0),
+            requests_per_day=_pick(data, "requestsPerDay", "requests_per_day", 0),
+            requests_per_minute=_pick(
+                data, "requestsPerMinute", "requests_per_minute", 0
+            ),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class KeyInfo:
     """Information about the current API key.
 
@@ -102,17 +106,17 @@ class KeyInfo:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "KeyInfo":
         """Create from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
-        limits_raw = transformed.get("limits", {})
-        usage_raw = transformed.get("usage", {})
-        history_raw = transformed.get("history", [])
+        get = data.get
+        limits_raw = get("limits") or {}
+        usage_raw = get("usage") or {}
+        history_raw = get("history") or ()
         return cls(
-            id=transformed.get("id", ""),
-            name=transformed.get("name", ""),
-            plan=transformed.get("plan", ""),
+            id=get("id", ""),
+            name=get("name", ""),
+            plan=get("plan", ""),
             limits=PlanLimits.from_dict(limits_raw),
             usage=KeyUsage.from_dict(usage_raw),
-            history=[UsageHistoryEntry.from_dict(h) for h in history_raw],
-            created_at=transformed.get("created_at", ""),
-            last_used_at=transformed.get("last_used_at"),
+            history=list(map(UsageHistoryEntry.from_dict, history_raw)),
+            created_at=_pick(data, "createdAt", "created_at", ""),
+            last_used_at=_pick(data, "lastUsedAt", "last_used_at"),
         )
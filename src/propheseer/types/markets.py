@@ -5,7 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Literal, Optional
 
-from propheseer._base_client import _transform_keys
+from propheseer._base_client import _intern, _pick
+from propheseer._compat import DATACLASS_SLOTS
 
 MarketSource = Literal["polymarket", "kalshi", "gemini"]
 MarketStatus = Literal["open", "closed", "settled"]
@@ -14,7 +15,7 @@ MarketCategory = Literal[
 ]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Outcome:
     """An outcome within a prediction market.
 
@@ -31,15 +32,15 @@ class Outcome:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Outcome":
         """Create an Outcome from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
+        get = data.get
         return cls(
-            name=transformed.get("name", ""),
-            probability=transformed.get("probability", 0.0),
-            volume_24h=transformed.get("volume_24h"),
+            name=_intern(get("name", "")),
+            probability=get("probability", 0.0),
+            volume_24h=_pick(data, "volume24h", "volume_24h"),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Market:
     """A normalized prediction market from any supported platform.
 
@@ -78,28 +79,28 @@ class Market:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Market":
         """Create a Market from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
-        outcomes_raw = transformed.get("outcomes", [])
-        outcomes = [Outcome.from_dict(o) for o in outcomes_raw]
+        get = data.get
+        outcomes_raw = get("outcomes") or ()
+        outcomes = list(map(Outcome.from_dict, outcomes_raw))
         return cls(
-            id=transformed.get("id", ""),
-            source=transformed.get("source", ""),
-            source_id=transformed.get("source_id", ""),
-            question=transformed.get("question", ""),
-            description=transformed.get("description"),
-            category=transformed.get("category", "other"),
-            status=transformed.get("status", "open"),
+            id=get("id", ""),
+            source=_intern(get("source", "")),
+            source_id=_pick(data, "sourceId", "source_id", ""),
+            question=get("question", ""),
+            description=get("description"),
+            category=_intern(get("category", "other")),
+            status=_intern(get("status", "open")),
             outcomes=outcomes,
-            resolution_date=transformed.get("resolution_date"),
-            created_at=transformed.get("created_at", ""),
-            updated_at=transformed.get("updated_at", ""),
-            url=transformed.get("url", ""),
-            image_url=transformed.get("image_url"),
-            tags=transformed.get("tags", []),
+            resolution_date=_pick(data, "resolutionDate", "resolution_date"),
+            created_at=_pick(data, "createdAt", "created_at", ""),
+            updated_at=_pick(data, "updatedAt", "updated_at", ""),
+            url=get("url", ""),
+            image_url=_pick(data, "imageUrl", "image_url"),
+            tags=get("tags") or [],
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MarketListParams:
     """Parameters for listing markets.
 
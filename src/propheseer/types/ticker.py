@@ -5,10 +5,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
-from propheseer._base_client import _transform_keys
+from propheseer._base_client import _intern
+from propheseer._compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TickerItem:
     """A simplified market item for the ticker.
 
@@ -27,16 +28,16 @@ class TickerItem:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TickerItem":
         """Create from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
+        get = data.get
         return cls(
-            id=transformed.get("id", ""),
-            question=transformed.get("question", ""),
-            probability=transformed.get("probability", 0.0),
-            source=transformed.get("source", ""),
+            id=get("id", ""),
+            question=get("question", ""),
+            probability=get("probability", 0.0),
+            source=_intern(get("source", "")),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TickerListParams:
     """Parameters for listing ticker items.
 
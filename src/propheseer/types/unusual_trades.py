@@ -5,7 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Literal, Optional
 
-from propheseer._base_client import _transform_keys
+from propheseer._base_client import _intern, _pick
+from propheseer._compat import DATACLASS_SLOTS
 
 DetectionReason = Literal[
     "potential_insider", "high_amount", "new_wallet", "near_resolution"
@@ -13,7 +14,7 @@ DetectionReason = Literal[
 TradeSide = Literal["BUY", "SELL"]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UnusualTradeMarket:
     """Market information associated with an unusual trade.
 
@@ -38,19 +39,19 @@ class UnusualTradeMarket:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "UnusualTradeMarket":
         """Create from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
+        get = data.get
         return cls(
-            id=transformed.get("id", ""),
-            question=transformed.get("question", ""),
-            source=transformed.get("source", ""),
-            end_date=transformed.get("end_date"),
-            url=transformed.get("url"),
-            tags=transformed.get("tags", []),
-            image_url=transformed.get("image_url"),
+            id=get("id", ""),
+            question=get("question", ""),
+            source=_intern(get("source", "")),
+            end_date=_pick(data, "endDate", "end_date"),
+            url=get("url"),
+            tags=get("tags") or [],
+            image_url=_pick(data, "imageUrl", "image_url"),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TradeDetails:
     """Details of the flagged trade.
 
@@ -75,19 +76,19 @@ class TradeDetails:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TradeDetails":
         """Create from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
+        get = data.get
         return cls(
-            wallet_address=transformed.get("wallet_address", ""),
-            side=transformed.get("side", ""),
-            size=transformed.get("size", 0),
-            price=transformed.get("price", 0.0),
-            usdc_value=transformed.get("usdc_value", 0.0),
-            timestamp=transformed.get("timestamp", ""),
-            transaction_hash=transformed.get("transaction_hash", ""),
+            wallet_address=_pick(data, "walletAddress", "wallet_address", ""),
+            side=_intern(get("side", "")),
+            size=get("size", 0),
+            price=get("price", 0.0),
+            usdc_value=_pick(data, "usdcValue", "usdc_value", 0.0),
+            timestamp=get("timestamp", ""),
+            transaction_hash=_pick(data, "transactionHash", "transaction_hash", ""),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DetectionContext:
     """Market context for the detection.
 
@@ -102,14 +103,13 @@ class DetectionContext:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DetectionContext":
         """Create from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
         return cls(
-            market_avg_size=transformed.get("market_avg_size", 0.0),
-            market_std_dev=transformed.get("market_std_dev", 0.0),
+            market_avg_size=_pick(data, "marketAvgSize", "market_avg_size", 0.0),
+            market_std_dev=_pick(data, "marketStdDev", "market_std_dev", 0.0),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DetectionInfo:
     """Why the trade was flagged.
 
@@ -126,16 +126,16 @@ class DetectionInfo:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DetectionInfo":
         """Create from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
-        context_raw = transformed.get("context", {})
+        get = data.get
+        context_raw = get("context") or {}
         return cls(
-            reason=transformed.get("reason", ""),
-            anomaly_score=transformed.get("anomaly_score", 0.0),
+            reason=_intern(get("reason", "")),
+            anomaly_score=_pick(data, "anomalyScore", "anomaly_score", 0.0),
             context=DetectionContext.from_dict(context_raw),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UnusualTrade:
     """An unusual trade detected by the system.
 
@@ -156,17 +156,17 @@ class UnusualTrade:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "UnusualTrade":
         """Create from a dictionary, handling camelCase keys."""
-        transformed = _transform_keys(data)
+        get = data.get
         return cls(
-            id=transformed.get("id", ""),
-            market=UnusualTradeMarket.from_dict(transformed.get("market", {})),
-            trade=TradeDetails.from_dict(transformed.get("trade", {})),
-            detection=DetectionInfo.from_dict(transformed.get("detection", {})),
-            detected_at=transformed.get("detected_at", ""),
+            id=get("id", ""),
+            market=UnusualTradeMarket.from_dict(get("market") or {}),
+            trade=TradeDetails.from_dict(get("trade") or {}),
+            detection=DetectionInfo.from_dict(get("detection") or {}),
+            detected_at=_pick(data, "detectedAt", "detected_at", ""),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UnusualTradeListParams:
     """Parameters for listing unusual trades.
 
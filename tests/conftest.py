@@ -2,28 +2,104 @@
 
 from __future__ import annotations
 
+import inspect
+import json
+from typing import AsyncIterator, Awaitable, Iterator, List, Tuple, TypeVar, Union
+
+import httpx
 import pytest
+import pytest_asyncio
 import respx
 
 from propheseer import Propheseer, AsyncPropheseer
+from propheseer._response import parse_rate_limit_headers
+from propheseer.types.markets import Market
 
 
-@pytest.fixture
-def client() -> Propheseer:
-    """Create a sync Propheseer client for testing."""
-    return Propheseer(
+@pytest.fixture(autouse=True, scope="session")
+def _clear_api_key_env() -> Iterator[None]:
+    """Run the suite without a real PROPHESEER_API_KEY from the environment.
+
+    Tests that need the variable set it with their own ``monkeypatch``.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("PROPHESEER_API_KEY", raising=False)
+        yield
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _respx_router() -> Iterator[None]:
+    """Patch httpx with the global respx router once for the whole run.
+
+    Tests register routes with ``respx.get(...)`` directly; there is no need
+    to wrap each one in ``@respx.mock``.
+    """
+    respx.mock.start()
+    yield
+    respx.mock.stop(quiet=True)
+
+
+@pytest.fixture(autouse=True)
+def _reset_respx_routes() -> Iterator[None]:
+    """Drop the routes and call history a test left on the global router."""
+    yield
+    respx.mock.clear()
+    respx.mock.reset()
+
+
+@pytest.fixture(scope="class")
+def client() -> Iterator[Propheseer]:
+    """Create a sync Propheseer client shared by the tests in a class.
+
+    respx patches the transport per test, so a single client (and its
+    connection pool) can serve every test while route state stays isolated.
+    """
+    shared = Propheseer(
         api_key="pk_test_123",
         base_url="https://api.propheseer.com",
     )
+    yield shared
+    shared.close()
 
 
-@pytest.fixture
-def async_client() -> AsyncPropheseer:
-    """Create an async Propheseer client for testing."""
-    return AsyncPropheseer(
+@pytest_asyncio.fixture(scope="module")
+async def async_client() -> AsyncIterator[AsyncPropheseer]:
+    """Create an async Propheseer client shared by the tests in a module.
+
+    Async tests and fixtures run on one event loop per module (see
+    ``asyncio_default_*_loop_scope`` in pyproject.toml), so the client
+    stays bound to the loop it was first used on.
+    """
+    shared = AsyncPropheseer(
         api_key="pk_test_123",
         base_url="https://api.propheseer.com",
     )
+    yield shared
+    await shared.close()
+
+
+AnyClient = Union[Propheseer, AsyncPropheseer]
+
+T = TypeVar("T")
+
+
+@pytest.fixture(params=["sync", "async"])
+def any_client(request: pytest.FixtureRequest) -> AnyClient:
+    """The shared sync or async client, for tests that cover both.
+
+    Pair with :func:`resolve`, which awaits a result only when the async
+    client produced a coroutine, so one test body exercises both paths.
+    """
+    name = "client" if request.param == "sync" else "async_client"
+    client: AnyClient = request.getfixturevalue(name)
+    return client
+
+
+async def resolve(result: Union[T, Awaitable[T]]) -> T:
+    """Return ``result``, awaiting it first if it is awaitable."""
+    if inspect.isawaitable(result):
+        return await result
+    return result
 
 
 MOCK_MARKET = {
@@ -46,6 +122,9 @@ MOCK_MARKET = {
     "tags": ["Weather"],
 }
 
+# Parsed once for stub-based tests that don't exercise the parser.
+MOCK_MARKET_MODEL = Market.from_dict(MOCK_MARKET)
+
 MOCK_ARBITRAGE_OPPORTUNITY = {
     "question": "Who will win?",
     "spread": 0.05,
@@ -56,6 +135,15 @@ MOCK_ARBITRAGE_OPPORTUNITY = {
     ],
 }
 
+# Response bodies reused across many tests, serialized once at import.
+MOCK_MARKET_BODY = json.dumps({"data": MOCK_MARKET}).encode()
+EMPTY_PAGE_BODY = json.dumps(
+    {"data": [], "meta": {"total": 0, "limit": 50, "offset": 0}}
+).encode()
+MOCK_MARKET_PAGE_BODY = json.dumps(
+    {"data": [MOCK_MARKET], "meta": {"total": 1, "limit": 50, "offset": 0}}
+).encode()
+
 RATE_LIMIT_HEADERS = {
     "x-ratelimit-plan": "pro",
     "x-billing-type": "subscription",
@@ -64,3 +152,31 @@ RATE_LIMIT_HEADERS = {
     "x-ratelimit-limit-minute": "100",
     "x-ratelimit-remaining-minute": "98",
 }
+
+# What the SDK parses RATE_LIMIT_HEADERS into; stubs that skip HTTP use it.
+RATE_LIMIT_INFO = parse_rate_limit_headers(httpx.Headers(RATE_LIMIT_HEADERS))
+
+
+@pytest.fixture
+def recording_client() -> Iterator[Tuple[Propheseer, List[httpx.Request]]]:
+    """Create a client on an ``httpx.MockTransport`` that records requests.
+
+    The list endpoint answers with an empty page and anything else with
+    ``MOCK_MARKET``. Cheaper than respx for tests that only inspect the
+    outgoing request.
+    """
+    sent: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        if request.url.path == "/v1/markets":
+            return httpx.Response(200, content=EMPTY_PAGE_BODY)
+        return httpx.Response(200, content=MOCK_MARKET_BODY)
+
+    recording = Propheseer(
+        api_key="pk_test_123",
+        base_url="https://api.propheseer.com",
+        transport=httpx.MockTransport(handler),
+    )
+    yield recording, sent
+    recording.close()
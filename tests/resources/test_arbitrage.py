@@ -13,7 +13,6 @@ from tests.conftest import MOCK_ARBITRAGE_OPPORTUNITY
 class TestSyncArbitrage:
     """Tests for the synchronous arbitrage resource."""
 
-    @respx.mock
     def test_find_returns_arbitrage_opportunities(self, client: Propheseer) -> None:
         respx.get("https://api.propheseer.com/v1/arbitrage").mock(
             return_value=httpx.Response(
@@ -36,7 +35,6 @@ class TestSyncArbitrage:
         assert result.data[0].markets[1].source == "kalshi"
         assert result.data[0].markets[1].yes_price == 0.60
 
-    @respx.mock
     def test_find_passes_min_spread_parameter(self, client: Propheseer) -> None:
         route = respx.get("https://api.propheseer.com/v1/arbitrage").mock(
             return_value=httpx.Response(
@@ -51,7 +49,6 @@ class TestSyncArbitrage:
         url = str(request.url)
         assert "min_spread=0.1" in url
 
-    @respx.mock
     def test_find_passes_category_parameter(self, client: Propheseer) -> None:
         route = respx.get("https://api.propheseer.com/v1/arbitrage").mock(
             return_value=httpx.Response(
@@ -66,7 +63,18 @@ class TestSyncArbitrage:
         url = str(request.url)
         assert "category=politics" in url
 
-    @respx.mock
+    def test_find_without_filters_sends_no_query(self, client: Propheseer) -> None:
+        route = respx.get("https://api.propheseer.com/v1/arbitrage").mock(
+            return_value=httpx.Response(
+                200,
+                json={"data": [], "meta": {"total": 0}},
+            )
+        )
+
+        client.arbitrage.find()
+
+        assert str(route.calls[0].request.url) == "https://api.propheseer.com/v1/arbitrage"
+
     def test_throws_permission_denied_for_free_plan(
         self, client: Propheseer
     ) -> None:
@@ -91,8 +99,6 @@ class TestSyncArbitrage:
 class TestAsyncArbitrage:
     """Tests for the asynchronous arbitrage resource."""
 
-    @respx.mock
-    @pytest.mark.asyncio
     async def test_find_returns_arbitrage_opportunities(
         self, async_client: AsyncPropheseer
     ) -> None:
@@ -112,8 +118,6 @@ class TestAsyncArbitrage:
         assert result.data[0].spread == 0.05
         assert result.data[0].potential_return == "5.3%"
 
-    @respx.mock
-    @pytest.mark.asyncio
     async def test_throws_permission_denied_for_free_plan(
         self, async_client: AsyncPropheseer
     ) -> None:
@@ -2,64 +2,67 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
+import sys
+from typing import List, Tuple, Union
 
 import httpx
 import pytest
 import respx
 
-from propheseer import Propheseer, AsyncPropheseer, AuthenticationError
-from propheseer._pagination import SyncPage, AsyncPage
-from tests.conftest import MOCK_MARKET, RATE_LIMIT_HEADERS
+from propheseer import Propheseer, AsyncPropheseer, AuthenticationError, NotFoundError
+from propheseer._base_client import _transform_keys
+from propheseer._pagination import AsyncPage, PaginationMeta, SyncPage
+from propheseer.resources.markets import _market_path
+from propheseer.types.markets import Market
+from tests.conftest import (
+    AnyClient,
+    MOCK_MARKET,
+    MOCK_MARKET_BODY,
+    MOCK_MARKET_MODEL,
+    MOCK_MARKET_PAGE_BODY,
+    RATE_LIMIT_HEADERS,
+    RATE_LIMIT_INFO,
+    resolve,
+)
+
+
+# Routes shared by the markets tests, declared once. Used as a decorator it
+# starts per test and rolls back any routes a test adds on top.
+markets_api = respx.mock(
+    base_url="https://api.propheseer.com", assert_all_called=False
+)
+markets_api.get("/v1/markets", name="list").mock(
+    return_value=httpx.Response(
+        200, content=MOCK_MARKET_PAGE_BODY, headers=RATE_LIMIT_HEADERS
+    )
+)
+markets_api.get("/v1/markets/pm_123", name="get").mock(
+    return_value=httpx.Response(200, content=MOCK_MARKET_BODY)
+)
+
+
+@pytest.mark.parametrize(
+    "market_id,path",
+    [
+        ("pm_12345", "/v1/markets/pm_12345"),
+        ("ks_A-1.b~c", "/v1/markets/ks_A-1.b~c"),
+        ("pm/1 2", "/v1/markets/pm%2F1%202"),
+        ("gm_é", "/v1/markets/gm_%C3%A9"),
+    ],
+)
+def test_market_path(market_id: str, path: str) -> None:
+    assert _market_path(market_id) == path
 
 
 class TestSyncMarkets:
     """Tests for the synchronous markets resource."""
 
-    @respx.mock
-    def test_list_returns_page_of_markets(self, client: Propheseer) -> None:
-        respx.get("https://api.propheseer.com/v1/markets").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [MOCK_MARKET],
-                    "meta": {"total": 1, "limit": 50, "offset": 0},
-                },
-                headers=RATE_LIMIT_HEADERS,
-            )
-        )
-
-        page = client.markets.list()
-
-        assert isinstance(page, SyncPage)
-        assert len(page.data) == 1
-        assert page.data[0].id == "pm_123"
-        assert page.data[0].source == "polymarket"
-        assert page.data[0].source_id == "123"
-        assert page.data[0].question == "Will it rain tomorrow?"
-        assert page.data[0].description is None
-        assert page.data[0].category == "science"
-        assert page.data[0].status == "open"
-        assert len(page.data[0].outcomes) == 2
-        assert page.data[0].outcomes[0].name == "Yes"
-        assert page.data[0].outcomes[0].probability == 0.65
-        assert page.data[0].outcomes[0].volume_24h == 50000
-        assert page.data[0].url == "https://polymarket.com/event/rain"
-        assert page.data[0].image_url is None
-        assert page.data[0].tags == ["Weather"]
-        assert page.meta.total == 1
-        assert page.rate_limit is not None
-        assert page.rate_limit.plan == "pro"
-        assert page.rate_limit.remaining_day == 9999
-
-    @respx.mock
-    def test_list_passes_query_parameters(self, client: Propheseer) -> None:
-        route = respx.get("https://api.propheseer.com/v1/markets").mock(
-            return_value=httpx.Response(
-                200,
-                json={"data": [], "meta": {"total": 0, "limit": 10, "offset": 0}},
-            )
-        )
+    def test_list_passes_query_parameters(
+        self, recording_client: Tuple[Propheseer, List[httpx.Request]]
+    ) -> None:
+        client, sent = recording_client
 
         client.markets.list(
             source="kalshi",
@@ -70,42 +73,75 @@ class TestSyncMarkets:
             offset=5,
         )
 
-        request = route.calls[0].request
-        url = str(request.url)
-        assert "source=kalshi" in url
-        assert "category=politics" in url
-        assert "status=open" in url
-        assert "q=election" in url
-        assert "limit=10" in url
-        assert "offset=5" in url
-
-    @respx.mock
-    def test_get_returns_single_market(self, client: Propheseer) -> None:
-        respx.get("https://api.propheseer.com/v1/markets/pm_123").mock(
-            return_value=httpx.Response(
-                200,
-                json={"data": MOCK_MARKET},
-            )
-        )
+        assert dict(sent[0].url.params) == {
+            "source": "kalshi",
+            "category": "politics",
+            "status": "open",
+            "q": "election",
+            "limit": "10",
+            "offset": "5",
+        }
+
+    def test_list_encodes_query_parameters(
+        self, recording_client: Tuple[Propheseer, List[httpx.Request]]
+    ) -> None:
+        client, sent = recording_client
 
-        result = client.markets.get("pm_123")
+        client.markets.list(q="rain & snow=yes")
 
-        assert result.data.id == "pm_123"
-        assert result.data.question == "Will it rain tomorrow?"
+        assert sent[0].url.params["q"] == "rain & snow=yes"
+        assert "status" not in sent[0].url.params
 
-    @respx.mock
-    def test_get_encodes_market_id(self, client: Propheseer) -> None:
-        route = respx.get(
-            "https://api.propheseer.com/v1/markets/pm_special%2Fid"
-        ).mock(
-            return_value=httpx.Response(200, json={"data": MOCK_MARKET})
-        )
+    def test_list_only_passes_set_filters(
+        self, client: Propheseer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        queries = []
+
+        def fake_request(method: str, path: str, **kwargs: object) -> tuple:
+            queries.append(kwargs["query"])
+            return {"data": [], "meta": {}}, None, None
+
+        monkeypatch.setattr(client, "_request", fake_request)
+        client.markets.list(source="kalshi", limit=10)
+
+        assert queries == [{"source": "kalshi", "limit": 10}]
+
+    def test_get_encodes_market_id(
+        self, recording_client: Tuple[Propheseer, List[httpx.Request]]
+    ) -> None:
+        client, sent = recording_client
 
         client.markets.get("pm_special/id")
 
-        assert route.called
+        assert sent[0].url.raw_path == b"/v1/markets/pm_special%2Fid"
+
+    @markets_api
+    def test_get_many_raises_first_error(self, client: Propheseer) -> None:
+        markets_api.get("/v1/markets/pm_missing").mock(
+            return_value=httpx.Response(404, json={"error": "Not found"})
+        )
+
+        with pytest.raises(NotFoundError):
+            client.markets.get_many(["pm_123", "pm_missing"])
+
+    def test_get_raises_not_found_with_response_headers(
+        self, client: Propheseer
+    ) -> None:
+        respx.get("https://api.propheseer.com/v1/markets/pm_missing").mock(
+            return_value=httpx.Response(
+                404,
+                json={"error": "Market not found"},
+                headers={"X-Request-Id": "req_1"},
+            )
+        )
+
+        with pytest.raises(NotFoundError) as exc_info:
+            client.markets.get("pm_missing")
+
+        assert exc_info.value.message == "Market not found"
+        assert exc_info.value.headers is not None
+        assert exc_info.value.headers["x-request-id"] == "req_1"
 
-    @respx.mock
     def test_list_auto_paginate(self, client: Propheseer) -> None:
         # Page 1
         respx.get(
@@ -141,7 +177,6 @@ class TestSyncMarkets:
         assert results[0].id == "pm_123"
         assert results[1].id == "pm_456"
 
-    @respx.mock
     def test_list_auto_paginate_max_items(self, client: Propheseer) -> None:
         respx.get("https://api.propheseer.com/v1/markets").mock(
             return_value=httpx.Response(
@@ -157,86 +192,158 @@ class TestSyncMarkets:
 
         assert len(results) == 1
 
-    def test_list_throws_auth_error_without_key(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.delenv("PROPHESEER_API_KEY", raising=False)
-        client = Propheseer()
-        with pytest.raises(AuthenticationError):
-            client.markets.list()
-
-
-class TestAsyncMarkets:
-    """Tests for the asynchronous markets resource."""
+    def test_list_auto_paginate_serial_stops_with_the_caller(self) -> None:
+        offsets: List[str] = []
 
-    @respx.mock
-    @pytest.mark.asyncio
-    async def test_list_returns_async_page(
-        self, async_client: AsyncPropheseer
-    ) -> None:
-        respx.get("https://api.propheseer.com/v1/markets").mock(
-            return_value=httpx.Response(
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = request.url.params["offset"]
+            offsets.append(offset)
+            return httpx.Response(
                 200,
                 json={
-                    "data": [MOCK_MARKET],
-                    "meta": {"total": 1, "limit": 50, "offset": 0},
+                    "data": [{**MOCK_MARKET, "id": f"pm_{offset}"}],
+                    "meta": {"total": 10, "limit": 1, "offset": int(offset)},
                 },
-                headers=RATE_LIMIT_HEADERS,
             )
+
+        client = Propheseer(
+            api_key="pk_test_123", transport=httpx.MockTransport(handler)
         )
+        markets = client.markets.list_auto_paginate(limit=1, pages_in_flight=1)
+        assert next(markets).id == "pm_0"
+        markets.close()
+        client.close()
+
+        assert offsets == ["0"]
+
+    def test_list_all(self) -> None:
+        bodies = {
+            str(offset): json.dumps(
+                {
+                    "data": [
+                        {**MOCK_MARKET, "id": f"pm_{offset}"},
+                        {**MOCK_MARKET, "id": f"pm_{offset + 1}"},
+                    ],
+                    "meta": {"total": 4, "limit": 2, "offset": offset},
+                }
+            ).encode()
+            for offset in (0, 2)
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=bodies[request.url.params["offset"]])
+
+        client = Propheseer(
+            api_key="pk_test_123", transport=httpx.MockTransport(handler)
+        )
+        markets = client.markets.list_all(limit=2, max_items=3)
+        client.close()
 
-        page = await async_client.markets.list()
+        assert [m.id for m in markets] == ["pm_0", "pm_1", "pm_2"]
 
-        assert isinstance(page, AsyncPage)
+    def test_list_throws_auth_error_without_key(self) -> None:
+        client = Propheseer()
+        with pytest.raises(AuthenticationError):
+            client.markets.list()
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_parsed_markets_have_no_instance_dict(self) -> None:
+        market = Market.from_dict(MOCK_MARKET)
+        assert not hasattr(market, "__dict__")
+        assert not hasattr(market.outcomes[0], "__dict__")
+
+    def test_from_dict_interns_enum_like_fields(self) -> None:
+        first = Market.from_dict(json.loads(json.dumps(MOCK_MARKET)))
+        second = Market.from_dict(json.loads(json.dumps(MOCK_MARKET)))
+        assert first.source is second.source
+        assert first.status is second.status
+        assert first.outcomes[0].name is second.outcomes[0].name
+
+    def test_from_dict_treats_null_lists_as_empty(self) -> None:
+        market = Market.from_dict({**MOCK_MARKET, "tags": None, "outcomes": None})
+        assert market.tags == []
+        assert market.outcomes == []
+
+    def test_from_dict_accepts_snake_case_keys(self) -> None:
+        camel = Market.from_dict(MOCK_MARKET)
+        snake = Market.from_dict(_transform_keys(MOCK_MARKET))
+        assert snake == camel
+
+
+class TestMarkets:
+    """Tests run against both the sync and async markets resources."""
+
+    @markets_api
+    async def test_list_returns_page_of_markets(self, any_client: AnyClient) -> None:
+        page: Union[SyncPage[Market], AsyncPage[Market]] = await resolve(
+            any_client.markets.list()
+        )
+
+        expected = AsyncPage if isinstance(any_client, AsyncPropheseer) else SyncPage
+        assert isinstance(page, expected)
         assert len(page.data) == 1
         assert page.data[0].id == "pm_123"
+        assert page.data[0].source == "polymarket"
         assert page.data[0].source_id == "123"
+        assert page.data[0].question == "Will it rain tomorrow?"
+        assert page.data[0].description is None
+        assert page.data[0].category == "science"
+        assert page.data[0].status == "open"
+        assert len(page.data[0].outcomes) == 2
+        assert page.data[0].outcomes[0].name == "Yes"
+        assert page.data[0].outcomes[0].probability == 0.65
+        assert page.data[0].outcomes[0].volume_24h == 50000
+        assert page.data[0].url == "https://polymarket.com/event/rain"
+        assert page.data[0].image_url is None
+        assert page.data[0].tags == ["Weather"]
+        assert page.meta.total == 1
+        assert page.rate_limit is not None
+        assert page.rate_limit.plan == "pro"
+        assert page.rate_limit.remaining_day == 9999
 
-    @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_returns_single_market(
-        self, async_client: AsyncPropheseer
-    ) -> None:
-        respx.get("https://api.propheseer.com/v1/markets/pm_123").mock(
-            return_value=httpx.Response(200, json={"data": MOCK_MARKET})
-        )
-
-        result = await async_client.markets.get("pm_123")
+    @markets_api
+    async def test_get_returns_single_market(self, any_client: AnyClient) -> None:
+        result = await resolve(any_client.markets.get("pm_123"))
 
         assert result.data.id == "pm_123"
         assert result.data.question == "Will it rain tomorrow?"
 
-    @respx.mock
-    @pytest.mark.asyncio
-    async def test_list_auto_paginate(
-        self, async_client: AsyncPropheseer
-    ) -> None:
-        respx.get(
-            "https://api.propheseer.com/v1/markets",
-            params__contains={"offset": "0"},
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [MOCK_MARKET],
-                    "meta": {"total": 2, "limit": 1, "offset": 0},
-                },
-            )
-        )
-        market2 = {**MOCK_MARKET, "id": "pm_456"}
-        respx.get(
-            "https://api.propheseer.com/v1/markets",
-            params__contains={"offset": "1"},
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [market2],
-                    "meta": {"total": 2, "limit": 1, "offset": 1},
-                },
+    async def test_get_many_returns_markets_by_id(self, any_client: AnyClient) -> None:
+        for market_id in ("pm_123", "pm_456"):
+            respx.get(f"https://api.propheseer.com/v1/markets/{market_id}").mock(
+                return_value=httpx.Response(
+                    200, json={"data": {**MOCK_MARKET, "id": market_id}}
+                )
             )
+
+        markets = await resolve(
+            any_client.markets.get_many(["pm_456", "pm_123", "pm_456"])
         )
 
+        assert list(markets) == ["pm_456", "pm_123"]
+        assert markets["pm_123"].id == "pm_123"
+        assert respx.calls.call_count == 2
+
+
+class TestAsyncMarkets:
+    """Tests for the asynchronous markets resource."""
+
+    async def test_list_auto_paginate(
+        self, async_client: AsyncPropheseer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # The HTTP plumbing is covered by the sync test; stub the page fetch
+        # so only the paginator loop runs here.
+        pages = {
+            0: MOCK_MARKET_MODEL,
+            1: dataclasses.replace(MOCK_MARKET_MODEL, id="pm_456"),
+        }
+
+        async def fake_list(*, offset: int, **kwargs: object) -> AsyncPage[Market]:
+            meta = PaginationMeta(total=2, limit=1, offset=offset)
+            return AsyncPage([pages[offset]], meta, RATE_LIMIT_INFO)
+
+        monkeypatch.setattr(async_client.markets, "list", fake_list)
+
         results = []
         async for market in async_client.markets.list_auto_paginate(limit=1):
             results.append(market)
@@ -0,0 +1,486 @@
+"""Tests for base client helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from typing import Any, Callable, Iterator, List, Tuple
+
+import httpx
+import pytest
+
+from propheseer import (
+    APIConnectionError,
+    AsyncPropheseer,
+    Propheseer,
+    AuthenticationError,
+    InsufficientCreditsError,
+    InternalServerError,
+    NotFoundError,
+    PermissionDeniedError,
+    PropheseerError,
+    RateLimitError,
+)
+from propheseer._base_client import (
+    _RequestConfig,
+    _camel_to_snake,
+    _classify_response,
+    _get_retry_delay,
+    _map_status_to_error,
+    _intern,
+    _parse_error_body,
+    _pick,
+    _transform_keys,
+)
+
+
+class TestCamelToSnake:
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("sourceId", "source_id"),
+            ("volume24h", "volume_24h"),
+            ("createdAt", "created_at"),
+            ("HTTPResponse", "http_response"),
+            ("imageURL", "image_url"),
+            ("id", "id"),
+            ("already_snake", "already_snake"),
+            ("volume_24h", "volume_24h"),
+            ("snake_case24h", "snake_case_24h"),
+        ],
+    )
+    def test_converts(self, name: str, expected: str) -> None:
+        assert _camel_to_snake(name) == expected
+
+    def test_returns_interned_strings(self) -> None:
+        expected = "".join(["snapshot", "_date"])
+        assert _camel_to_snake("snapshotDate") is sys.intern(expected)
+
+
+class TestTransformKeys:
+    def test_transforms_nested_structures(self) -> None:
+        data = {
+            "sourceId": "123",
+            "outcomes": [{"name": "Yes", "volume24h": 10}],
+            "limits": {"requestsPerDay": 100},
+        }
+        assert _transform_keys(data) == {
+            "source_id": "123",
+            "outcomes": [{"name": "Yes", "volume_24h": 10}],
+            "limits": {"requests_per_day": 100},
+        }
+
+    def test_preserves_key_order_and_list_order(self) -> None:
+        data = [{"bKey": 1, "aKey": [3, {"cKey": 2}, 1]}]
+        result = _transform_keys(data)
+        assert result == [{"b_key": 1, "a_key": [3, {"c_key": 2}, 1]}]
+        assert list(result[0]) == ["b_key", "a_key"]
+
+    def test_does_not_mutate_input(self) -> None:
+        data = {"outcomes": [{"volume24h": 1}]}
+        _transform_keys(data)
+        assert data == {"outcomes": [{"volume24h": 1}]}
+
+    def test_returns_snake_case_input_unchanged(self) -> None:
+        data = {"source_id": "123", "outcomes": [{"volume_24h": 10}]}
+        assert _transform_keys(data) is data
+
+    def test_rebuilds_when_a_nested_key_needs_conversion(self) -> None:
+        data = {"source_id": "123", "outcomes": [{"volume24h": 10}]}
+        result = _transform_keys(data)
+        assert result is not data
+        assert result == {"source_id": "123", "outcomes": [{"volume_24h": 10}]}
+
+    def test_leaves_scalars_untouched(self) -> None:
+        assert _transform_keys("sourceId") == "sourceId"
+        assert _transform_keys(None) is None
+
+
+class TestPick:
+    def test_prefers_camel_case_key(self) -> None:
+        data = {"sourceId": "camel", "source_id": "snake"}
+        assert _pick(data, "sourceId", "source_id") == "camel"
+
+    def test_falls_back_to_snake_case_key(self) -> None:
+        assert _pick({"source_id": "snake"}, "sourceId", "source_id") == "snake"
+
+    def test_keeps_explicit_none(self) -> None:
+        assert _pick({"sourceId": None}, "sourceId", "source_id", "x") is None
+
+    def test_returns_default_when_missing(self) -> None:
+        assert _pick({}, "sourceId", "source_id", "") == ""
+
+
+class TestIntern:
+    def test_interns_strings(self) -> None:
+        value = "".join(["poly", "market"])
+        assert _intern(value) is sys.intern("polymarket")
+
+    def test_passes_non_strings_through(self) -> None:
+        assert _intern(None) is None
+        assert _intern(3) == 3
+
+
+class TestMapStatusToError:
+    @pytest.mark.parametrize(
+        "status,error_class",
+        [
+            (401, AuthenticationError),
+            (402, InsufficientCreditsError),
+            (403, PermissionDeniedError),
+            (404, NotFoundError),
+            (429, RateLimitError),
+            (500, InternalServerError),
+            (503, InternalServerError),
+        ],
+    )
+    def test_maps_status_to_error_class(
+        self, status: int, error_class: type
+    ) -> None:
+        error = _map_status_to_error(status, {"error": "boom"}, httpx.Headers())
+        assert type(error) is error_class
+        assert error.status == status
+        assert error.message == "boom"
+
+    def test_reads_status_specific_fields(self) -> None:
+        body = {"balanceCents": 5, "requiredCents": 10}
+        error = _map_status_to_error(402, body, httpx.Headers())
+        assert isinstance(error, InsufficientCreditsError)
+        assert (error.balance_cents, error.required_cents) == (5, 10)
+
+        error = _map_status_to_error(429, {"retryAfter": 3}, httpx.Headers())
+        assert isinstance(error, RateLimitError)
+        assert error.retry_after == 3
+
+    def test_falls_back_to_base_error(self) -> None:
+        error = _map_status_to_error(418, {"code": "TEAPOT"}, httpx.Headers())
+        assert type(error) is PropheseerError
+        assert error.status == 418
+        assert error.code == "TEAPOT"
+        assert error.message == "API error: 418"
+
+
+class TestClassifyResponse:
+    def test_success_has_no_error(self) -> None:
+        assert _classify_response(httpx.Response(204)) == (None, False)
+
+    @pytest.mark.parametrize(
+        "status,retryable",
+        [(400, False), (401, False), (404, False), (429, True), (500, True), (503, True)],
+    )
+    def test_flags_retryable_statuses(self, status: int, retryable: bool) -> None:
+        error, is_retryable = _classify_response(httpx.Response(status))
+        assert isinstance(error, PropheseerError)
+        assert error.status == status
+        assert is_retryable is retryable
+
+
+class TestParseErrorBody:
+    def test_decodes_json_object(self) -> None:
+        response = httpx.Response(500, json={"error": "boom"})
+        assert _parse_error_body(response) == {"error": "boom"}
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            httpx.Response(502, text="<html>Bad Gateway</html>"),
+            httpx.Response(
+                500,
+                content=b"{not json",
+                headers={"content-type": "application/json"},
+            ),
+            httpx.Response(500, json=["not", "an", "object"]),
+            httpx.Response(500),
+        ],
+    )
+    def test_returns_empty_dict_for_unusable_bodies(
+        self, response: httpx.Response
+    ) -> None:
+        assert _parse_error_body(response) == {}
+
+
+class TestGetRetryDelay:
+    @pytest.mark.parametrize("attempt,base", [(1, 0.25), (2, 0.5), (3, 1.0)])
+    def test_exponential_backoff_with_jitter(self, attempt: int, base: float) -> None:
+        for _ in range(20):
+            delay = _get_retry_delay(attempt)
+            assert base * 0.5 <= delay <= base
+
+    def test_caps_delay(self) -> None:
+        assert _get_retry_delay(20) <= 30.0
+
+    def test_honors_retry_after(self) -> None:
+        err = RateLimitError("slow down", retry_after=7)
+        assert _get_retry_delay(1, err) == 7.0
+
+
+class TestRequest:
+    @pytest.fixture
+    def camel_client(self) -> Propheseer:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"data": {"sourceId": "1"}})
+
+        return Propheseer(api_key="pk_test_123", transport=httpx.MockTransport(handler))
+
+    def test_transforms_keys_by_default(self, camel_client: Propheseer) -> None:
+        data, _, _ = camel_client._request("GET", "/v1/markets")
+        assert data == {"data": {"source_id": "1"}}
+
+    def test_can_skip_key_transform(self, camel_client: Propheseer) -> None:
+        data, _, _ = camel_client._request(
+            "GET", "/v1/markets", transform_keys=False
+        )
+        assert data == {"data": {"sourceId": "1"}}
+
+    def test_sends_json_body_as_content(self) -> None:
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={})
+
+        client = Propheseer(api_key="pk_test_123", transport=httpx.MockTransport(handler))
+        client._request("POST", "/v1/things", body={"name": "é", "n": 1})
+        client._request("GET", "/v1/things")
+
+        assert sent[0].content == '{"name":"é","n":1}'.encode()
+        assert sent[0].headers["content-type"] == "application/json"
+        assert sent[1].content == b""
+
+    def test_close_interrupts_retry_backoff(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            "propheseer._base_client._get_retry_delay", lambda *args: 30.0
+        )
+        client = Propheseer(
+            api_key="pk_test_123",
+            transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+        )
+        threading.Timer(0.05, client.close).start()
+
+        started = time.monotonic()
+        with pytest.raises(APIConnectionError, match="closed"):
+            client._request("GET", "/v1/markets")
+        assert time.monotonic() - started < 5
+
+
+CountingClient = Callable[..., Tuple[Propheseer, List[str]]]
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def counting_client(self) -> Iterator[CountingClient]:
+        """Build clients that count requests; all are closed at teardown."""
+        clients: List[Propheseer] = []
+
+        def build(data: Any = (), **kwargs: Any) -> Tuple[Propheseer, List[str]]:
+            seen: List[str] = []
+
+            def handler(request: httpx.Request) -> httpx.Response:
+                seen.append(request.url.path)
+                return httpx.Response(200, json={"data": list(data), "n": len(seen)})
+
+            client = Propheseer(
+                api_key="pk_test_123",
+                transport=httpx.MockTransport(handler),
+                **kwargs,
+            )
+            clients.append(client)
+            return client, seen
+
+        yield build
+        for client in clients:
+            client.close()
+
+    def test_disabled_by_default(self, counting_client: CountingClient) -> None:
+        client, seen = counting_client()
+        client.categories.list()
+        client.categories.list()
+        assert seen == ["/v1/categories", "/v1/categories"]
+
+    def test_caches_listed_endpoints(self, counting_client: CountingClient) -> None:
+        client, seen = counting_client(cache=True)
+        first, _, _ = client._request("GET", "/v1/categories")
+        second, _, _ = client._request("GET", "/v1/categories")
+        assert first == second == {"data": [], "n": 1}
+        assert seen == ["/v1/categories"]
+
+    def test_does_not_cache_other_endpoints(
+        self, counting_client: CountingClient
+    ) -> None:
+        client, seen = counting_client(cache=True)
+        client._request("GET", "/v1/markets")
+        client._request("GET", "/v1/markets")
+        assert len(seen) == 2
+
+    def test_keys_on_query_string(self, counting_client: CountingClient) -> None:
+        client, seen = counting_client(cache=True)
+        client.ticker.list(limit=5)
+        client.ticker.list(limit=10)
+        client.ticker.list(limit=5)
+        assert len(seen) == 2
+
+    def test_entries_expire(
+        self, counting_client: CountingClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        client, seen = counting_client(cache=True)
+        now = time.monotonic()
+        monkeypatch.setattr("propheseer._cache.time.monotonic", lambda: now)
+        client._request("GET", "/v1/public/ticker", auth=False)
+        monkeypatch.setattr("propheseer._cache.time.monotonic", lambda: now + 6)
+        client._request("GET", "/v1/public/ticker", auth=False)
+        assert len(seen) == 2
+
+    def test_clear_cache(self, counting_client: CountingClient) -> None:
+        client, seen = counting_client(cache=True)
+        client._request("GET", "/v1/keys/me")
+        client.clear_cache()
+        client._request("GET", "/v1/keys/me")
+        assert len(seen) == 2
+
+    def test_hits_do_not_share_mutable_results(
+        self, counting_client: CountingClient
+    ) -> None:
+        client, seen = counting_client(
+            [{"id": "sci", "name": "Science", "subcategories": ["a"]}], cache=True
+        )
+        client.categories.list().data[0].subcategories.append("MUTATED")
+
+        again = client.categories.list()
+
+        assert again.data[0].subcategories == ["a"]
+        assert seen == ["/v1/categories"]
+
+    async def test_async_client(self) -> None:
+        seen: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            return httpx.Response(200, json={"data": []})
+
+        client = AsyncPropheseer(
+            api_key="pk_test_123", transport=httpx.MockTransport(handler), cache=True
+        )
+        await client.history.dates()
+        await client.history.dates()
+        await client.close()
+        assert seen == ["/v1/markets/history/dates"]
+
+
+class TestThrottle:
+    def test_waits_when_minute_limit_is_used_up(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        waits = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={},
+                headers={
+                    "x-ratelimit-plan": "pro",
+                    "x-ratelimit-limit-minute": "60",
+                    "x-ratelimit-remaining-minute": "0",
+                },
+            )
+
+        client = Propheseer(
+            api_key="pk_test_123", transport=httpx.MockTransport(handler), throttle=True
+        )
+        monkeypatch.setattr(client._stop, "wait", lambda delay: waits.append(delay))
+        client._request("GET", "/v1/markets")
+        client._request("GET", "/v1/markets")
+
+        assert len(waits) == 1
+        assert 0 < waits[0] <= 1.0
+
+    def test_concurrent_requests_queue_behind_each_other(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        waits: List[float] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={},
+                headers={
+                    "x-ratelimit-plan": "pro",
+                    "x-ratelimit-limit-minute": "60",
+                    "x-ratelimit-remaining-minute": "0",
+                },
+            )
+
+        client = Propheseer(
+            api_key="pk_test_123", transport=httpx.MockTransport(handler), throttle=True
+        )
+        monkeypatch.setattr(client._stop, "wait", lambda delay: waits.append(delay))
+        client._request("GET", "/v1/markets")
+        client._request_many([_RequestConfig("GET", "/v1/markets") for _ in range(8)])
+        client.close()
+
+        # Responses arriving mid-batch must not free slots that waiting
+        # requests already hold: at 1 req/s the eight waits are 1s..8s.
+        assert sorted(waits) == pytest.approx(list(range(1, 9)), abs=0.2)
+
+
+class TestRequestMany:
+    async def test_returns_results_and_errors_in_order(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/v1/missing":
+                return httpx.Response(404, json={"error": "Not found"})
+            return httpx.Response(200, json={"path": request.url.path})
+
+        client = AsyncPropheseer(
+            api_key="pk_test_123", transport=httpx.MockTransport(handler)
+        )
+        results = await client._request_many(
+            [
+                _RequestConfig("GET", "/v1/a"),
+                _RequestConfig("GET", "/v1/missing"),
+                _RequestConfig("GET", "/v1/b"),
+            ]
+        )
+
+        assert results[0][0] == {"path": "/v1/a"}  # type: ignore[index]
+        assert isinstance(results[1], NotFoundError)
+        assert results[2][0] == {"path": "/v1/b"}  # type: ignore[index]
+
+    def test_sync_returns_results_and_errors_in_order(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/v1/missing":
+                return httpx.Response(404, json={"error": "Not found"})
+            return httpx.Response(200, json={"path": request.url.path})
+
+        client = Propheseer(api_key="pk_test_123", transport=httpx.MockTransport(handler))
+        results = client._request_many(
+            [_RequestConfig("GET", "/v1/a"), _RequestConfig("GET", "/v1/missing")]
+        )
+
+        assert results[0][0] == {"path": "/v1/a"}  # type: ignore[index]
+        assert isinstance(results[1], NotFoundError)
+        assert client._request_many([]) == []
+
+    async def test_bounds_concurrency(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        client = AsyncPropheseer(
+            api_key="pk_test_123", transport=httpx.MockTransport(handler)
+        )
+        await client._request_many(
+            [_RequestConfig("GET", "/v1/markets") for _ in range(10)],
+            concurrency=3,
+        )
+
+        assert peak == 3
@@ -0,0 +1,38 @@
+"""Tests for the TTL response cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from propheseer._cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_returns_stored_value(self) -> None:
+        cache: TTLCache[int] = TTLCache()
+        cache.set("a", 1, ttl=60)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_expired_entries_are_dropped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache: TTLCache[int] = TTLCache()
+        monkeypatch.setattr("propheseer._cache.time.monotonic", lambda: 100.0)
+        cache.set("a", 1, ttl=5)
+        monkeypatch.setattr("propheseer._cache.time.monotonic", lambda: 105.0)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_oldest_when_full(self) -> None:
+        cache: TTLCache[int] = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.set("c", 3, ttl=60)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_clear(self) -> None:
+        cache: TTLCache[int] = TTLCache()
+        cache.set("a", 1, ttl=60)
+        cache.clear()
+        assert cache.get("a") is None
@@ -4,9 +4,18 @@ from __future__ import annotations
 
 import os
 
+import httpx
 import pytest
+import respx
 
-from propheseer import Propheseer, AsyncPropheseer, AuthenticationError, VERSION
+from propheseer import (
+    Propheseer,
+    AsyncPropheseer,
+    AuthenticationError,
+    VERSION,
+    make_shared_transport,
+    make_shared_async_transport,
+)
 
 
 class TestPropheseerClient:
@@ -55,6 +64,24 @@ class TestPropheseerClient:
         assert client.timeout == 10.0
         assert client.max_retries == 5
 
+    def test_uses_default_connection_limits(self) -> None:
+        client = Propheseer(api_key="pk_test_123")
+        assert client._limits.max_connections == 1000
+        assert client._limits.max_keepalive_connections == 100
+        assert client._limits.keepalive_expiry == 30.0
+
+    def test_allows_custom_connection_limits(self) -> None:
+        client = Propheseer(
+            api_key="pk_test_123",
+            max_connections=20,
+            max_keepalive_connections=5,
+            keepalive_expiry=90.0,
+            http2=False,
+        )
+        assert client._limits.max_connections == 20
+        assert client._limits.max_keepalive_connections == 5
+        assert client._limits.keepalive_expiry == 90.0
+
     def test_reads_api_key_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("PROPHESEER_API_KEY", "pk_env_key")
         client = Propheseer()
@@ -67,16 +94,61 @@ class TestPropheseerClient:
         client = Propheseer(api_key="pk_explicit")
         assert client.api_key == "pk_explicit"
 
-    def test_no_api_key_creates_client(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.delenv("PROPHESEER_API_KEY", raising=False)
+    def test_no_api_key_creates_client(self) -> None:
         client = Propheseer()
         assert client.api_key is None
 
     def test_context_manager(self) -> None:
-        with Propheseer(api_key="pk_test_123") as client:
-            assert client.api_key == "pk_test_123"
+        # Uses its own client: exiting the block closes it, which would break
+        # the class-scoped ``client`` fixture for the tests that follow.
+        client = Propheseer(api_key="pk_test_123")
+        with client as entered:
+            assert entered is client
+        assert client._client.is_closed
+
+    def test_sends_auth_and_user_agent_headers(self, client: Propheseer) -> None:
+        route = respx.get("https://api.propheseer.com/v1/categories").mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+
+        client.categories.list()
+
+        headers = route.calls[0].request.headers
+        assert headers["Authorization"] == "Bearer pk_test_123"
+        assert headers["User-Agent"] == f"propheseer-python/{VERSION}"
+
+    def test_public_endpoints_omit_auth_header(self, client: Propheseer) -> None:
+        route = respx.get("https://api.propheseer.com/v1/public/ticker").mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+
+        client.ticker.list()
+
+        headers = route.calls[0].request.headers
+        assert "Authorization" not in headers
+        assert headers["User-Agent"] == f"propheseer-python/{VERSION}"
+
+    def test_shared_transport_is_reused_and_not_closed(self) -> None:
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"data": []})
+
+        transport = httpx.MockTransport(handler)
+        first = Propheseer(api_key="pk_test_123", transport=transport)
+        second = Propheseer(api_key="pk_test_456", transport=transport)
+
+        first.categories.list()
+        first.close()
+        second.categories.list()
+
+        assert calls == ["/v1/categories", "/v1/categories"]
+
+    def test_make_shared_transport(self) -> None:
+        transport = make_shared_transport(max_connections=5, http2=False)
+        assert isinstance(transport, httpx.HTTPTransport)
+        transport.close()
 
     def test_version_is_set(self) -> None:
         assert VERSION == "1.0.0"
@@ -104,3 +176,25 @@ class TestAsyncPropheseerClient:
         client = AsyncPropheseer(api_key="pk_test_123")
         assert client.timeout == 30.0
         assert client.max_retries == 2
+
+    async def test_shared_transport_is_reused_and_not_closed(self) -> None:
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"data": []})
+
+        transport = httpx.MockTransport(handler)
+        first = AsyncPropheseer(api_key="pk_test_123", transport=transport)
+        second = AsyncPropheseer(api_key="pk_test_456", transport=transport)
+
+        await first.categories.list()
+        await first.close()
+        await second.categories.list()
+
+        assert calls == ["/v1/categories", "/v1/categories"]
+
+    async def test_make_shared_async_transport(self) -> None:
+        transport = make_shared_async_transport(max_connections=5, http2=False)
+        assert isinstance(transport, httpx.AsyncHTTPTransport)
+        await transport.aclose()
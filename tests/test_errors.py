@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import pickle
+import sys
+from typing import Any, Dict, Optional, Type
+
 import pytest
 
 from propheseer import (
@@ -27,106 +31,95 @@ class TestPropheseerError:
 
     def test_repr(self) -> None:
         err = PropheseerError("test", status=400, code="BAD")
-        assert "PropheseerError" in repr(err)
-        assert "400" in repr(err)
-
-
-class TestAuthenticationError:
-    def test_is_401(self) -> None:
-        err = AuthenticationError("bad key")
-        assert err.status == 401
-        assert err.code == "UNAUTHORIZED"
-        assert isinstance(err, PropheseerError)
-        assert isinstance(err, Exception)
-
-    def test_with_headers(self) -> None:
-        err = AuthenticationError("bad key", headers={"x-request-id": "abc"})
-        assert err.headers == {"x-request-id": "abc"}
-
-
-class TestInsufficientCreditsError:
-    def test_is_402(self) -> None:
-        err = InsufficientCreditsError(
-            "no credits",
-            balance_cents=50,
-            required_cents=100,
-        )
-        assert err.status == 402
-        assert err.balance_cents == 50
-        assert err.required_cents == 100
-        assert isinstance(err, PropheseerError)
-
-
-class TestPermissionDeniedError:
-    def test_is_403(self) -> None:
-        err = PermissionDeniedError("upgrade needed", required_plan="pro")
-        assert err.status == 403
-        assert err.required_plan == "pro"
-        assert isinstance(err, PropheseerError)
-
-    def test_default_code(self) -> None:
-        err = PermissionDeniedError("denied")
-        assert err.code == "FORBIDDEN"
-
-    def test_custom_code(self) -> None:
-        err = PermissionDeniedError("denied", code="PLAN_UPGRADE_REQUIRED")
-        assert err.code == "PLAN_UPGRADE_REQUIRED"
-
-
-class TestNotFoundError:
-    def test_is_404(self) -> None:
-        err = NotFoundError("not found")
-        assert err.status == 404
-        assert err.code == "NOT_FOUND"
-        assert isinstance(err, PropheseerError)
-
-
-class TestRateLimitError:
-    def test_is_429(self) -> None:
-        err = RateLimitError("slow down", retry_after=30)
-        assert err.status == 429
-        assert err.retry_after == 30
-        assert err.code == "RATE_LIMITED"
-        assert isinstance(err, PropheseerError)
-
-    def test_no_retry_after(self) -> None:
-        err = RateLimitError("slow down")
-        assert err.retry_after is None
-
+        assert repr(err) == "PropheseerError(message='test', status=400, code='BAD')"
+
+
+@pytest.mark.parametrize(
+    "exc_cls,kwargs,status,code,attrs",
+    [
+        (AuthenticationError, {}, 401, "UNAUTHORIZED", {}),
+        (
+            InsufficientCreditsError,
+            {"balance_cents": 50, "required_cents": 100},
+            402,
+            "INSUFFICIENT_CREDITS",
+            {"balance_cents": 50, "required_cents": 100},
+        ),
+        (
+            PermissionDeniedError,
+            {"required_plan": "pro"},
+            403,
+            "FORBIDDEN",
+            {"required_plan": "pro"},
+        ),
+        (NotFoundError, {}, 404, "NOT_FOUND", {}),
+        (RateLimitError, {"retry_after": 30}, 429, "RATE_LIMITED", {"retry_after": 30}),
+        (RateLimitError, {}, 429, "RATE_LIMITED", {"retry_after": None}),
+        (InternalServerError, {}, 500, "INTERNAL_ERROR", {}),
+        (InternalServerError, {"status": 502}, 502, "INTERNAL_ERROR", {}),
+        (
+            PermissionDeniedError,
+            {"code": "PLAN_UPGRADE_REQUIRED"},
+            403,
+            "PLAN_UPGRADE_REQUIRED",
+            {},
+        ),
+        (APIConnectionError, {}, None, None, {}),
+    ],
+)
+def test_status_code_and_attributes(
+    exc_cls: Type[PropheseerError],
+    kwargs: Dict[str, Any],
+    status: Optional[int],
+    code: Optional[str],
+    attrs: Dict[str, Any],
+) -> None:
+    err = exc_cls("message", **kwargs)
+    assert err.status == status
+    assert err.code == code
+    for name, value in attrs.items():
+        assert getattr(err, name) == value
+    assert isinstance(err, PropheseerError)
 
-class TestInternalServerError:
-    def test_defaults_to_500(self) -> None:
-        err = InternalServerError("server error")
-        assert err.status == 500
-        assert err.code == "INTERNAL_ERROR"
-        assert isinstance(err, PropheseerError)
 
-    def test_accepts_custom_status(self) -> None:
-        err = InternalServerError("bad gateway", status=502)
-        assert err.status == 502
+def test_authentication_error_keeps_headers() -> None:
+    err = AuthenticationError("bad key", headers={"x-request-id": "abc"})
+    assert err.headers == {"x-request-id": "abc"}
 
 
-class TestAPIConnectionError:
-    def test_has_no_status(self) -> None:
-        cause = ConnectionError("ECONNREFUSED")
-        err = APIConnectionError("connection failed", cause=cause)
-        assert err.status is None
-        assert err.cause is cause
-        assert err.__cause__ is cause
-        assert isinstance(err, PropheseerError)
+def test_connection_error_chains_cause() -> None:
+    cause = ConnectionError("ECONNREFUSED")
+    err = APIConnectionError("connection failed", cause=cause)
+    assert err.cause is cause
+    assert err.__cause__ is cause
 
 
 class TestErrorHierarchy:
-    def test_all_errors_extend_propheseer_error(self) -> None:
-        errors = [
-            AuthenticationError(""),
-            InsufficientCreditsError(""),
-            PermissionDeniedError(""),
-            NotFoundError(""),
-            RateLimitError(""),
-            InternalServerError(""),
-            APIConnectionError(""),
-        ]
-        for err in errors:
-            assert isinstance(err, PropheseerError)
-            assert isinstance(err, Exception)
+    def test_slot_attributes_are_not_stored_in_instance_dict(self) -> None:
+        err = RateLimitError("slow down", retry_after=5)
+        assert "retry_after" not in vars(err)
+        assert err.retry_after == 5
+
+    @pytest.mark.parametrize(
+        "err",
+        [
+            PropheseerError("boom", status=418, code="TEAPOT"),
+            InsufficientCreditsError("", balance_cents=5, required_cents=10),
+            PermissionDeniedError("", required_plan="pro"),
+            RateLimitError("", retry_after=30),
+            InternalServerError("", status=503),
+        ],
+    )
+    def test_errors_survive_pickling(self, err: PropheseerError) -> None:
+        if sys.version_info >= (3, 11):
+            err.add_note("n")
+        else:
+            err.__notes__ = ["n"]  # type: ignore[attr-defined]
+        err.request_label = "poll"  # type: ignore[attr-defined]
+        restored = pickle.loads(pickle.dumps(err))
+        assert type(restored) is type(err)
+        assert repr(restored) == repr(err)
+        assert getattr(restored, "__notes__", None) == ["n"]
+        assert restored.request_label == "poll"  # type: ignore[attr-defined]
+        for name in ("balance_cents", "required_cents", "required_plan", "retry_after"):
+            assert getattr(restored, name, None) == getattr(err, name, None)
@@ -0,0 +1,38 @@
+"""Tests for the JSON helpers, under both the orjson and stdlib backends."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from propheseer import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[str]:
+    if request.param == "orjson":
+        if _json.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    yield request.param
+
+
+def test_loads_bytes_and_text(backend: str) -> None:
+    assert _json.loads(b'{"sourceId": "1", "n": [1, 2.5]}') == {
+        "sourceId": "1",
+        "n": [1, 2.5],
+    }
+    assert _json.loads('{"q": "caf\\u00e9"}') == {"q": "café"}
+
+
+def test_dumps_compact_utf8(backend: str) -> None:
+    assert _json.dumps({"name": "é", "n": 1}) == '{"name":"é","n":1}'.encode()
+
+
+def test_round_trip(backend: str) -> None:
+    payload = {"data": [{"id": "pm_1", "tags": [], "price": 0.65, "url": None}]}
+    assert _json.loads(_json.dumps(payload)) == payload
@@ -0,0 +1,27 @@
+"""Tests for the top-level package exports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import propheseer
+
+
+class TestPackageExports:
+    def test_all_exports_resolve(self) -> None:
+        for name in propheseer.__all__:
+            assert getattr(propheseer, name) is not None
+
+    def test_dir_lists_lazy_exports(self) -> None:
+        assert set(propheseer.__all__) <= set(dir(propheseer))
+
+    def test_import_does_not_load_submodules(self) -> None:
+        code = (
+            "import sys, propheseer; "
+            "print('httpx' in sys.modules, 'propheseer._websocket' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "False"]
@@ -2,121 +2,276 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import sys
+import threading
+
 import pytest
 
-from propheseer._pagination import PaginationMeta, SyncPage, AsyncPage
+from propheseer._constants import DEFAULT_PAGES_IN_FLIGHT
+from propheseer._pagination import (
+    AsyncPage,
+    PaginationMeta,
+    SyncPage,
+    _auto_paginate,
+    _auto_paginate_async,
+    _collect_all,
+    _collect_all_async,
+)
+
+ITEMS = list(range(7))
+PAGE_SIZE = 3
+
+
+def _page_at(offset: int) -> SyncPage[int]:
+    return SyncPage(
+        ITEMS[offset : offset + PAGE_SIZE],
+        PaginationMeta(total=len(ITEMS), limit=PAGE_SIZE, offset=offset),
+        None,
+    )
+
+
+# Read-only fixtures shared by the page tests below.
+META_FIRST_OF_THREE = PaginationMeta(total=5, limit=2, offset=0)
+META_ONLY_PAGE = PaginationMeta(total=2, limit=2, offset=0)
+META_LAST_PAGE = PaginationMeta(total=5, limit=2, offset=4)
+META_FULL_PAGE = PaginationMeta(total=3, limit=3, offset=0)
 
 
 class TestSyncPage:
+    first = SyncPage(["a", "b"], META_FIRST_OF_THREE, None)
+    only = SyncPage(["a", "b"], META_ONLY_PAGE, None)
+    last = SyncPage(["e"], META_LAST_PAGE, None)
+
     def test_has_more_returns_true_when_more_items_exist(self) -> None:
-        page = SyncPage(
-            ["a", "b"],
-            PaginationMeta(total=5, limit=2, offset=0),
-            None,
-        )
-        assert page.has_more() is True
+        assert self.first.has_more() is True
 
     def test_has_more_returns_false_when_all_items_returned(self) -> None:
-        page = SyncPage(
-            ["a", "b"],
-            PaginationMeta(total=2, limit=2, offset=0),
-            None,
-        )
-        assert page.has_more() is False
+        assert self.only.has_more() is False
 
     def test_has_more_returns_false_at_last_page(self) -> None:
-        page = SyncPage(
-            ["e"],
-            PaginationMeta(total=5, limit=2, offset=4),
-            None,
-        )
-        assert page.has_more() is False
+        assert self.last.has_more() is False
 
     def test_next_offset_returns_correct_offset(self) -> None:
-        page = SyncPage(
-            ["a", "b"],
-            PaginationMeta(total=5, limit=2, offset=0),
-            None,
-        )
-        assert page.next_offset() == 2
+        assert self.first.next_offset() == 2
 
     def test_next_offset_returns_none_when_no_more_pages(self) -> None:
-        page = SyncPage(
-            ["a", "b"],
-            PaginationMeta(total=2, limit=2, offset=0),
-            None,
-        )
-        assert page.next_offset() is None
+        assert self.only.next_offset() is None
 
     def test_iter(self) -> None:
-        page = SyncPage(
-            ["a", "b", "c"],
-            PaginationMeta(total=3, limit=3, offset=0),
-            None,
-        )
+        page = SyncPage(["a", "b", "c"], META_FULL_PAGE, None)
         assert list(page) == ["a", "b", "c"]
 
     def test_len(self) -> None:
-        page = SyncPage(
-            ["a", "b"],
-            PaginationMeta(total=5, limit=2, offset=0),
-            None,
-        )
-        assert len(page) == 2
+        assert len(self.first) == 2
 
     def test_repr(self) -> None:
-        page = SyncPage(
-            ["a", "b"],
-            PaginationMeta(total=5, limit=2, offset=0),
-            None,
-        )
-        r = repr(page)
-        assert "SyncPage" in r
-        assert "2 items" in r
-        assert "total=5" in r
+        assert repr(self.first) == "SyncPage(data=[...2 items], total=5, offset=0)"
+
+    def test_pages_have_no_instance_dict(self) -> None:
+        meta = META_FIRST_OF_THREE
+        for page in (SyncPage(["a"], meta, None), AsyncPage(["a"], meta, None)):
+            assert not hasattr(page, "__dict__")
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_meta_has_no_instance_dict(self) -> None:
+        assert not hasattr(META_FIRST_OF_THREE, "__dict__")
 
 
 class TestAsyncPage:
+    first = AsyncPage(["a", "b"], META_FIRST_OF_THREE, None)
+    only = AsyncPage(["a", "b"], META_ONLY_PAGE, None)
+
     def test_has_more_returns_true_when_more_items_exist(self) -> None:
-        page = AsyncPage(
-            ["a", "b"],
-            PaginationMeta(total=5, limit=2, offset=0),
-            None,
-        )
-        assert page.has_more() is True
+        assert self.first.has_more() is True
 
     def test_has_more_returns_false_when_all_items_returned(self) -> None:
-        page = AsyncPage(
-            ["a", "b"],
-            PaginationMeta(total=2, limit=2, offset=0),
-            None,
-        )
-        assert page.has_more() is False
+        assert self.only.has_more() is False
 
     def test_next_offset(self) -> None:
-        page = AsyncPage(
-            ["a", "b"],
-            PaginationMeta(total=5, limit=2, offset=0),
-            None,
-        )
-        assert page.next_offset() == 2
+        assert self.first.next_offset() == 2
 
     def test_sync_iter(self) -> None:
-        page = AsyncPage(
-            ["a", "b"],
-            PaginationMeta(total=2, limit=2, offset=0),
-            None,
-        )
-        assert list(page) == ["a", "b"]
+        assert list(self.only) == ["a", "b"]
 
-    @pytest.mark.asyncio
     async def test_async_iter(self) -> None:
-        page = AsyncPage(
-            ["a", "b", "c"],
-            PaginationMeta(total=3, limit=3, offset=0),
-            None,
-        )
+        page = AsyncPage(["a", "b", "c"], META_FULL_PAGE, None)
         results = []
         async for item in page:
             results.append(item)
         assert results == ["a", "b", "c"]
+
+
+class TestPaginationMeta:
+    def test_from_dict(self) -> None:
+        meta = PaginationMeta.from_dict(
+            {"total": 10, "limit": 5, "offset": 5, "sources": {"kalshi": 3}}
+        )
+        assert meta == PaginationMeta(
+            total=10, limit=5, offset=5, sources={"kalshi": 3}
+        )
+
+    def test_from_dict_defaults_missing_and_null_counts(self) -> None:
+        meta = PaginationMeta.from_dict({"total": None})
+        assert meta == PaginationMeta(total=0, limit=0, offset=0, sources=None)
+
+    def test_is_frozen(self) -> None:
+        meta = PaginationMeta(total=1, limit=1, offset=0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            meta.total = 2  # type: ignore[misc]
+
+
+class TestAutoPaginate:
+    def test_yields_all_items_across_pages(self) -> None:
+        offsets: list = []
+
+        def fetch(offset: int) -> SyncPage[int]:
+            offsets.append(offset)
+            return _page_at(offset)
+
+        assert list(_auto_paginate(fetch)) == ITEMS
+        assert offsets == [0, 3, 6]
+
+    def test_fetches_remaining_pages_before_first_is_consumed(self) -> None:
+        offsets: list = []
+        # Both follow-up fetches and the test meet here, so the barrier only
+        # breaks once they are running side by side.
+        prefetched = threading.Barrier(3, timeout=1)
+
+        def fetch(offset: int) -> SyncPage[int]:
+            offsets.append(offset)
+            if offset:
+                prefetched.wait()
+            return _page_at(offset)
+
+        items = _auto_paginate(fetch)
+        assert next(items) == 0
+        prefetched.wait()
+        assert sorted(offsets) == [0, 3, 6]
+        items.close()
+
+    def test_bounds_pages_in_flight(self) -> None:
+        offsets: list = []
+        in_flight = threading.Barrier(DEFAULT_PAGES_IN_FLIGHT, timeout=1)
+        release = threading.Event()
+
+        def fetch(offset: int) -> SyncPage[int]:
+            offsets.append(offset)
+            if offset and not release.is_set():
+                in_flight.wait()
+                release.wait(1)
+            return SyncPage(
+                [offset], PaginationMeta(total=100, limit=1, offset=offset), None
+            )
+
+        items = _auto_paginate(fetch)
+        assert next(items) == 0
+        in_flight.wait()
+        assert len(offsets) == DEFAULT_PAGES_IN_FLIGHT
+        release.set()
+        assert list(items) == list(range(1, 100))
+
+    def test_one_page_in_flight_fetches_serially(self) -> None:
+        offsets: list = []
+
+        def fetch(offset: int) -> SyncPage[int]:
+            offsets.append(offset)
+            return _page_at(offset)
+
+        items = _auto_paginate(fetch, pages_in_flight=1)
+        assert [next(items) for _ in range(PAGE_SIZE)] == [0, 1, 2]
+        assert offsets == [0]
+        assert next(items) == 3
+        assert offsets == [0, 3]
+        items.close()
+        assert offsets == [0, 3]
+        assert list(_auto_paginate(fetch, pages_in_flight=1)) == ITEMS
+
+    def test_rejects_empty_window(self) -> None:
+        with pytest.raises(ValueError, match="pages_in_flight"):
+            next(_auto_paginate(_page_at, pages_in_flight=0))
+
+    def test_max_items_does_not_fetch_unneeded_pages(self) -> None:
+        offsets: list = []
+
+        def fetch(offset: int) -> SyncPage[int]:
+            offsets.append(offset)
+            return _page_at(offset)
+
+        assert list(_auto_paginate(fetch, max_items=3)) == [0, 1, 2]
+        assert offsets == [0]
+
+    def test_prefetch_errors_surface_to_the_consumer(self) -> None:
+        def fetch(offset: int) -> SyncPage[int]:
+            if offset:
+                raise RuntimeError("boom")
+            return _page_at(offset)
+
+        items = _auto_paginate(fetch)
+        assert [next(items) for _ in range(3)] == [0, 1, 2]
+        with pytest.raises(RuntimeError, match="boom"):
+            next(items)
+
+    async def test_async_yields_all_items_and_prefetches(self) -> None:
+        offsets: list = []
+
+        async def fetch(offset: int) -> SyncPage[int]:
+            offsets.append(offset)
+            return _page_at(offset)
+
+        items = _auto_paginate_async(fetch)
+        assert await items.__anext__() == 0
+        await asyncio.sleep(0)
+        assert offsets == [0, 3, 6]
+        assert [item async for item in items] == ITEMS[1:]
+
+    async def test_async_one_page_in_flight_fetches_serially(self) -> None:
+        offsets: list = []
+
+        async def fetch(offset: int) -> SyncPage[int]:
+            offsets.append(offset)
+            return _page_at(offset)
+
+        items = _auto_paginate_async(fetch, pages_in_flight=1)
+        assert await items.__anext__() == 0
+        await asyncio.sleep(0)
+        assert offsets == [0]
+        assert [item async for item in items] == ITEMS[1:]
+        assert offsets == [0, 3, 6]
+
+    async def test_async_close_cancels_pending_prefetch(self) -> None:
+        started = asyncio.Event()
+
+        async def fetch(offset: int) -> SyncPage[int]:
+            if offset:
+                started.set()
+                await asyncio.sleep(10)
+            return _page_at(offset)
+
+        items = _auto_paginate_async(fetch)
+        assert await items.__anext__() == 0
+        await started.wait()
+        await asyncio.wait_for(items.aclose(), 1)
+
+
+class TestCollectAll:
+    def test_collects_every_page(self) -> None:
+        assert _collect_all(_page_at) == ITEMS
+
+    def test_truncates_to_max_items_without_extra_fetches(self) -> None:
+        offsets: list = []
+
+        def fetch(offset: int) -> SyncPage[int]:
+            offsets.append(offset)
+            return _page_at(offset)
+
+        assert _collect_all(fetch, max_items=4) == [0, 1, 2, 3]
+        assert sorted(offsets) == [0, 3]
+
+    async def test_async_collects_every_page(self) -> None:
+        async def fetch(offset: int) -> SyncPage[int]:
+            return _page_at(offset)
+
+        assert await _collect_all_async(fetch) == ITEMS
+        assert await _collect_all_async(fetch, max_items=5) == ITEMS[:5]
@@ -0,0 +1,92 @@
+"""Tests for response helpers."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import httpx
+import pytest
+
+from propheseer import APIResponse, RateLimitInfo
+from propheseer._response import (
+    _parse_list_response,
+    _parse_obj_response,
+    parse_rate_limit_headers,
+)
+
+
+class TestParseRateLimitHeaders:
+    def test_returns_none_without_plan_header(self) -> None:
+        assert parse_rate_limit_headers(httpx.Headers({"x-other": "1"})) is None
+
+    def test_parses_subscription_headers(self) -> None:
+        headers = httpx.Headers(
+            {
+                "X-RateLimit-Plan": "pro",
+                "X-RateLimit-Limit-Day": "10000",
+                "X-RateLimit-Remaining-Day": "9999",
+                "X-RateLimit-Limit-Minute": "100",
+                "X-RateLimit-Remaining-Minute": "99",
+                "X-Credit-Balance-Cents": "500",
+            }
+        )
+        assert parse_rate_limit_headers(headers) == RateLimitInfo(
+            plan="pro",
+            limit_day=10000,
+            remaining_day=9999,
+            limit_minute=100,
+            remaining_minute=99,
+        )
+
+    def test_parses_credit_headers(self) -> None:
+        headers = httpx.Headers(
+            {
+                "x-ratelimit-plan": "payg",
+                "x-billing-type": "credits",
+                "x-credit-balance-cents": "1234",
+                "x-credit-balance": "$12.34",
+                "x-request-cost-cents": "2",
+                "x-request-cost": "$0.02",
+                "x-ratelimit-limit-day": "10000",
+            }
+        )
+        assert parse_rate_limit_headers(headers) == RateLimitInfo(
+            plan="payg",
+            billing_type="credits",
+            credit_balance_cents=1234,
+            credit_balance="$12.34",
+            request_cost_cents=2,
+            request_cost="$0.02",
+        )
+
+    def test_result_is_frozen_and_hashable(self) -> None:
+        info = parse_rate_limit_headers(httpx.Headers({"x-ratelimit-plan": "pro"}))
+        assert info is not None
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.plan = "free"  # type: ignore[misc]
+        assert hash(info) == hash(RateLimitInfo(plan="pro"))
+
+
+class TestParseResponseHelpers:
+    def test_parse_list_response(self) -> None:
+        response = httpx.Response(200)
+        result = _parse_list_response(
+            {"data": [{"n": 1}, {"n": 2}]}, None, response, lambda d: d["n"]
+        )
+        assert result == APIResponse(data=[1, 2], http_response=response)
+
+    def test_parse_list_response_without_data(self) -> None:
+        result = _parse_list_response({}, None, httpx.Response(200), dict)
+        assert result.data == []
+
+    def test_parse_obj_response(self) -> None:
+        info = RateLimitInfo(plan="pro")
+        result = _parse_obj_response(
+            {"data": {"n": 1}}, info, httpx.Response(200), lambda d: d["n"]
+        )
+        assert result.data == 1
+        assert result.rate_limit is info
+
+    def test_parse_list_response_with_null_data(self) -> None:
+        result = _parse_list_response({"data": None}, None, httpx.Response(200), dict)
+        assert result.data == []
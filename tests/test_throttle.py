@@ -0,0 +1,76 @@
+"""Tests for client-side request pacing."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from propheseer import RateLimitInfo
+from propheseer._throttle import TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list:
+    now = [1000.0]
+    monkeypatch.setattr("propheseer._throttle.time.monotonic", lambda: now[0])
+    return now
+
+
+class TestTokenBucket:
+    def test_disabled_until_limits_are_known(self) -> None:
+        bucket = TokenBucket()
+        assert bucket.reserve() == 0.0
+        bucket.update(RateLimitInfo(plan="payg", billing_type="credits"))
+        assert bucket.reserve() == 0.0
+
+    def test_spends_remaining_tokens_without_waiting(self, clock: list) -> None:
+        bucket = TokenBucket()
+        bucket.update(RateLimitInfo(plan="pro", limit_minute=60, remaining_minute=2))
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+
+    def test_waits_for_refill_when_empty(self, clock: list) -> None:
+        bucket = TokenBucket()
+        bucket.update(RateLimitInfo(plan="pro", limit_minute=60, remaining_minute=0))
+        assert bucket.reserve() == pytest.approx(1.0)
+        assert bucket.reserve() == pytest.approx(2.0)
+
+    def test_refills_over_time(self, clock: list) -> None:
+        bucket = TokenBucket()
+        bucket.update(RateLimitInfo(plan="pro", limit_minute=60, remaining_minute=0))
+        clock[0] += 1.0
+        assert bucket.reserve() == 0.0
+
+    def test_update_keeps_outstanding_reservations(self, clock: list) -> None:
+        bucket = TokenBucket()
+        info = RateLimitInfo(plan="pro", limit_minute=60, remaining_minute=0)
+        bucket.update(info)
+        assert bucket.reserve() == pytest.approx(1.0)
+        # A response lands while that reservation is still waiting.
+        bucket.update(info)
+        assert bucket.reserve() == pytest.approx(2.0)
+
+    def test_update_lowers_balance_to_server_count(self, clock: list) -> None:
+        bucket = TokenBucket()
+        bucket.update(RateLimitInfo(plan="pro", limit_minute=60, remaining_minute=5))
+        bucket.update(RateLimitInfo(plan="pro", limit_minute=60, remaining_minute=0))
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_concurrent_reservations_get_distinct_slots(self, clock: list) -> None:
+        bucket = TokenBucket()
+        info = RateLimitInfo(plan="pro", limit_minute=60, remaining_minute=0)
+        bucket.update(info)
+        barrier = threading.Barrier(8)
+
+        def reserve_then_update() -> float:
+            barrier.wait()
+            wait = bucket.reserve()
+            bucket.update(info)
+            return wait
+
+        with ThreadPoolExecutor(8) as pool:
+            waits = list(pool.map(lambda _: reserve_then_update(), range(8)))
+
+        assert sorted(waits) == pytest.approx(list(range(1, 9)))
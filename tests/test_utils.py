@@ -0,0 +1,16 @@
+"""Tests for shared resource helpers."""
+
+from __future__ import annotations
+
+from propheseer._utils import build_query
+
+
+def test_build_query_drops_unset_filters_and_keeps_falsy_values() -> None:
+    assert build_query(source="kalshi", q=None, limit=0, offset=None) == {
+        "source": "kalshi",
+        "limit": 0,
+    }
+
+
+def test_build_query_with_nothing_set_is_empty() -> None:
+    assert build_query(source=None) == {}
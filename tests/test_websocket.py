@@ -0,0 +1,269 @@
+"""Tests for the WebSocket clients."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Iterator, List
+
+import pytest
+
+from propheseer import VERSION, AsyncPropheseerWebSocket, PropheseerWebSocket
+from propheseer._websocket import (
+    _LIST_SUBS_FRAME,
+    _PING_FRAME,
+    _encode,
+    _build_ws_url,
+    _is_json_object,
+    _normalize_ws_url,
+    _reconnect_delay,
+)
+
+
+class FakeSyncConnection:
+    def __init__(self) -> None:
+        self.sent: List[Any] = []
+
+    def send(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+    def close(self) -> None:
+        pass
+
+
+class FakeAsyncConnection:
+    def __init__(self) -> None:
+        self.sent: List[Any] = []
+
+    async def send(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+    async def close(self) -> None:
+        pass
+
+
+SNAPSHOT_FRAGMENTS = ['{"type":"market_snapshot",', '"market":{"id":"pm_1"}}']
+
+
+@pytest.fixture
+def ws_server() -> Iterator[str]:
+    """A local server that greets each client and answers
+    ``list_subscriptions`` with a snapshot sent in fragments."""
+    server_module = pytest.importorskip("websockets.sync.server")
+
+    def handler(connection: Any) -> None:
+        connection.send(json.dumps({"type": "connected", "sessionId": "s_1"}))
+        for raw in connection:
+            if json.loads(raw)["type"] == "list_subscriptions":
+                connection.send(SNAPSHOT_FRAGMENTS)
+
+    with server_module.serve(handler, "127.0.0.1", 0) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        host, port = server.socket.getsockname()[:2]
+        yield f"ws://{host}:{port}"
+        server.shutdown()
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ('{"type": "connected"}', True),
+        (b'{"type": "connected"}', True),
+        ("pong", False),
+        (b"", False),
+        ("", False),
+    ],
+)
+def test_is_json_object(raw: Any, expected: bool) -> None:
+    assert _is_json_object(raw) is expected
+
+
+def test_constant_frames_match_their_encoding() -> None:
+    assert _PING_FRAME == _encode({"type": "ping"})
+    assert _LIST_SUBS_FRAME == _encode({"type": "list_subscriptions"})
+
+
+@pytest.mark.parametrize(
+    "base,expected",
+    [
+        ("http://localhost:3000/", "ws://localhost:3000"),
+        ("https://api.propheseer.com", "wss://api.propheseer.com"),
+        ("wss://api.propheseer.com//", "wss://api.propheseer.com"),
+    ],
+)
+def test_normalize_ws_url(base: str, expected: str) -> None:
+    assert _normalize_ws_url(base) == expected
+
+
+def test_build_ws_url_quotes_api_key() -> None:
+    assert (
+        _build_ws_url("wss://example.com", "a/b+c")
+        == "wss://example.com/ws?api_key=a%2Fb%2Bc"
+    )
+
+
+@pytest.mark.parametrize(
+    "attempt,base", [(1, 1.0), (2, 2.0), (5, 16.0), (6, 30.0), (50, 30.0)]
+)
+def test_reconnect_delay(attempt: int, base: float) -> None:
+    for _ in range(20):
+        assert base <= _reconnect_delay(attempt) <= base * 1.25
+
+
+class TestEventEmitter:
+    def test_on_off_and_emit_in_registration_order(self) -> None:
+        ws = PropheseerWebSocket(api_key="pk_test_123")
+        calls: List[str] = []
+
+        def first(msg: Any) -> None:
+            calls.append("first")
+
+        def second(msg: Any) -> None:
+            calls.append("second")
+
+        ws.on("market_update", first)
+        ws.on("market_update", second)
+        ws._emit("market_update", {})
+        ws.off("market_update", first)
+        ws.off("market_update", first)
+        ws._emit("market_update", {})
+
+        assert calls == ["first", "second", "second"]
+
+    def test_listener_can_remove_itself_while_emitting(self) -> None:
+        ws = PropheseerWebSocket(api_key="pk_test_123")
+        calls: List[Any] = []
+
+        def once(msg: Any) -> None:
+            calls.append(msg)
+            ws.off("error", once)
+
+        ws.on("error", once)
+        ws._emit("error", "a")
+        ws._emit("error", "b")
+
+        assert calls == ["a"]
+
+
+class TestPropheseerWebSocket:
+    def test_builds_url_and_headers_once(self) -> None:
+        ws = PropheseerWebSocket(
+            api_key="pk/test+1", base_url="https://stream.example.com/"
+        )
+        assert ws._url == "wss://stream.example.com/ws?api_key=pk%2Ftest%2B1"
+        assert ws._headers == {"User-Agent": f"propheseer-python/{VERSION}"}
+
+    def test_close_stops_blocking_receive_loop(self, ws_server: str) -> None:
+        ws = PropheseerWebSocket(
+            api_key="pk_test_123", base_url=ws_server, reconnect=False
+        )
+        connected = threading.Event()
+        ws.on("connected", lambda msg: connected.set())
+
+        ws.connect(timeout=5)
+        assert connected.wait(5)
+        ws.close()
+
+        assert ws._thread is not None
+        ws._thread.join(timeout=5)
+        assert not ws._thread.is_alive()
+
+    def test_forwards_snapshot_fragments(self, ws_server: str) -> None:
+        ws = PropheseerWebSocket(
+            api_key="pk_test_123", base_url=ws_server, reconnect=False
+        )
+        fragments: List[Any] = []
+        snapshot = threading.Event()
+        ws.on("market_snapshot_fragment", fragments.append)
+        ws.on("market_snapshot", lambda msg: snapshot.set())
+
+        ws.connect(timeout=5)
+        ws.list_subscriptions()
+        ws.flush()
+        assert snapshot.wait(5)
+        ws.close()
+
+        assert fragments == SNAPSHOT_FRAGMENTS
+
+    def test_coalesces_consecutive_subscriptions(self) -> None:
+        ws = PropheseerWebSocket(api_key="pk_test_123")
+        conn = FakeSyncConnection()
+        ws._ws = conn
+
+        ws.subscribe(["pm_1"])
+        ws.subscribe(["pm_2", "pm_3"])
+        ws.unsubscribe(["pm_1"])
+        ws.flush()
+
+        assert conn.sent == [
+            {"type": "subscribe", "markets": ["pm_1", "pm_2", "pm_3"]},
+            {"type": "unsubscribe", "markets": ["pm_1"]},
+        ]
+
+    def test_flushes_buffer_after_delay(self) -> None:
+        ws = PropheseerWebSocket(api_key="pk_test_123")
+        conn = FakeSyncConnection()
+        ws._ws = conn
+
+        ws.subscribe(["pm_1"])
+        deadline = time.monotonic() + 2
+        while not conn.sent and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        assert conn.sent == [{"type": "subscribe", "markets": ["pm_1"]}]
+
+
+class TestAsyncPropheseerWebSocket:
+    async def test_coalesces_consecutive_subscriptions(self) -> None:
+        ws = AsyncPropheseerWebSocket(api_key="pk_test_123")
+        conn = FakeAsyncConnection()
+        ws._ws = conn
+        ws._start_writer()
+
+        ws.subscribe(["pm_1"])
+        ws.subscribe(["pm_2"])
+        ws.list_subscriptions()
+        await ws.flush()
+
+        assert conn.sent == [
+            {"type": "subscribe", "markets": ["pm_1", "pm_2"]},
+            {"type": "list_subscriptions"},
+        ]
+
+    async def test_writer_sends_messages_in_order(self) -> None:
+        ws = AsyncPropheseerWebSocket(api_key="pk_test_123")
+        conn = FakeAsyncConnection()
+        ws._ws = conn
+        ws._start_writer()
+
+        for i in range(5):
+            ws._send_nowait({"type": "ping", "n": i})
+        await ws.flush()
+
+        assert [m["n"] for m in conn.sent] == [0, 1, 2, 3, 4]
+        await ws.close()
+        assert ws._writer_task is None
+
+    async def test_forwards_snapshot_fragments(self, ws_server: str) -> None:
+        ws = AsyncPropheseerWebSocket(
+            api_key="pk_test_123", base_url=ws_server, reconnect=False
+        )
+        fragments: List[Any] = []
+        snapshots: List[Any] = []
+        ws.on("market_snapshot_fragment", fragments.append)
+        ws.on("market_snapshot", snapshots.append)
+
+        await ws.connect()
+        ws.list_subscriptions()
+        await ws.flush()
+        for _ in range(100):
+            if snapshots:
+                break
+            await asyncio.sleep(0.01)
+        await ws.close()
+
+        assert fragments == SNAPSHOT_FRAGMENTS
+        assert snapshots == [{"type": "market_snapshot", "market": {"id": "pm_1"}}]